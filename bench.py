@@ -0,0 +1,45 @@
+import argparse, sys
+from benchmarks.harness import *
+
+"""
+Offline benchmark of the full episode pipeline, using local stand-ins for
+the news feed, llama.cpp, MaskGCT, Docker and R2. See benchmarks/harness.py.
+
+    python bench.py --stories 1,3,5 --words 150,600
+    python bench.py --save-baseline before
+    python bench.py --compare before
+    python bench.py --startup
+"""
+
+def int_list(value):
+    return [int(v) for v in value.split(",")]
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline benchmark.")
+    parser.add_argument("--stories", type=int_list, default=[1, 3, 5], help="Comma separated story counts")
+    parser.add_argument("--words", type=int_list, default=[150, 600], help="Comma separated news segment lengths (words)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case, the median is reported")
+    parser.add_argument("--llm-ms-per-token", type=float, default=LLM_MS_PER_TOKEN, help="Fake LLM latency per generated token")
+    parser.add_argument("--tts-ms-per-char", type=float, default=TTS_MS_PER_CHAR, help="Fake TTS latency per input character")
+    parser.add_argument("--startup", action="store_true", help="Measure module import and CLI startup time instead")
+    parser.add_argument("--save-baseline", metavar="NAME", help="Save results as a named baseline")
+    parser.add_argument("--compare", metavar="NAME", help="Compare results against a named baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown (fraction) reported as a regression")
+    args = parser.parse_args()
+
+    if args.startup:
+        results = measure_startup(repeat=max(args.repeat, 5))
+        print_startup(results)
+    else:
+        results = run_suite(
+            args.stories, args.words, args.repeat,
+            llm_ms_per_token=args.llm_ms_per_token,
+            tts_ms_per_char=args.tts_ms_per_char
+        )
+        print_results(results)
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+    if args.compare and compare_baseline(results, args.compare, args.threshold):
+        sys.exit(1)
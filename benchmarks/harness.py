@@ -0,0 +1,277 @@
+import glob, json, os, shutil, statistics, subprocess, sys, tempfile, time, wave
+import numpy as np
+
+import config as c
+from benchmarks.standins import FixtureServer, FakeLLMServer, FakeTTSClient, InProcessS3, NoopDockerClient
+
+"""
+Offline end-to-end benchmark of create_episode, with every external service
+replaced by a local stand-in (see benchmarks.standins). Each case runs the
+full pipeline in a fresh temporary directory and reports per-stage and
+end-to-end timings, read from the Chrome trace written by the run.
+Results can be saved as a named baseline and compared against later runs.
+"""
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# Prompt prefixes the fake LLM uses to tell segment requests from summaries
+SUMMARY_MARKER = "BENCH SUMMARY: "
+SEGMENT_MARKER = "BENCH SEGMENT: "
+
+# Default stand-in latencies
+LLM_MS_PER_TOKEN = 2.0
+LLM_PROMPT_MS_PER_TOKEN = 0.05
+TTS_MS_PER_CHAR = 1.0
+SUMMARY_WORDS = 80
+ARTICLE_WORDS = 600
+
+# Slowdowns smaller than this (s) are ignored when comparing against a baseline
+MIN_REGRESSION_S = 0.05
+
+# Modules timed by measure_startup(), in import order
+STARTUP_MODULES = ["config", "utils.podcast", "utils.scheduler"]
+
+def _write_tone_wav(path, seconds, sample_rate, channels, frequency):
+    """Write a quiet 16-bit sine tone WAV."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = (np.sin(2 * np.pi * frequency * t) * 0.2 * 32767).astype("<i2")
+    with wave.open(path, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(np.repeat(tone[:, None], channels, axis=1).tobytes())
+
+def configure(work_dir, llm_url, rss_url, bucket_url):
+    """Point the pipeline configuration at the stand-ins and a temporary work directory."""
+    for sub_dir in ("assets", "voices", "beds"):
+        os.makedirs(os.path.join(work_dir, sub_dir), exist_ok=True)
+
+    settings = {
+        "RSS_NEWS_FEED": rss_url,
+        "LLAMA_CPP_BASE_URL": llm_url,
+        "LLAMA_CPP_API_KEY": "bench",
+        "MASKGCT_BASE_URL": "http://127.0.0.1:0",
+        "MASKGCT_TIMESTEPS": "25",
+        "MASKGCT_VOICES_DIR": os.path.join(work_dir, "voices"),
+        "BG_TRACKS_DIR": os.path.join(work_dir, "beds"),
+        "PODCAST_ASSETS_DIRECTORY": os.path.join(work_dir, "assets"),
+        "PODCAST_CLOUD_REPO": bucket_url,
+        "PODCAST_RSS_FILENAME": "bench.xml",
+        "PODCAST_TITLE": "Benchmark",
+        "PODCAST_DESCRIPTION": "Offline benchmark feed",
+        "PODCAST_MAIN_IMAGE_URL": "/main.jpg",
+        "R2_BUCKET_NAME": "bench",
+        "R2_REGION": "auto",
+        "R2_ACCESS_KEY": "bench",
+        "R2_SECRET_KEY": "bench",
+        "CLOUDFLARE_ACCOUNT_ID": "bench",
+        "CONTAINER_LLM": "bench-llm",
+        "CONTAINER_TTS": "bench-tts",
+        "BOOT_WAIT_LLM": "0",
+        "BOOT_WAIT_TTS": "0",
+        "EXCLUDED_CONTAINERS": [],
+        "SUMMARY_CHARACTER": SUMMARY_MARKER,
+        "NEWS_SEGMENT_FULL": SEGMENT_MARKER
+    }
+    for key, value in settings.items():
+        setattr(c, key, value)
+
+    _write_tone_wav(os.path.join(work_dir, "voices", "voice.wav"), 3, 24000, 1, 220)
+    _write_tone_wav(os.path.join(work_dir, "beds", "bed.wav"), 30, 44100, 2, 110)
+
+def install_standins(work_dir, bucket):
+    """Swap the service clients used by utils modules for the stand-ins."""
+    import utils.cloud, utils.container_management, utils.duration, utils.mixer, utils.pipeline, utils.tts, utils.voice_prep
+    utils.container_management._client = NoopDockerClient()
+    utils.tts.connect_tts = FakeTTSClient
+    FakeTTSClient.output_dir = os.path.join(work_dir, "gradio")
+    utils.cloud._s3 = bucket
+    utils.cloud.MANIFEST_PATH = os.path.join(work_dir, "bucket_manifest.json")
+    utils.cloud._manifest = None
+    utils.mixer.BED_CACHE_DIR = os.path.join(work_dir, "bed_cache")
+    utils.pipeline.EPISODES_WORK_DIR = os.path.join(work_dir, "episodes")
+    utils.duration.CALIBRATION_PATH = os.path.join(work_dir, "voice_durations.json")
+    utils.duration._calibration = None
+    utils.voice_prep.VOICE_CACHE_DIR = os.path.join(work_dir, "voice_cache")
+    utils.voice_prep.LATENCY_PATH = os.path.join(work_dir, "voice_latency.json")
+    utils.voice_prep._latency = None
+
+def run_case(n_stories, segment_words, llm_ms_per_token=LLM_MS_PER_TOKEN, tts_ms_per_char=TTS_MS_PER_CHAR):
+    """
+    Run the full episode pipeline once against fresh stand-ins.
+
+    Args:
+        n_stories (int): Number of news stories.
+        segment_words (int): Length of the generated news segment (words).
+    Optional:
+        llm_ms_per_token (float): Fake LLM latency per generated token (ms).
+        tts_ms_per_char (float): Fake TTS latency per input character (ms).
+
+    Returns:
+        dict: "stages" (s per stage), "total" (s), "audio_s" (episode length)
+            and "throughput" (stories/s, words/s and audio realtime factors).
+    """
+    work_dir = tempfile.mkdtemp(prefix="personapod_bench_")
+    bucket = InProcessS3(os.path.join(work_dir, "bucket"))
+    fixtures = FixtureServer(n_stories, ARTICLE_WORDS, bucket).start()
+    llm = FakeLLMServer(llm_ms_per_token, SUMMARY_WORDS, segment_words, SEGMENT_MARKER, LLM_PROMPT_MS_PER_TOKEN).start()
+    FakeTTSClient.ms_per_char = tts_ms_per_char
+
+    try:
+        configure(work_dir, llm.api_url, fixtures.rss_url, fixtures.base_url + "/bucket")
+        c.TOP_N_STORIES = str(n_stories)
+        install_standins(work_dir, bucket)
+
+        from utils.podcast import create_episode
+        start = time.perf_counter()
+        create_episode("You are a benchmark news host.", "voice.wav", "/episode.jpg", "Benchmark", "bed.wav", 2000, 2)
+        total = time.perf_counter() - start
+
+        trace_path = glob.glob(os.path.join(work_dir, "episodes", "*", "trace-*.json"))[0]
+        with open(trace_path, "r", encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        stages = {e["name"]: e["dur"] / 1e6 for e in events if e.get("cat") == "stage"}
+
+        state_path = glob.glob(os.path.join(work_dir, "episodes", "*", "state.json"))[0]
+        with open(state_path, "r", encoding="utf-8") as f:
+            audio_s = json.load(f)["stages"]["mix"]["duration"]
+    finally:
+        fixtures.stop()
+        llm.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    throughput = {
+        "fetch_stories_per_s": n_stories / stages["fetch"],
+        "summarize_stories_per_s": n_stories / stages["summarize"],
+        "segment_words_per_s": segment_words / stages["segment"],
+        "synthesize_words_per_s": segment_words / stages["synthesize"],
+        "mix_realtime_x": audio_s / stages["mix"],
+        "encode_realtime_x": audio_s / stages["encode"],
+        "end_to_end_realtime_x": audio_s / total
+    }
+    return {"stages": stages, "total": total, "audio_s": audio_s, "throughput": throughput}
+
+def run_suite(story_counts, segment_lengths, repeat=1, **latencies):
+    """
+    Run every combination of story count and segment length.
+    With repeat > 1, the median of each timing is reported.
+
+    Returns:
+        dict: Case name (e.g. "stories=3 words=600") -> run_case() result.
+    """
+    results = {}
+    for n_stories in story_counts:
+        for segment_words in segment_lengths:
+            name = f"stories={n_stories} words={segment_words}"
+            print(f"\n===== BENCHMARK: {name} =====")
+            runs = [run_case(n_stories, segment_words, **latencies) for _ in range(repeat)]
+            results[name] = {
+                "stages": {stage: statistics.median(run["stages"][stage] for run in runs) for stage in runs[0]["stages"]},
+                "total": statistics.median(run["total"] for run in runs),
+                "audio_s": runs[0]["audio_s"],
+                "throughput": {key: statistics.median(run["throughput"][key] for run in runs) for key in runs[0]["throughput"]}
+            }
+    return results
+
+def print_results(results):
+    """Print per-stage timings and throughput for each case."""
+    for name, result in results.items():
+        print(f"\n{name} (episode {result['audio_s']}s, end to end {result['total']:.2f}s)")
+        print("  " + ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in result["stages"].items()))
+        print("  " + ", ".join(f"{key}={value:.1f}" for key, value in result["throughput"].items()))
+
+def save_baseline(results, name):
+    """Save results as a named baseline in BASELINES_DIR."""
+    os.makedirs(BASELINES_DIR, exist_ok=True)
+    baseline_path = os.path.join(BASELINES_DIR, f"{name}.json")
+    with open(baseline_path, "w", encoding="utf-8") as f:
+        json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+    print(f"\nBaseline saved: {baseline_path}")
+
+def compare_baseline(results, name, threshold=0.10):
+    """
+    Compare results against a named baseline, flagging stages and totals that
+    are more than threshold (fraction) and MIN_REGRESSION_S slower.
+
+    Returns:
+        int: Number of regressions found.
+    """
+    with open(os.path.join(BASELINES_DIR, f"{name}.json"), "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = 0
+    print(f"\nComparison against baseline '{name}':")
+    for case, result in results.items():
+        if case not in baseline:
+            print(f"{case}: not in baseline")
+            continue
+        timings = dict(result["stages"], total=result["total"])
+        baseline_timings = dict(baseline[case]["stages"], total=baseline[case]["total"])
+        print(case)
+        for stage, seconds in timings.items():
+            before = baseline_timings.get(stage)
+            if before is None:
+                continue
+            change = (seconds - before) / before if before else 0.0
+            regression = change > threshold and seconds - before > MIN_REGRESSION_S
+            regressions += regression
+            print(f"  {stage:<16}{before:8.2f}s -> {seconds:8.2f}s  {change:+7.1%}" + ("  REGRESSION" if regression else ""))
+    return regressions
+
+def measure_startup(modules=STARTUP_MODULES, repeat=5):
+    """
+    Measure import time of pipeline modules and CLI startup time, each in a
+    fresh interpreter. Modules are imported in order, so each time shows what
+    that module adds. No services or settings are needed.
+
+    Args:
+        modules (list[str]): Modules to import.
+        repeat (int): Runs per measurement, the median is reported.
+
+    Returns:
+        dict: {"startup": result} with the import time (s) of each module as
+            "stages" and the "main.py --help" run time (s) as "total", so the
+            result can be saved and compared like run_suite() results.
+    """
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=repo_dir)
+    script = (
+        "import json, time\n"
+        "times = {}\n"
+        + "".join(f"t = time.perf_counter(); import {m}; times['{m}'] = time.perf_counter() - t\n" for m in modules)
+        + "print(json.dumps(times))"
+    )
+
+    # Run from an empty directory, like a fresh checkout without .env
+    with tempfile.TemporaryDirectory() as run_dir:
+        runs = []
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, "-c", script], cwd=run_dir, env=env, check=True, capture_output=True, text=True).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+        cli_runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(repo_dir, "main.py"), "--help"], cwd=run_dir, env=env, check=True, capture_output=True)
+            cli_runs.append(time.perf_counter() - start)
+
+        # Slowest imports, by cumulative time, from the interpreter's own import profiler
+        profile = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"], cwd=run_dir, env=env, check=True, capture_output=True, text=True).stderr
+
+    cumulative = []
+    for line in profile.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative_us, name = line[len("import time:"):].split("|")
+            cumulative.append((int(cumulative_us) / 1e6, name.strip()))
+    print("\nSlowest imports (cumulative):")
+    for seconds, name in sorted(cumulative, reverse=True)[:10]:
+        print(f"{seconds:8.3f}s  {name}")
+
+    stages = {m: statistics.median(run[m] for run in runs) for m in modules}
+    total = statistics.median(cli_runs)
+    return {"startup": {"stages": stages, "total": total, "audio_s": 0, "throughput": {}}}
+
+def print_startup(results):
+    """Print import and CLI startup times measured by measure_startup()."""
+    result = results["startup"]
+    print("\nImport time: " + ", ".join(f"{m}={seconds:.3f}s" for m, seconds in result["stages"].items()))
+    print(f"CLI startup (main.py --help): {result['total']:.3f}s")
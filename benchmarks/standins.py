@@ -0,0 +1,327 @@
+import json, os, queue, re, shutil, threading, time, wave
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+import numpy as np
+from botocore.exceptions import ClientError
+
+"""
+Local stand-ins for the services used by the episode pipeline, so the whole
+pipeline can run offline with repeatable timings:
+    FixtureServer: RSS news feed, articles, and public reads of the bucket.
+    FakeLLMServer: OpenAI-compatible chat completions with a fixed token latency.
+    FakeTTSClient: MaskGCT Gradio client returning synthetic speech WAVs.
+    InProcessS3: The subset of the boto3 S3 client used by utils.cloud.
+    NoopDockerClient: Docker client where containers start and stop instantly.
+"""
+
+# Filler text used for articles, summaries and news segments
+FILLER_WORDS = (
+    "the council met on tuesday to discuss a new plan for the city transit network "
+    "officials said the proposal would add service to several neighborhoods and "
+    "reduce wait times for riders while critics questioned the cost of the project"
+).split()
+
+def filler_text(n_words, sentence_words=15):
+    """Deterministic filler text of n_words words, in sentences of sentence_words words."""
+    words = [FILLER_WORDS[i % len(FILLER_WORDS)] for i in range(n_words)]
+    sentences = [" ".join(words[i:i + sentence_words]) for i in range(0, n_words, sentence_words)]
+    return " ".join(sentence[0].upper() + sentence[1:] + "." for sentence in sentences)
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    """Request handler without per-request logging."""
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+class _BackgroundServer():
+    """HTTP server on a free local port, served from a daemon thread."""
+    def __init__(self, handler):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class FixtureServer(_BackgroundServer):
+    """
+    Serves a news RSS feed at /rss.xml with n_stories items, article pages at
+    /article/<n> with article_words words each, and objects stored in an
+    InProcessS3 bucket at /bucket/<key>, with their stored HTTP headers.
+    """
+    def __init__(self, n_stories, article_words, bucket=None):
+        server = self
+
+        class Handler(_QuietHandler):
+            def do_GET(self):
+                if self.path == "/rss.xml":
+                    self.send_body(200, server.rss_feed(), "application/rss+xml")
+                elif self.path.startswith("/article/"):
+                    self.send_body(200, server.article(self.path.rsplit("/", 1)[1]), "text/html; charset=utf-8")
+                elif self.path.startswith("/bucket/") and server.bucket:
+                    obj = server.bucket.get_object_file(self.path[len("/bucket/"):])
+                    if obj is None:
+                        self.send_body(404, b"", "text/plain")
+                    else:
+                        path, headers = obj
+                        with open(path, "rb") as f:
+                            self.send_body(200, f.read(), headers.pop("Content-Type", "application/octet-stream"), headers)
+                else:
+                    self.send_body(404, b"", "text/plain")
+
+        super().__init__(Handler)
+        self.n_stories = n_stories
+        self.article_words = article_words
+        self.bucket = bucket
+        self.rss_url = self.base_url + "/rss.xml"
+
+    def rss_feed(self):
+        items = "".join(
+            f"<item><title>Story {n}</title><link>{self.base_url}/article/{n}</link></item>"
+            for n in range(self.n_stories)
+        )
+        return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Fixture news</title>{items}</channel></rss>'.encode()
+
+    def article(self, n):
+        paragraphs = "".join(f"<p>{escape(filler_text(self.article_words // 5))}</p>" for _ in range(5))
+        html = (
+            f"<!DOCTYPE html><html><head><title>Story {n}</title></head><body>"
+            f"<article><h1>Story {n}</h1>{paragraphs}</article></body></html>"
+        )
+        return html.encode()
+
+class FakeLLMServer(_BackgroundServer):
+    """
+    OpenAI-compatible /v1/chat/completions endpoint. Replies take
+    prompt_ms_per_token per prompt token plus ms_per_token per generated token,
+    with one token counted per word. Requests whose user message starts with
+    segment_marker get segment_words words, all others get summary_words words.
+    """
+    def __init__(self, ms_per_token, summary_words, segment_words, segment_marker, prompt_ms_per_token=0.0):
+        server = self
+
+        class Handler(_QuietHandler):
+            def do_POST(self):
+                if not self.path.endswith("/chat/completions"):
+                    self.send_body(404, b"", "text/plain")
+                    return
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                self.send_body(200, server.complete(request), "application/json")
+
+        super().__init__(Handler)
+        self.ms_per_token = ms_per_token
+        self.prompt_ms_per_token = prompt_ms_per_token
+        self.summary_words = summary_words
+        self.segment_words = segment_words
+        self.segment_marker = segment_marker
+        self.api_url = self.base_url + "/v1"
+
+    def complete(self, request):
+        prompt = request["messages"][-1]["content"]
+        prompt_tokens = sum(len(message["content"].split()) for message in request["messages"])
+        n_words = self.segment_words if prompt.startswith(self.segment_marker) else self.summary_words
+        time.sleep((prompt_tokens * self.prompt_ms_per_token + n_words * self.ms_per_token) / 1000)
+
+        completion = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "bench",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": filler_text(n_words)},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": n_words, "total_tokens": prompt_tokens + n_words}
+        }
+        return json.dumps(completion).encode()
+
+class FakeTTSClient():
+    """
+    Stand-in for gradio_client.Client connected to MaskGCT. predict() sleeps
+    for ms_per_char per input character and returns a synthetic speech WAV,
+    with chars_per_second of audio per input character, like the real /inference.
+    """
+    ms_per_char = 5.0
+    chars_per_second = 15.0
+    sample_rate = 24000
+    output_dir = None
+
+    def __init__(self, src, *args, **kwargs):
+        self.src = src
+
+    def predict(self, prompt_wav=None, target_text="", target_len=-1, n_timesteps=25, api_name="/inference"):
+        if api_name != "/inference":
+            raise ValueError(f"Unknown endpoint: {api_name}")
+        time.sleep(len(target_text) * self.ms_per_char / 1000)
+
+        frames = int(self.sample_rate * max(0.5, len(target_text) / self.chars_per_second))
+        t = np.arange(frames) / self.sample_rate
+        # Syllable-rate amplitude envelope on a voice-range tone, with short silences at each end
+        speech = np.sin(2 * np.pi * 180 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)) * 0.3
+        pad = np.zeros(self.sample_rate // 5)
+        samples = (np.concatenate((pad, speech, pad)) * 32767).astype("<i2")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        output_wav = os.path.join(self.output_dir, f"chunk_{threading.get_ident()}_{time.perf_counter_ns()}.wav")
+        with wave.open(output_wav, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(self.sample_rate)
+            w.writeframes(samples.tobytes())
+        return output_wav
+
+class _Paginator():
+    """list_objects_v2 paginator over an InProcessS3 bucket."""
+    def __init__(self, bucket, page_size=1000):
+        self.bucket = bucket
+        self.page_size = page_size
+
+    def paginate(self, Bucket):
+        keys = sorted(self.bucket.objects)
+        for start in range(0, max(1, len(keys)), self.page_size):
+            yield {"Contents": [self.bucket.list_entry(key) for key in keys[start:start + self.page_size]]}
+
+class InProcessS3():
+    """
+    Subset of the boto3 S3 client used by utils.cloud, storing objects in a
+    local directory. Uploads are plain file copies.
+    """
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self.objects = {}
+        self.lock = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None, Config=None):
+        extra_args = ExtraArgs or {}
+        path = os.path.join(self.root_dir, re.sub(r"[^\w.\-]", "_", Key))
+        shutil.copyfile(Filename, path)
+        size = os.path.getsize(path)
+        # Multipart ETags end in the part count, as on S3
+        parts = f"-{-(-size // Config.multipart_chunksize)}" if Config and size >= Config.multipart_threshold else ""
+        with self.lock:
+            self.objects[Key] = {
+                "path": path,
+                "size": size,
+                "etag": f"{size:x}{time.perf_counter_ns():x}{parts}",
+                "mtime": datetime.now(timezone.utc),
+                "metadata": dict(extra_args.get("Metadata", {})),
+                "headers": {
+                    header: extra_args[arg]
+                    for arg, header in (("ContentType", "Content-Type"), ("ContentEncoding", "Content-Encoding"), ("CacheControl", "Cache-Control"))
+                    if arg in extra_args
+                }
+            }
+
+    def head_object(self, Bucket, Key):
+        obj = self.objects.get(Key)
+        if obj is None:
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+        return {"ContentLength": obj["size"], "ETag": f'"{obj["etag"]}"', "Metadata": obj["metadata"]}
+
+    def get_paginator(self, operation_name):
+        if operation_name != "list_objects_v2":
+            raise ValueError(f"Unsupported paginator: {operation_name}")
+        return _Paginator(self)
+
+    def list_entry(self, key):
+        obj = self.objects[key]
+        return {"Key": key, "Size": obj["size"], "ETag": f'"{obj["etag"]}"', "LastModified": obj["mtime"]}
+
+    def get_object_file(self, key):
+        """Local path and HTTP headers of a stored object, or None if missing."""
+        obj = self.objects.get(key)
+        if obj is None:
+            return None
+        return obj["path"], dict(obj["headers"], ETag=f'"{obj["etag"]}"')
+
+class _NoopContainer():
+    def __init__(self, name, client):
+        self.name = name
+        self.id = f"{name}-id"
+        self.status = "exited"
+        self.attrs = {"Config": {}}
+        self.client = client
+
+    def start(self):
+        self.status = "running"
+        self.client.emit(self, "start")
+
+    def stop(self):
+        self.kill()
+
+    def kill(self, signal="SIGKILL"):
+        self.status = "exited"
+        self.client.emit(self, "die")
+
+    def wait(self):
+        return {"StatusCode": 0}
+
+    def stats(self, stream=False, one_shot=None):
+        return {
+            "memory_stats": {"usage": 512 * 2**20, "stats": {"inactive_file": 0}},
+            "cpu_stats": {"cpu_usage": {"total_usage": time.perf_counter_ns()}, "system_cpu_usage": 4 * time.perf_counter_ns(), "online_cpus": 4}
+        }
+
+class _NoopContainers():
+    def __init__(self, client):
+        self.by_name = {}
+        self.client = client
+
+    def get(self, name):
+        return self.by_name.setdefault(name, _NoopContainer(name, self.client))
+
+    def list(self):
+        return [container for container in self.by_name.values() if container.status == "running"]
+
+class _NoopEventStream():
+    """Docker events stream, fed by NoopDockerClient.emit() until closed."""
+    def __init__(self, actions):
+        self.actions = actions
+        self.events = queue.Queue()
+
+    def __iter__(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self):
+        self.events.put(None)
+
+class NoopDockerClient():
+    """Docker client stand-in where containers start and stop instantly."""
+    def __init__(self):
+        self.containers = _NoopContainers(self)
+        self.streams = []
+        self.lock = threading.Lock()
+
+    def events(self, decode=True, filters=None):
+        stream = _NoopEventStream((filters or {}).get("event", []))
+        with self.lock:
+            self.streams.append(stream)
+        return stream
+
+    def emit(self, container, action):
+        event = {"Type": "container", "Action": action, "Actor": {"ID": container.id, "Attributes": {"name": container.name}}}
+        with self.lock:
+            for stream in self.streams:
+                if action.split(":")[0] in stream.actions:
+                    stream.events.put(event)
@@ -5,12 +5,19 @@ from dotenv import dotenv_values
 # Load constants from .env
 env_vars = dotenv_values(".env")
 
+# Paths to prompt files, by variable name. Prompts are read on first access
+_prompt_paths = {}
+
+def is_prompt_path(value):
+    # A relative path to a file in the prompts directory
+    return isinstance(value, str) and (value.startswith("./prompts") or value.startswith("prompts")) and os.path.exists(value)
+
 # Parse system prompts and lists
 def parse_value(key, value):
     # Handle system prompts
     # If string starts with a relative path to the prompts directory,
     #  return the full contents of the text, including special characters
-    if isinstance(value, str) and (value.startswith("./prompts") or value.startswith("prompts")) and os.path.exists(value):
+    if is_prompt_path(value):
         with open(value, "r", encoding="utf-8") as f:
             return f.read()
 
@@ -27,5 +34,17 @@ def parse_value(key, value):
     return value
 
 # 3. Inject processed variables into global scope
+# Prompt files are not read until a prompt is used, see __getattr__()
 for key, value in env_vars.items():
-    globals()[key] = parse_value(key, value)
\ No newline at end of file
+    if is_prompt_path(value):
+        _prompt_paths[key] = value
+    else:
+        globals()[key] = parse_value(key, value)
+
+def __getattr__(name):
+    # Read a prompt file on first access and keep its contents
+    if name in _prompt_paths:
+        value = parse_value(name, _prompt_paths[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+import argparse, signal
 import config as c
 from utils.podcast import create_episode
 
@@ -8,7 +9,9 @@ utils.podcast.create_episode(
     character_system_prompt,
     character_voice_ref, 
     episode_image, title, 
-    bg_track=None, tts_start_delay_ms=None, fade_duration_s=None)
+    bg_track=None, tts_start_delay_ms=None, fade_duration_s=None,
+    preview=False, preview_chunks=3, episode_id=None,
+    target_duration_s=None, chapters=None, publish=True)
 
 Creates a new podcast episode from scratch and uploads it to the cloud.
 Podcast RSS feed is pulled and updated with an entry for the new episode.
@@ -23,12 +26,94 @@ Optional:
     bg_track (str): Path to podcast episode background track.
     tts_start_delay_ms (int): Delay (ms) to play background track before voice starts.
     fade_duration_s (int): Fade out duration (s) for background track, applied after voice track ends.
+    preview (bool): Render a fast, low quality draft of the first few TTS chunks without uploading.
+        Returns measured preview timings and estimated timings for a full render.
+    preview_chunks (int): Number of TTS chunks to render in preview mode.
+    episode_id (str): Resume an earlier run. Completed stages are skipped.
+    target_duration_s (int): Target episode length (s), default EPISODE_TARGET_SECONDS. The news segment
+        is trimmed or rewritten toward it before TTS, using spoken lengths predicted for the voice.
+    chapters (bool): Render the intro, each story and the outro as chapters, default CHAPTER_MODE.
+    publish (bool): Publish the episode. When False, the run stops after encoding.
+
+Each run prints its episode ID and saves stage outputs to ./cache/episodes/<episode-id>.
+Resume a failed run from the command line:
+
+    python main.py --resume <episode-id>
+
+Build a chapter mode episode without publishing it, fix a story by editing its text in
+segment_parts.json in the work directory, re-render only the changed chapters, then publish:
+
+    python main.py --chapters --hold
+    python main.py --rerender <episode-id>
+    python main.py --resume <episode-id>
+
+Run as a daemon that builds episodes on the EPISODE_SCHEDULE schedule (see utils.scheduler),
+and print the daemon's job status and last-run timings:
+
+    python main.py --daemon
+    python main.py --status
+
+Build and publish many episodes in one run, e.g. a persona's archive, from a JSON list of
+(date, persona, article set) jobs (see utils.backfill). LLM and TTS work for all episodes
+share one container start each, and the RSS feed is updated once:
+
+    python main.py --backfill <jobs.json>
+
+Intermediate WAVs and cached parts are removed after each run under the retention
+policy in utils.artifacts (ARTIFACT_MAX_AGE_DAYS, ARTIFACT_MAX_TOTAL_MB). Run it on its own:
+
+    python main.py --gc
 """
 
 if __name__ == "__main__":
 
+    parser = argparse.ArgumentParser(description="Create a new podcast episode.")
+    parser.add_argument("--resume", metavar="EPISODE_ID", help="Resume a failed run, skipping completed stages")
+    parser.add_argument("--daemon", action="store_true", help="Stay resident and build episodes on the EPISODE_SCHEDULE schedule")
+    parser.add_argument("--status", action="store_true", help="Print the status of a running daemon")
+    parser.add_argument("--gc", action="store_true", help="Remove old episode intermediates under the retention policy")
+    parser.add_argument("--backfill", metavar="JOBS_FILE", help="Build and publish a batch of episodes from a JSON jobs file")
+    parser.add_argument("--chapters", action="store_true", help="Render the intro, each story and the outro as chapters")
+    parser.add_argument("--hold", action="store_true", help="Build the episode without publishing it")
+    parser.add_argument("--rerender", metavar="EPISODE_ID", help="Re-render the edited chapters of an unpublished episode, without publishing it")
+    args = parser.parse_args()
+
+    if args.status:
+        from utils.scheduler import STATUS_PATH
+        with open(STATUS_PATH, "r", encoding="utf-8") as f:
+            print(f.read())
+        raise SystemExit
+
+    if args.gc:
+        from utils.artifacts import collect_garbage
+        collect_garbage()
+        raise SystemExit
+
+    if args.daemon:
+        from utils.scheduler import EpisodeScheduler, load_schedule
+        scheduler = EpisodeScheduler(load_schedule())
+        signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            scheduler.stop()
+        raise SystemExit
+
+    if args.backfill:
+        from utils.backfill import load_backfill_jobs, run_backfill
+        run_backfill(load_backfill_jobs(args.backfill))
+        raise SystemExit
+
+    if args.rerender:
+        from utils.podcast import rerender_episode
+        rerender_episode(args.rerender)
+        raise SystemExit
+
     create_episode(
         c.SYSTEM_CHARACTER_KMART_RADIO, 
         c.MASKGCT_VOICE_REF_KMART_RADIO, 
         c.PODCAST_EPISODE_IMAGE_URL_KMART_RADIO, "Kmart Radio News", 
-        c.BG_TRACK_KMART_RADIO, 12000, 5)
\ No newline at end of file
+        c.BG_TRACK_KMART_RADIO, 12000, 5,
+        episode_id=args.resume,
+        chapters=True if args.chapters else None,
+        publish=not args.hold)
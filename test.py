@@ -1,10 +1,14 @@
 import config as c
 from tests.test_news import *
 from tests.test_cloud import *
+from tests.test_feed_store import *
 from tests.test_container_management import *
 from tests.test_llm import *
 from tests.test_tts import *
+from tests.test_audio import *
 from tests.test_podcast import *
+from tests.test_pipeline import *
+from tests.test_scheduler import *
 
 if __name__ == "__main__":
 
@@ -17,16 +21,30 @@ if __name__ == "__main__":
     c.RSS_NEWS_FEED = "https://www.state.gov/rss-feed/press-releases/feed/"
     test_rss_feed(c.RSS_NEWS_FEED, int(c.TOP_N_STORIES))
 
+    # Test story ranking: diverse picks, recently covered stories ranked down
+    test_story_ranking()
+
     print("\n----- TEST CLOUD FUNCTIONALITY -----")
     # Test podcast cloud repo: list files, upload test file
     test_list_cloud_files()
     test_upload_to_cloud("README.md")
+    test_upload_files_to_cloud(["README.md", "LICENSE"])
+    test_object_in_cloud("README.md")
+
+    # Test local episode store and streamed feed output
+    test_feed_store("test_feed.xml")
+    test_feed_chapters()
+    test_backdated_archive_pages()
 
     print("\n----- TEST CONTAINER MANAGEMENT -----")
     # Test Docker container management, cycling from LLM to TTS container
     test_contianer_cycling(c.CONTAINER_LLM, int(c.BOOT_WAIT_LLM), c.CONTAINER_TTS, int(c.BOOT_WAIT_TTS), c.EXCLUDED_CONTAINERS)
 
     print("\n----- TEST LLM -----")
+    # Test reasoning removal and news segment checks, no LLM needed
+    test_strip_reasoning()
+    test_segment_check()
+
     # Test news segment generation with LLM
     news_segment_build_mode = "concurrent"  # concurrent OR iterative
     news_segment = test_news_segment_generation(c.SYSTEM_CHARACTER_KMART_RADIO, news_segment_build_mode)
@@ -35,7 +53,15 @@ if __name__ == "__main__":
     # Test TTS chunking, generation, and merging of long texts
     long_text = news_segment
     test_tts_chunk(long_text)
+    test_tts_empty_input()
+    test_tts_assembly_cleanup()
+    test_duration_prediction(long_text)
+    test_voice_prep()
     tts_output_file = test_tts_merge(long_text, c.MASKGCT_VOICE_REF_KMART_RADIO)
+    test_trim_and_normalize(tts_output_file)
+
+    # Test header-based WAV and MP3 durations
+    test_get_duration()
 
     print("\n----- TEST PODCAST BUILD -----")
     # Test adding background track to TTS WAV file
@@ -45,4 +71,32 @@ if __name__ == "__main__":
     final_podcast_file = test_add_bg_track(tts_output_file, background_track, tts_start_delay_ms, fade_duration_s)
 
     test_get_audio_duration(final_podcast_file)
-    test_mp3_conversion(final_podcast_file)
\ No newline at end of file
+    test_mp3_conversion(final_podcast_file)
+
+    # Test background mix and loudness normalization into a master WAV, then MP3 encoding
+    test_render_episode(tts_output_file, background_track, tts_start_delay_ms, fade_duration_s)
+
+    # Test parallel rendition encoding
+    test_encode_renditions()
+
+    # Test mixing at the output sample rate
+    test_mix_sample_rate()
+
+    # Test joining chapter parts and encoding chapter markers
+    test_chapters()
+
+    # Test resuming a failed staged run
+    test_resume_stages()
+
+    # Test resource sampling tagged by stage
+    test_resource_sampler()
+
+    # Test artifact placement and retention
+    test_artifact_gc()
+
+    # Test loading backfill jobs
+    test_backfill_jobs()
+
+    # Test daemon cron schedules and the full job queue
+    test_cron_schedule()
+    test_job_queue_full()
@@ -0,0 +1,41 @@
+from utils.audio import *
+
+"""
+    Tests for in-process audio post-processing of TTS output
+"""
+
+# Trim silence and normalize a WAV file, printing duration and level changes
+def test_trim_and_normalize(input_wav):
+
+    samples, framerate = read_wav(input_wav)
+    trimmed = trim_silence(samples, framerate)
+    normalized = normalize_level(trimmed)
+
+    print(f"Duration: {len(samples) / framerate:.2f}s -> {len(trimmed) / framerate:.2f}s (trimmed)")
+    print(f"Peak level: {np.max(np.abs(trimmed)):.3f} -> {np.max(np.abs(normalized)):.3f} (normalized)")
+
+# Read header-based durations of a WAV, a VBR MP3 (Xing header) and an MP3 without
+# a summary header (frame scan), and compare them with the known length
+def test_get_duration():
+    import subprocess, tempfile
+
+    root = tempfile.mkdtemp()
+    input_wav = os.path.join(root, "tone.wav")
+    tone = 0.1 * np.sin(2 * np.pi * 440 * np.arange(44100 * 3) / 44100).reshape(-1, 1)
+    with wave.open(input_wav, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(to_pcm_bytes(tone))
+
+    vbr_mp3 = os.path.join(root, "vbr.mp3")
+    scan_mp3 = os.path.join(root, "scan.mp3")
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-i", input_wav, "-c:a", "libmp3lame", "-q:a", "2", vbr_mp3], check=True)
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-i", input_wav, "-c:a", "libmp3lame", "-b:a", "128k", "-write_xing", "0", scan_mp3], check=True)
+
+    for input_audio in (input_wav, vbr_mp3, scan_mp3):
+        duration = get_duration(input_audio)
+        print(f"({duration:.3f} seconds) {input_audio}")
+        # MP3 adds up to about two frames of encoder delay and padding
+        assert abs(duration - 3.0) < 0.06, f"Duration off: {input_audio}"
+    assert wav_duration(input_wav) == 3.0
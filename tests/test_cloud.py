@@ -15,4 +15,21 @@ def test_list_cloud_files():
 
 # Upload a local file to podcast cloud repo
 def test_upload_to_cloud(local_file_path):
-    upload_to_s3(local_file_path)
\ No newline at end of file
+    upload_to_s3(local_file_path)
+# Upload several local files concurrently, run twice to check identical files are skipped
+def test_upload_files_to_cloud(local_file_paths):
+    for attempt in range(2):
+        urls = upload_files_to_s3(local_file_paths)
+        print(f"Attempt {attempt + 1}: {urls}")
+
+    # The manifest keeps the ETag of the uploaded object
+    manifest = load_bucket_manifest()
+    for file_path in local_file_paths:
+        object_key = os.path.basename(file_path)
+        etag = get_s3_client().head_object(Bucket=c.R2_BUCKET_NAME, Key=object_key)["ETag"].strip('"')
+        print(f"{object_key} ETag: {manifest[object_key]['etag']}")
+        assert manifest[object_key]["etag"] == etag, "Manifest ETag does not match the bucket"
+
+# Check whether a file exists in the podcast cloud repo, using the local bucket manifest
+def test_object_in_cloud(object_key):
+    print(f"{object_key} in cloud repo: {object_in_bucket(object_key)}")
@@ -0,0 +1,116 @@
+from utils.feed_store import *
+
+"""
+    Tests for the local episode store behind the podcast RSS feed
+"""
+
+# Print the newest episodes in the local store and write the feed to a local file
+def test_feed_store(output_path, newest_n=5):
+
+    print(f"Episodes in store: {episode_count()}")
+    for episode in iter_episodes(limit=newest_n):
+        print(f"{episode['title']} ({episode['duration']}s): {episode['enclosure_url']}")
+
+    write_feed(output_path)
+    print(f"Feed written: {output_path}")
+
+# Use a temporary assets directory and podcast settings, restoring the real settings afterwards
+def _with_test_store(test):
+    import tempfile
+    import config as c
+    settings = {
+        "PODCAST_ASSETS_DIRECTORY": tempfile.mkdtemp(),
+        "PODCAST_TITLE": "Test Podcast",
+        "PODCAST_DESCRIPTION": "Test episodes",
+        "PODCAST_CLOUD_REPO": "https://example.com",
+        "PODCAST_MAIN_IMAGE_URL": "/main.jpg"
+    }
+    saved = {key: vars(c).get(key) for key in settings}
+    vars(c).update(settings)
+    try:
+        test(settings["PODCAST_ASSETS_DIRECTORY"])
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                vars(c).pop(key, None)
+            else:
+                vars(c)[key] = value
+
+# Store an episode with JSON chapters in a store created before chapters were published,
+# and check the feed links the chapters and reads them back
+def test_feed_chapters():
+    import sqlite3
+    import xml.etree.ElementTree as ET
+
+    def test(assets_dir):
+        # Store without the chapters_url column
+        connection = sqlite3.connect(os.path.join(assets_dir, FEED_DB_FILENAME))
+        connection.execute(
+            "CREATE TABLE episodes (guid TEXT PRIMARY KEY, title TEXT NOT NULL, link TEXT, duration INTEGER, image TEXT,"
+            " pub_ts REAL NOT NULL, enclosure_url TEXT NOT NULL, enclosure_type TEXT NOT NULL, enclosure_length INTEGER, alternates TEXT)"
+        )
+        connection.execute("INSERT INTO episodes VALUES ('https://example.com/old.mp3', 'Old', 'https://example.com/old.mp3', 60, NULL, 1.0, 'https://example.com/old.mp3', 'audio/mpeg', 1000, NULL)")
+        connection.commit()
+        connection.close()
+
+        add_episode("https://example.com/new.mp3", "New", 90, None, 2.0, "https://example.com/new.mp3", "audio/mpeg", 2000,
+                    chapters_url="https://example.com/new chapters.json")
+        feed_path = os.path.join(assets_dir, "feed.xml")
+        write_feed(feed_path)
+
+        items = ET.parse(feed_path).findall(".//item")
+        chapters = [item.find(f"{{{PODCAST_NAMESPACE}}}chapters") for item in items]
+        print(f'Chapters links: {[link.attrib if link is not None else None for link in chapters]}')
+        assert chapters[0].get("url") == "https://example.com/new chapters.json" and chapters[0].get("type") == CHAPTERS_TYPE
+        assert chapters[1] is None, "Episode without chapters links chapters"
+
+        # Reconciled feeds keep the chapters link
+        os.remove(os.path.join(assets_dir, FEED_DB_FILENAME))
+        import_feed_items(ET.parse(feed_path))
+        assert next(iter_episodes(limit=1))["chapters_url"] == "https://example.com/new chapters.json"
+
+    _with_test_store(test)
+
+# Write full archive pages, add back-dated episodes, and check that every page from the
+# first moved episode on is rewritten with the right chronological slice of episodes
+def test_backdated_archive_pages():
+    import xml.etree.ElementTree as ET
+
+    def test(assets_dir):
+        def add(title, pub_ts):
+            url = f"https://example.com/{title}.mp3"
+            add_episode(url, title, 60, None, pub_ts, url, "audio/mpeg", 1000)
+
+        def check(written):
+            archived = [episode["title"] for episode in iter_episodes()][:1:-1]
+            for page in range(1, (len(archived) + 1) // 2 + 1):
+                page_path = os.path.join(assets_dir, archive_filename("feed.xml", page))
+                page_titles = sorted(item.findtext("title") for item in ET.parse(page_path).findall(".//item"))
+                assert page_titles == sorted(archived[(page - 1) * 2:page * 2]), f"Archive page {page} out of date: {page_titles}"
+            return sorted(os.path.basename(path) for path, _ in written[1:])
+
+        # 10 episodes: 2 in the main feed, 4 full archive pages
+        for n in range(1, 11):
+            add(f"e{n * 10}", n * 10.0)
+        check(write_feed_pages(assets_dir, "feed.xml", "https://example.com", window=2))
+        written = check(write_feed_pages(assets_dir, "feed.xml", "https://example.com", window=2))
+        print(f"Pages written without changes: {written}")
+        assert written == ["feed-archive-3.xml", "feed-archive-4.xml"]
+
+        # Back-dated into page 2: pages 2 to 4 move, and page 5 is new
+        add("e35", 35.0)
+        written = check(write_feed_pages(assets_dir, "feed.xml", "https://example.com", window=2))
+        print(f"Pages written after an episode in page 2: {written}")
+        assert written == [archive_filename("feed.xml", page) for page in range(2, 6)]
+
+        # Back-dated into page 1: every page moves
+        add("e15", 15.0)
+        written = check(write_feed_pages(assets_dir, "feed.xml", "https://example.com", window=2))
+        print(f"Pages written after an episode in page 1: {written}")
+        assert written == [archive_filename("feed.xml", page) for page in range(1, 6)]
+
+        # The JSON index tracks its own changes
+        json_pages = write_json_index_pages(assets_dir, "feed.json", page_size=2)
+        assert len(json_pages) == 6, "JSON index pages not all written"
+
+    _with_test_store(test)
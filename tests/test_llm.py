@@ -48,4 +48,53 @@ def test_news_segment_generation(character_system_prompt, build_mode):
         raise ValueError(f"Invalid build mode: {build_mode}. Supported values: {valid_build_modes}")
     
     print("Generated news segment:\n" + news_segment)
-    return news_segment
\ No newline at end of file
+    return news_segment
+def test_strip_reasoning():
+    cases = {
+        "<think>Plan the reply.</think>\nHello there.": "Hello there.",
+        "<THINK >Plan</ think>Hello there.": "Hello there.",
+        "Plan the reply, the opening tag was in the template.</think>\n\nHello there.": "Hello there.",
+        "Hello there.<think>Wait, maybe I should": "Hello there.",
+        "<thinking>Plan</thinking>Hello <think>again</think>there.": "Hello there."
+    }
+    for text, expected in cases.items():
+        result = strip_reasoning(text)
+        print(f'{text!r} -> {result!r}')
+        assert result == expected, f"Expected {expected!r}"
+
+def test_segment_check():
+    from utils.segment_check import clean_news_segment, check_news_segment
+
+    good = " ".join(["The council approved a new transit plan on Tuesday."] * 10)
+    assert check_news_segment(good, 2) == [], check_news_segment(good, 2)
+
+    cleaned = clean_news_segment("## Top stories\n\n- **Transit:** " + good)
+    print(f'Cleaned: {cleaned[:60]}...')
+    assert check_news_segment(cleaned, 2) == [], check_news_segment(cleaned, 2)
+
+    bad_segments = {
+        "leaked tags": good + " <|im_end|>",
+        "too short": "Short segment.",
+        "truncated": good + " And in other news the",
+        "characters": good + " 新闻 🎉" * 20
+    }
+    for name, text in bad_segments.items():
+        problems = check_news_segment(clean_news_segment(text), 2)
+        print(f'{name}: {problems}')
+        assert problems, f"Check missed: {name}"
+
+    # Common symbols are spelled out, and a few unsupported characters only warn
+    symbols = {
+        "It was 40°F in Chicago.": "It was 40 degrees Fahrenheit in Chicago.",
+        "The #MeToo movement grew.": "The hashtag MeToo movement grew.",
+        "The report [updated] was late.": "The report (updated) was late.",
+        "Tickets cost ¥500.": "Tickets cost 500 yen.",
+        "Note that 5 * 2 = 10.": "Note that 5 times 2 equals 10."
+    }
+    for text, expected in symbols.items():
+        cleaned = clean_news_segment(text)
+        print(f'{text!r} -> {cleaned!r}')
+        assert cleaned == expected, f"Expected {expected!r}"
+        assert check_news_segment(clean_news_segment(good + " " + text), 2) == [], f"Segment with {text!r} failed"
+    assert check_news_segment(good + " The mayor of Αθήνα spoke.", 2) == [], "Proper noun in another script failed"
+    assert check_news_segment(clean_news_segment(good + " <|im_end|> [INST]"), 2), "Leaked tags hidden by cleanup"
@@ -49,4 +49,25 @@ def test_rss_feed(rss_link, top_n_stories, headers=None):
         print(f'NewsStory title: {story.title}')
         print(f'NewsStory link: {story.link}')
         print(f'NewsStory content:\n{story.content}')
-        print()
\ No newline at end of file
+        print()
+def test_story_ranking():
+    from utils.ranking import rank_candidates
+
+    candidates = [
+        {"title": "Council approves new transit plan", "description": "The city council approved a plan to expand bus and rail service."},
+        {"title": "City council passes transit expansion plan", "description": "Council members voted to expand bus and rail service across the city."},
+        {"title": "Storm brings flooding to coastal towns", "description": "Heavy rain flooded roads and homes along the coast overnight."},
+        {"title": "Local team wins championship", "description": ""},
+        {"title": "Drought hits farmers in the valley", "description": "Farmers report failing crops after months without rain in the valley."}
+    ]
+    recent_titles = ["Storm floods coastal towns after heavy rain"]
+
+    order = rank_candidates(candidates, recent_titles)
+    for rank, n in enumerate(order):
+        print(f'{rank + 1}. {candidates[n]["title"]}')
+
+    assert sorted(order) == list(range(len(candidates)))
+    # The near-duplicate transit story should not be picked right after the first
+    assert {order[0], order[1]} != {0, 1}, "Near-duplicate stories ranked together"
+    # The recently covered storm story should rank below the new stories
+    assert order.index(2) > order.index(4), "Recently covered story not ranked down"
@@ -0,0 +1,146 @@
+from utils.pipeline import *
+
+"""
+    Tests for the stage engine behind create_episode
+"""
+
+# Run two stages where the second fails once, then resume and check only the failed stage reruns
+def test_resume_stages():
+
+    runs = []
+    failures = [RuntimeError("Simulated stage failure")]
+
+    def first(state):
+        runs.append("first")
+        return {"value": 1}
+
+    def second(state):
+        runs.append("second")
+        if failures:
+            raise failures.pop()
+        return {"value": state["stages"]["first"]["value"] + 1}
+
+    stages = [("first", first), ("second", second)]
+    state = new_episode_state("test-" + new_episode_id(), {})
+    try:
+        run_stages(state, stages)
+    except RuntimeError as e:
+        print(f"Stage failed: {e}")
+
+    state = load_episode_state(state["episode_id"])
+    run_stages(state, stages)
+    print(f"Stage runs: {runs}, outputs: {state['stages']}")
+    print(f"Work dir: {state['work_dir']}")
+
+# Sample resources while a stage allocates memory, and check the peak is tagged with that stage
+def test_resource_sampler():
+    import csv, tempfile, time
+    import numpy as np
+    from utils.resources import ResourceSampler, print_resource_summary, process_rss_bytes
+
+    output_csv = os.path.join(tempfile.mkdtemp(), "resources.csv")
+    sampler = ResourceSampler(output_csv, containers=[], interval_s=0.05).start()
+
+    def allocate_stage(state):
+        buffer = np.ones(64 * 2**20 // 8)  # 64 MB
+        time.sleep(0.3)
+        return {"sum": float(buffer.sum())}
+
+    state = {"episode_id": "resources-test", "work_dir": os.path.dirname(output_csv), "params": {}, "stages": {}}
+    run_stages(state, [("idle", lambda state: time.sleep(0.2) or {}), ("allocate", allocate_stage)])
+    peaks = sampler.stop()
+    print_resource_summary(peaks)
+
+    with open(output_csv, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    print(f'Samples: {len(rows)}, stages: {sorted({row["stage"] for row in rows})}')
+    assert {"idle", "allocate"} <= {row["stage"] for row in rows}, "Samples not tagged with stages"
+    if process_rss_bytes() is not None:
+        assert peaks["process"]["memory_stage"] == "allocate", "Peak memory not tagged with the allocating stage"
+
+# Place a file without copying, then remove old intermediates and check the affected stages are rebuilt on resume
+def test_artifact_gc():
+    import tempfile, time
+    import utils.mixer, utils.pipeline, utils.voice_prep
+    from utils.artifacts import place_file, track_artifact, collect_garbage
+
+    root = tempfile.mkdtemp()
+    utils.pipeline.EPISODES_WORK_DIR = os.path.join(root, "episodes")
+    utils.mixer.BED_CACHE_DIR = os.path.join(root, "beds")
+    utils.voice_prep.VOICE_CACHE_DIR = os.path.join(root, "voices")
+
+    # An old cached background track and prepared voice reference, and a recently used voice
+    cached = {}
+    for name, age_days in (("beds/old_44100.npy", 30), ("voices/old-voice.wav", 30), ("voices/used-voice.wav", 1)):
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"\0" * 2**10)
+        os.utime(path, (time.time() - age_days * 86400,) * 2)
+        cached[name] = path
+
+    def make_episode(episode_id, age_days, published):
+        state = new_episode_state(episode_id, {})
+        tts_wav = os.path.join(state["work_dir"], "tts_output.wav")
+        mp3 = os.path.join(state["work_dir"], "episode.mp3")
+        for path in (tts_wav, mp3):
+            with open(path, "wb") as f:
+                f.write(b"\0" * 2**20)
+            os.utime(path, (time.time() - age_days * 86400,) * 2)
+        track_artifact(state, tts_wav, "intermediate")
+        track_artifact(state, mp3, "output")
+        state["stages"] = {"segment": {}, "synthesize": {"tts_wav": tts_wav}, "encode": {"mp3": mp3}}
+        if published:
+            state["stages"]["publish"] = {}
+        save_episode_state(state)
+        return state
+
+    old = make_episode("20260101-070000", 30, published=False)
+    recent = make_episode("20260301-070000", 1, published=True)
+
+    placed = os.path.join(root, "assets", "episode.mp3")
+    method = place_file(os.path.join(recent["work_dir"], "episode.mp3"), placed)
+    print(f'Placed by {method}')
+    assert method in ("hardlink", "copy") and os.path.exists(placed)
+
+    result = collect_garbage(max_age_days=7, max_total_mb=100)
+    old = load_episode_state(old["episode_id"])
+    print(f'Old episode stages after cleanup: {list(old["stages"])}')
+    assert result["removed"] == 4, result
+    assert not os.path.exists(cached["beds/old_44100.npy"]) and not os.path.exists(cached["voices/old-voice.wav"]), "Old cache entries kept"
+    assert os.path.exists(cached["voices/used-voice.wav"]), "Recently used voice reference removed"
+    assert list(old["stages"]) == ["segment"], "Stages with removed outputs not marked for rebuild"
+    assert os.path.exists(os.path.join(recent["work_dir"], "tts_output.wav")), "Recent intermediate removed"
+
+    # Over the size budget, the oldest remaining files go first. The placed MP3 keeps its data.
+    collect_garbage(max_age_days=7, max_total_mb=0)
+    assert os.path.exists(placed) and os.path.getsize(placed) == 2**20
+
+# Load backfill jobs and check dates, validation and saved article sets
+def test_backfill_jobs():
+    import json, tempfile
+    from utils.backfill import load_backfill_jobs, _fetch_articles
+
+    jobs_path = os.path.join(tempfile.mkdtemp(), "jobs.json")
+    story = {"title": "Test story", "link": "https://example.com/story", "content": "Story text."}
+    with open(jobs_path, "w", encoding="utf-8") as f:
+        json.dump([
+            {"date": "2026-10-12", "persona": "KMART_RADIO", "title": "Kmart Radio News", "articles": [story, dict(story, content="")]},
+            {"date": "2026-10-13T07:00:00+10:00", "persona": "KMART_RADIO", "title": "Kmart Radio News"}
+        ], f)
+
+    jobs = load_backfill_jobs(jobs_path)
+    print(f'Backfill dates: {[job["date"].isoformat() for job in jobs]}')
+    assert jobs[0]["date"].utcoffset().total_seconds() == 0, "Date without offset not read as UTC"
+    assert jobs[1]["date"].utcoffset().total_seconds() == 36000, "Date offset lost"
+
+    articles = _fetch_articles(jobs)
+    assert list(articles) == [0] and [s.title for s in articles[0]] == ["Test story"], "Empty article not skipped"
+
+    with open(jobs_path, "w", encoding="utf-8") as f:
+        json.dump([{"date": "2026-10-12", "title": "No persona"}], f)
+    try:
+        load_backfill_jobs(jobs_path)
+        raise AssertionError("Job without persona accepted")
+    except ValueError as e:
+        print(f"Invalid job rejected: {e}")
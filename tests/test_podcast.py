@@ -5,7 +5,7 @@ from utils.podcast import *
     Tests for final podcast audio creation
 """
 
-# Get the duration of an audio file using ffmpeg
+# Get the duration of an audio file from its header
 def test_get_audio_duration(input_audio):
 
     duration = str(get_audio_duration(input_audio))
@@ -24,4 +24,148 @@ def test_add_bg_track(tts_output_file, background_track, tts_start_delay_ms, fad
 
 # Convert WAV to MP3: supports v0, v2, 192k, & 320k compression
 def test_mp3_conversion(input_audio):
-    mp3_path = wav_to_mp3(input_audio, "v2")
\ No newline at end of file
+    mp3_path = wav_to_mp3(input_audio, "v2")
+
+# Render the episode as the mix and encode stages do: background mix and loudness
+# normalization into a master WAV, then the MP3 encoded from the master
+def test_render_episode(tts_output_file, background_track, tts_start_delay_ms, fade_duration_s):
+
+    master_wav = os.path.join(os.path.dirname(tts_output_file), "master.wav")
+    duration = render_master_wav(tts_output_file, master_wav, background_track, tts_start_delay_ms, fade_duration_s)
+    mp3_path = encode_renditions(master_wav, [{"codec": "mp3", "quality": "v2"}], output_base=os.path.join(os.path.dirname(tts_output_file), "episode"))[0]["path"]
+    os.remove(master_wav)
+    print(f"({duration} seconds) {mp3_path}")
+    return mp3_path
+
+# Encode MP3, Opus and AAC renditions of one source in parallel, checking encoder arguments and output names
+def test_encode_renditions():
+    import tempfile
+    import numpy as np
+    from utils.audio import to_pcm_bytes
+    from utils.encoding import encoder_args, encode_renditions, rendition_path
+
+    assert encoder_args("mp3", "v2") == ["-codec:a", "libmp3lame", "-q:a", "2"]
+    assert encoder_args("mp3", "192k") == ["-codec:a", "libmp3lame", "-b:a", "192k"]
+    assert encoder_args("opus", "48k") == ["-codec:a", "libopus", "-b:a", "48k"]
+    assert encoder_args("aac", "64k") == ["-codec:a", "aac", "-b:a", "64k", "-movflags", "+faststart"]
+    for codec, quality in (("mp3", "v5"), ("opus", "high"), ("flac", "0")):
+        try:
+            encoder_args(codec, quality)
+            raise AssertionError(f"Invalid rendition accepted: {codec} {quality}")
+        except ValueError as e:
+            print(f"Rejected: {e}")
+
+    root = tempfile.mkdtemp()
+    source_wav = os.path.join(root, "master.wav")
+    tone = 0.1 * np.sin(2 * np.pi * 440 * np.arange(44100 * 2) / 44100)
+    with wave.open(source_wav, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(to_pcm_bytes(np.repeat(tone.reshape(-1, 1), 2, axis=1)))
+
+    renditions = [{"codec": "mp3", "quality": "v2"}, {"codec": "opus", "quality": "48k"}, {"codec": "aac", "quality": "64k"}]
+    output_base = os.path.join(root, "episode")
+    results = encode_renditions(source_wav, renditions, output_base=output_base)
+    for result in results:
+        print(f'{result["codec"]} {result["quality"]}: {os.path.basename(result["path"])}, {result["size"]} bytes, {result["mime_type"]}')
+
+    assert [(r["codec"], r["quality"]) for r in results] == [(r["codec"], r["quality"]) for r in renditions], "Renditions out of order"
+    assert [os.path.basename(r["path"]) for r in results] == ["episode_mp3_v2.mp3", "episode_opus_48k.opus", "episode_aac_64k.m4a"]
+    assert results[1]["path"] == os.path.abspath(rendition_path(output_base, "opus", "48k"))
+    assert [r["mime_type"] for r in results] == ["audio/mpeg", "audio/ogg", "audio/mp4"]
+    assert all(r["size"] > 0 for r in results)
+
+# Mix 24 kHz speech over a 44.1 kHz bed and check the mix keeps the output rate and the music's high band
+def test_mix_sample_rate():
+    import tempfile
+    import numpy as np
+    import utils.mixer
+    from utils.audio import to_pcm_bytes
+    from utils.mixer import MIX_SAMPLE_RATE, mix_background
+
+    root = tempfile.mkdtemp()
+    saved = (vars(c).get("BG_TRACKS_DIR"), utils.mixer.BED_CACHE_DIR)
+    c.BG_TRACKS_DIR = root
+    utils.mixer.BED_CACHE_DIR = os.path.join(root, "beds")
+
+    def write_tone(path, seconds, framerate, channels, hz):
+        tone = 0.1 * np.sin(2 * np.pi * hz * np.arange(int(framerate * seconds)) / framerate)
+        with wave.open(path, "wb") as w:
+            w.setnchannels(channels)
+            w.setsampwidth(2)
+            w.setframerate(framerate)
+            w.writeframes(to_pcm_bytes(np.repeat(tone.reshape(-1, 1), channels, axis=1)))
+
+    # 15 kHz music would not survive at the 24 kHz TTS rate
+    write_tone(os.path.join(root, "bed.wav"), 6, 44100, 2, 15000)
+    tts_wav = os.path.join(root, "tts.wav")
+    write_tone(tts_wav, 2, 24000, 1, 220)
+
+    try:
+        sample_rate, total_frames, blocks = mix_background(tts_wav, "bed.wav", 1000, 1)
+        mixed = np.concatenate(list(blocks))
+
+        # Speech cut short (e.g. a truncated TTS file) fails the mix instead of giving a bed-only episode
+        truncated_wav = os.path.join(root, "truncated.wav")
+        with open(tts_wav, "rb") as src, open(truncated_wav, "wb") as dest:
+            dest.write(src.read(os.path.getsize(tts_wav) // 2))
+        try:
+            list(mix_background(truncated_wav, "bed.wav", 1000, 1)[2])
+            raise AssertionError("Truncated speech mixed without an error")
+        except RuntimeError as e:
+            print(f"Truncated speech rejected: {e}")
+    finally:
+        if saved[0] is None:
+            vars(c).pop("BG_TRACKS_DIR", None)
+        else:
+            c.BG_TRACKS_DIR = saved[0]
+        utils.mixer.BED_CACHE_DIR = saved[1]
+    print(f"Mixed {len(mixed)} frames at {sample_rate} Hz")
+    assert sample_rate == MIX_SAMPLE_RATE == 44100, "Mix not at the output rate"
+    assert len(mixed) == total_frames == 44100 * 4, "Mix length does not match the resampled speech"
+
+    spectrum = np.abs(np.fft.rfft(mixed[:44100, 0]))
+    assert np.argmax(spectrum) == 15000, "Background track high band lost"
+    spectrum = np.abs(np.fft.rfft(mixed[44100 * 2:44100 * 3, 0] - mixed[:44100, 0]))
+    assert np.argmax(spectrum) == 220, "Speech missing from the mix"
+
+# Join chapter parts sample accurately and encode an MP3 with chapter markers
+def test_chapters():
+    import tempfile
+    import numpy as np
+    from utils.audio import read_wav, to_pcm_bytes
+    from utils.chapters import part_key, join_part_wavs, shift_chapters, write_ffmetadata
+    from utils.encoding import encode_rendition
+
+    root = tempfile.mkdtemp()
+    part_wavs = []
+    for n, seconds in enumerate((1.0, 2.0, 1.5)):
+        part_wav = os.path.join(root, f"part{n}.wav")
+        tone = 0.1 * np.sin(2 * np.pi * 220 * np.arange(int(24000 * seconds)) / 24000).reshape(-1, 1)
+        with wave.open(part_wav, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(24000)
+            w.writeframes(to_pcm_bytes(tone))
+        part_wavs.append(part_wav)
+
+    assert part_key("Story", "voice.wav", 25) == part_key("Story", "voice.wav", 25)
+    assert part_key("Story", "voice.wav", 25) != part_key("Story.", "voice.wav", 25), "Edited part not re-rendered"
+
+    joined_wav = os.path.join(root, "joined.wav")
+    chapters = join_part_wavs(part_wavs, ["Intro", "Story = one; #1", "Outro"], joined_wav, gap_ms=500)
+    samples, _ = read_wav(joined_wav)
+    print(f"Chapters: {[(chapter['title'], chapter['start_s'], chapter['end_s']) for chapter in chapters]}")
+    assert [chapter["start_s"] for chapter in chapters] == [0.0, 1.5, 4.0]
+    assert len(samples) == 24000 * 5.5, "Joined length is not the sum of parts and gaps"
+
+    chapters = shift_chapters(chapters, 2.0, 8.0)
+    assert chapters[0]["start_s"] == 0.0 and chapters[1]["start_s"] == 3.5 and chapters[-1]["end_s"] == 8.0
+
+    metadata_file = write_ffmetadata(chapters, os.path.join(root, "chapters.ffmetadata"))
+    mp3 = encode_rendition(joined_wav, "mp3", "64k", metadata_file=metadata_file)["path"]
+    with open(mp3, "rb") as f:
+        id3 = f.read(4096)
+    print(f"Chapter frames in MP3: {id3.count(b'CHAP')}")
+    assert id3.count(b"CHAP") == 3, "MP3 is missing chapter frames"
@@ -0,0 +1,62 @@
+from utils.scheduler import *
+
+"""
+    Tests for the cron schedule and job queue of daemon mode
+"""
+
+# Parse cron fields and expressions, and find next run times across weekday, month and leap year boundaries
+def test_cron_schedule():
+
+    fields = {
+        ("*/15", 0, 59): {0, 15, 30, 45},
+        ("0-30/10", 0, 59): {0, 10, 20, 30},
+        ("5/20", 0, 59): {5, 25, 45},
+        ("1-5", 0, 7): {1, 2, 3, 4, 5},
+        ("1,3,5", 1, 12): {1, 3, 5}
+    }
+    for (field, low, high), expected in fields.items():
+        values = parse_cron_field(field, low, high)
+        print(f"{field} -> {sorted(values)}")
+        assert values == expected, f"Expected {sorted(expected)}"
+
+    for expr in ("60 * * * *", "0 7 * *", "0 7 5-1 * *"):
+        try:
+            parse_cron(expr)
+            raise AssertionError(f"Invalid expression accepted: {expr}")
+        except ValueError as e:
+            print(f"Rejected: {e}")
+
+    # Day of week 7 is Sunday, like 0
+    assert parse_cron("0 7 * * 7")[4] == {0} and parse_cron("0 7 * * 5-7")[4] == {0, 5, 6}
+
+    runs = {
+        # Monday 08:00, next Sunday 07:00
+        ("0 7 * * 7", datetime(2026, 10, 19, 8, 0)): datetime(2026, 10, 25, 7, 0),
+        # Every 15 minutes, exclusive of the start time
+        ("*/15 * * * *", datetime(2026, 10, 19, 8, 15)): datetime(2026, 10, 19, 8, 30),
+        # Weekdays at 07:00 from Friday evening
+        ("0 7 * * 1-5", datetime(2026, 10, 23, 18, 0)): datetime(2026, 10, 26, 7, 0),
+        # Feb 29 from a non-leap year
+        ("0 0 29 2 *", datetime(2026, 3, 1, 0, 0)): datetime(2028, 2, 29, 0, 0)
+    }
+    for (expr, after), expected in runs.items():
+        next_run = next_run_time(expr, after)
+        print(f"{expr} after {after}: {next_run}")
+        assert next_run == expected, f"Expected {expected}"
+
+# Queue due jobs until the queue is full, and check that further jobs are skipped and recorded in the status file
+def test_job_queue_full():
+    import tempfile
+
+    status_path = os.path.join(tempfile.mkdtemp(), "daemon_status.json")
+    scheduler = EpisodeScheduler([{"name": "morning", "cron": "0 7 * * *", "persona": "TEST"}], status_path)
+    with scheduler.lock:
+        for _ in range(MAX_QUEUED_JOBS + 1):
+            scheduler._enqueue("morning")
+    scheduler._write_status()
+
+    with open(status_path, "r", encoding="utf-8") as f:
+        status = json.load(f)
+    print(f"Queued: {status['queued']}, last run: {status['jobs']['morning']['last_run']}")
+    assert len(status["queued"]) == scheduler.job_queue.qsize() == MAX_QUEUED_JOBS
+    assert status["jobs"]["morning"]["last_run"]["status"] == "skipped"
@@ -18,6 +18,35 @@ def test_tts_chunk(long_text):
     for chunk in chunks:
         print(chunk + "\n")
 
+# Check that text with nothing to speak is rejected before any TTS call
+def test_tts_empty_input():
+    for input_text, max_chunks in (("", None), ("  \n  ", None), ("Some news.", 0)):
+        try:
+            maskgct_generate_audio("./voices", "missing.wav", 25, input_text, max_chunks=max_chunks)
+            raise AssertionError(f"Empty input accepted: {input_text!r}, max_chunks={max_chunks}")
+        except ValueError as e:
+            print(f"Rejected {input_text!r}, max_chunks={max_chunks}: {e}")
+
+# Fail assembly on a damaged chunk and check that it and the chunks queued after it are removed
+def test_tts_assembly_cleanup():
+    import queue, tempfile
+    from utils.tts import _assemble_chunks
+
+    root = tempfile.mkdtemp()
+    chunk_queue = queue.Queue()
+    chunk_wavs = [os.path.join(root, f"chunk{n}.wav") for n in range(3)]
+    for chunk_wav in chunk_wavs:
+        with open(chunk_wav, "wb") as f:
+            f.write(b"not a wav file")
+        chunk_queue.put((chunk_wav, "Some news."))
+    chunk_queue.put(None)
+
+    assembly = {"error": None, "frames": 0, "framerate": 0, "chunks": []}
+    _assemble_chunks(chunk_queue, os.path.join(root, "output.wav"), assembly)
+    print(f"Assembly error: {assembly['error']}")
+    assert assembly["error"] is not None, "Damaged chunk accepted"
+    assert not any(os.path.exists(chunk_wav) for chunk_wav in chunk_wavs), "Chunk WAVs left after a failure"
+
 # Prints the location of the TTS WAV output file created by chunking a long text 
 # sample, generating audio files for each chunk with TTS model, then merging them
 def test_tts_merge(long_text, voice):
@@ -32,4 +61,63 @@ def test_tts_merge(long_text, voice):
         long_text
     )
 
-    return output_wav
\ No newline at end of file
+    return output_wav
+
+# Predict the spoken length of a text, then calibrate a fake voice from its chunks and check the prediction
+def test_duration_prediction(text):
+    import tempfile
+    import utils.duration
+
+    # Calibrate a fake voice that speaks 2 words per second, with 0.1 s per pause mark
+    utils.duration.CALIBRATION_PATH = os.path.join(tempfile.mkdtemp(), "voice_durations.json")
+    utils.duration._calibration = None
+    chunks = list(get_chunks(text, CHUNK_MAX_CHARS))
+    print(f'Default prediction: {estimate_spoken_seconds(text, "test_voice.wav"):.1f}s')
+
+    actual = [(chunk, len(chunk.split()) / 2 + 0.1 * len(utils.duration.PAUSE_PATTERN.findall(chunk))) for chunk in chunks]
+    record_chunk_durations("test_voice.wav", actual * 10)
+    expected = sum(seconds for _, seconds in actual) + CHUNK_GAP_MS / 1000 * (len(chunks) - 1)
+    predicted = estimate_spoken_seconds(text, "test_voice.wav")
+
+    print(f'Calibrated prediction: {predicted:.1f}s, actual {expected:.1f}s')
+    assert abs(predicted - expected) <= 0.05 * expected, "Calibrated prediction off by more than 5%"
+
+# Prepare a voice reference: resample, trim silence, level and crop, then reuse it from the cache
+def test_voice_prep():
+    import tempfile, wave
+    import numpy as np
+    import utils.voice_prep
+    from utils.audio import read_wav, to_pcm_bytes
+    from utils.voice_prep import prepare_voice_ref, record_chunk_latency, latency_report
+
+    root = tempfile.mkdtemp()
+    utils.voice_prep.VOICE_CACHE_DIR = os.path.join(root, "voices")
+    utils.voice_prep.LATENCY_PATH = os.path.join(root, "voice_latency.json")
+    utils.voice_prep._latency = None
+
+    # 1 s of silence, 15 s of quiet stereo speech-like tone at 44.1 kHz, 1 s of silence
+    t = np.arange(44100 * 15) / 44100
+    speech = 0.02 * np.sin(2 * np.pi * 180 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t))
+    silence = np.zeros(44100)
+    samples = np.repeat(np.concatenate((silence, speech, silence)).reshape(-1, 1), 2, axis=1)
+    source_wav = os.path.join(root, "voice.wav")
+    with wave.open(source_wav, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(to_pcm_bytes(samples))
+
+    prepared = prepare_voice_ref(source_wav, max_seconds=10)
+    samples, framerate = read_wav(prepared["path"])
+    rms_db = 20 * np.log10(np.sqrt(np.mean(np.square(samples))))
+    print(f'Prepared {prepared["source_s"]}s to {prepared["prepared_s"]}s, {framerate} Hz, {samples.shape[1]} channel(s), {rms_db:.1f} dBFS RMS')
+    assert framerate == utils.voice_prep.VOICE_SAMPLE_RATE and samples.shape[1] == 1
+    assert 8.0 <= prepared["prepared_s"] <= 10.0, "Reference not cropped near the limit"
+    assert abs(rms_db - utils.voice_prep.VOICE_TARGET_RMS_DB) < 1.0, "Reference level not normalized"
+    assert prepare_voice_ref(source_wav, max_seconds=10)["cached"], "Prepared reference not reused"
+
+    record_chunk_latency("voice.wav", 25, False, [(200, 4.0)])
+    record_chunk_latency("voice.wav", 25, True, [(100, 1.5), (100, 1.5)])
+    report = latency_report("voice.wav", 25)
+    print(f'Latency report: {report}')
+    assert report["change_pct"] == -25.0
@@ -0,0 +1,170 @@
+import errno, os, shutil, time
+
+import config as c
+import utils.mixer
+import utils.pipeline
+import utils.voice_prep
+from utils.pipeline import load_episode_state, save_episode_state, invalidate_stages
+
+"""
+Episode artifact store. Final outputs are placed with a hardlink, or a rename
+when the source is not needed any more, instead of a copy. A copy is only made
+across filesystems. Large files written by each episode are tracked in its
+state (see track_artifact()) and removed by collect_garbage() under a retention
+policy: files older than ARTIFACT_MAX_AGE_DAYS are removed, then the oldest
+files are removed until all artifacts fit in ARTIFACT_MAX_TOTAL_MB. Cached
+background tracks (utils.mixer.BED_CACHE_DIR) and prepared voice references
+(utils.voice_prep.VOICE_CACHE_DIR) fall under the same policy. Both caches
+mark entries as used when they are reused, and rebuild removed entries.
+Stages of unpublished episodes whose outputs are removed are marked incomplete,
+so a resumed run rebuilds them.
+"""
+ARTIFACT_MAX_AGE_DAYS = 7
+ARTIFACT_MAX_TOTAL_MB = 5000
+
+# Untracked files in episode work directories that are always intermediates,
+# e.g. left by add_background_track() or an interrupted stage
+INTERMEDIATE_EXTENSIONS = (".wav", ".tmp")
+
+# Errors from os.link() that mean a hardlink is not possible here, rather than a failure
+NO_LINK_ERRORS = (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP)
+
+def place_file(
+    src: str,
+    dest: str,
+    move: bool = False
+) -> str:
+    """
+    Place a file at a destination path without copying it where possible.
+    An existing destination is replaced atomically.
+
+    Args:
+        src (str): Source file path.
+        dest (str): Destination file path.
+    Optional:
+        move (bool): Rename the source instead of linking it, when the source is not needed.
+
+    Returns:
+        str: How the file was placed: "rename", "hardlink" or "copy".
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    tmp_path = dest + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    try:
+        if move:
+            os.replace(src, dest)
+            return "rename"
+        os.link(src, tmp_path)
+        os.replace(tmp_path, dest)
+        return "hardlink"
+    except OSError as e:
+        if e.errno not in NO_LINK_ERRORS:
+            raise
+
+    shutil.copy2(src, tmp_path)
+    os.replace(tmp_path, dest)
+    if move:
+        os.remove(src)
+    return "copy"
+
+def track_artifact(
+    state: dict,
+    path: str,
+    kind: str
+):
+    """
+    Record a file written by an episode, so collect_garbage() can remove it later.
+    The state is saved by the stage engine when the stage completes.
+
+    Args:
+        state (dict): Episode state.
+        path (str): File path.
+        kind (str): "intermediate" (e.g. TTS and master WAVs) or "output" (encoded
+            episode files, which are placed elsewhere when published).
+    """
+    state.setdefault("artifacts", {})[os.path.abspath(path)] = kind
+
+def collect_garbage(
+    exclude: set = (),
+    max_age_days: float = None,
+    max_total_mb: float = None
+) -> dict:
+    """
+    Remove episode artifacts, cached background tracks and prepared voice
+    references under the retention policy.
+
+    Args:
+        exclude (set[str]): Episode IDs whose artifacts are kept, e.g. the running episode.
+    Optional:
+        max_age_days (float): Maximum artifact age (days), default ARTIFACT_MAX_AGE_DAYS.
+        max_total_mb (float): Maximum total size of artifacts (MB), default ARTIFACT_MAX_TOTAL_MB.
+
+    Returns:
+        dict: "removed" (number of files), "freed_mb" (disk space freed) and "kept_mb".
+    """
+    max_age_s = 86400 * float(max_age_days if max_age_days is not None else getattr(c, "ARTIFACT_MAX_AGE_DAYS", ARTIFACT_MAX_AGE_DAYS))
+    max_total = 2**20 * float(max_total_mb if max_total_mb is not None else getattr(c, "ARTIFACT_MAX_TOTAL_MB", ARTIFACT_MAX_TOTAL_MB))
+
+    # Candidates as (mtime, freed bytes, path, episode ID or None for cached parts)
+    candidates = []
+    states = {}
+    episodes_dir = utils.pipeline.EPISODES_WORK_DIR
+    for episode_id in sorted(os.listdir(episodes_dir)) if os.path.isdir(episodes_dir) else []:
+        state = load_episode_state(episode_id)
+        if state is None or episode_id in exclude:
+            continue
+        states[episode_id] = state
+        paths = set(state.get("artifacts", {}))
+        paths.update(
+            os.path.join(state["work_dir"], name) for name in os.listdir(state["work_dir"])
+            if name.endswith(INTERMEDIATE_EXTENSIONS)
+        )
+        candidates += [_candidate(path, episode_id) for path in paths if os.path.exists(path)]
+
+    for cache_dir in (utils.mixer.BED_CACHE_DIR, utils.voice_prep.VOICE_CACHE_DIR):
+        if os.path.isdir(cache_dir):
+            candidates += [_candidate(os.path.join(cache_dir, name), None) for name in os.listdir(cache_dir)]
+
+    # Oldest first, removing anything too old, then anything over the size budget
+    now = time.time()
+    total = sum(freed for _, freed, _, _ in candidates)
+    removed = {}
+    freed_total = 0
+    for mtime, freed, path, episode_id in sorted(candidates):
+        if now - mtime <= max_age_s and total <= max_total:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= freed
+        freed_total += freed
+        removed.setdefault(episode_id, set()).add(os.path.abspath(path))
+
+    # Published episodes are never rebuilt, others rebuild the stages whose outputs are gone
+    for episode_id, paths in removed.items():
+        state = states.get(episode_id)
+        if state is None:
+            continue
+        for path in paths:
+            state.get("artifacts", {}).pop(path, None)
+        if "publish" not in state["stages"]:
+            dropped = invalidate_stages(state, paths)
+            if dropped:
+                print(f"Episode {episode_id}: stages to rebuild on resume: {', '.join(dropped)}")
+        save_episode_state(state)
+
+    result = {
+        "removed": sum(len(paths) for paths in removed.values()),
+        "freed_mb": round(freed_total / 2**20, 1),
+        "kept_mb": round(total / 2**20, 1)
+    }
+    print(f"Artifact cleanup: removed {result['removed']} files, freed {result['freed_mb']} MB, {result['kept_mb']} MB kept")
+    return result
+
+def _candidate(path, episode_id):
+    """Garbage collection candidate for a file. Removing a file with other hardlinks frees no space."""
+    st = os.stat(path)
+    return (st.st_mtime, st.st_size if st.st_nlink == 1 else 0, path, episode_id)
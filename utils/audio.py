@@ -0,0 +1,364 @@
+import os, struct, subprocess, wave
+import numpy as np
+
+"""
+In-process audio helpers built on the wave module and NumPy.
+Samples are handled as float32 arrays shaped (frames, channels),
+scaled to the range [-1.0, 1.0].
+"""
+
+# PCM sample widths (bytes) supported by the wave module helpers
+SAMPLE_DTYPES = {
+    2: np.int16,
+    4: np.int32
+}
+
+"""
+MPEG audio Layer III header tables, used to read MP3 durations without decoding.
+Keys are the 2-bit version ID from the frame header: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5.
+"""
+MP3_BITRATES_KBPS = {
+    3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    0: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+}
+MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000]
+}
+
+# Bytes searched for the first frame header after any ID3v2 tag, and bytes read
+# per block when every frame header is scanned
+MP3_SYNC_SEARCH_BYTES = 65536
+MP3_SCAN_BLOCK_BYTES = 1024 * 1024
+
+# Longest Layer III frame in bytes (320 kbps at 32 kHz, padded)
+MP3_MAX_FRAME_BYTES = 1441
+
+# Durations (s) already known to the pipeline, keyed by absolute path
+# Each entry is stamped with the file size and mtime so stale values are ignored
+_known_durations = {}
+
+def read_wav(
+    input_wav: str
+) -> tuple[np.ndarray, int]:
+    """
+    Read a PCM WAV file into a float32 sample array.
+
+    Args:
+        input_wav (str): Path to the WAV file.
+
+    Returns:
+        tuple[np.ndarray, int]: Samples shaped (frames, channels) and sample rate (Hz).
+    """
+    with wave.open(input_wav, "rb") as w:
+        channels = w.getnchannels()
+        sample_width = w.getsampwidth()
+        framerate = w.getframerate()
+        raw = w.readframes(w.getnframes())
+
+    if sample_width not in SAMPLE_DTYPES:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width * 8} bit. Supported values: 16, 32")
+
+    dtype = SAMPLE_DTYPES[sample_width]
+    scale = float(np.iinfo(dtype).max)
+    samples = np.frombuffer(raw, dtype=dtype).astype(np.float32) / scale
+
+    return samples.reshape(-1, channels), framerate
+
+def to_pcm_bytes(
+    samples: np.ndarray,
+    sample_width: int = 2
+) -> bytes:
+    """
+    Convert float32 samples to interleaved PCM bytes, clipping out of range values.
+
+    Args:
+        samples (np.ndarray): Samples shaped (frames, channels).
+        sample_width (int): Output sample width in bytes (2 or 4).
+
+    Returns:
+        bytes: Interleaved little-endian PCM frames.
+    """
+    if sample_width not in SAMPLE_DTYPES:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width * 8} bit. Supported values: 16, 32")
+
+    dtype = SAMPLE_DTYPES[sample_width]
+    scale = float(np.iinfo(dtype).max)
+    return (np.clip(samples, -1.0, 1.0) * scale).astype(dtype).tobytes()
+
+def trim_silence(
+    samples: np.ndarray,
+    framerate: int,
+    threshold_db: float = -45.0,
+    pad_ms: int = 60
+) -> np.ndarray:
+    """
+    Trim leading and trailing silence from a sample array.
+    Loudness is measured as RMS over 10 ms windows, so short clicks
+    do not count as speech.
+
+    Args:
+        samples (np.ndarray): Samples shaped (frames, channels).
+        framerate (int): Sample rate (Hz).
+        threshold_db (float): Windows quieter than this (dBFS) count as silence.
+        pad_ms (int): Silence (ms) kept on each side of the detected audio.
+
+    Returns:
+        np.ndarray: Trimmed samples. Empty if the input is entirely silent.
+    """
+    window = max(1, framerate // 100)
+    n_windows = len(samples) // window
+    if n_windows == 0:
+        return samples
+
+    # RMS of each 10 ms window across all channels
+    windows = samples[:n_windows * window].reshape(n_windows, -1)
+    rms = np.sqrt(np.mean(np.square(windows), axis=1))
+    loud = np.flatnonzero(rms > 10 ** (threshold_db / 20))
+    if loud.size == 0:
+        return samples[:0]
+
+    pad = int(framerate * pad_ms / 1000)
+    start = max(0, loud[0] * window - pad)
+    end = min(len(samples), (loud[-1] + 1) * window + pad)
+    return samples[start:end]
+
+def normalize_level(
+    samples: np.ndarray,
+    target_rms_db: float = -20.0,
+    peak_ceiling_db: float = -1.0
+) -> np.ndarray:
+    """
+    Scale samples to a target RMS level without exceeding a peak ceiling.
+
+    Args:
+        samples (np.ndarray): Samples shaped (frames, channels).
+        target_rms_db (float): Desired RMS level (dBFS).
+        peak_ceiling_db (float): Maximum allowed peak level (dBFS).
+
+    Returns:
+        np.ndarray: Level-adjusted samples.
+    """
+    if samples.size == 0:
+        return samples
+
+    rms = np.sqrt(np.mean(np.square(samples)))
+    peak = np.max(np.abs(samples))
+    if rms == 0 or peak == 0:
+        return samples
+
+    gain = min(10 ** (target_rms_db / 20) / rms, 10 ** (peak_ceiling_db / 20) / peak)
+    return samples * np.float32(gain)
+
+def remember_duration(
+    input_audio: str,
+    duration_s: float
+):
+    """
+    Record the duration of an audio file that is already known, e.g. from TTS
+    assembly, so get_duration() does not need to read the file again.
+
+    Args:
+        input_audio (str): Path to the audio file, after it has been fully written.
+        duration_s (float): Audio duration in seconds.
+    """
+    stat = os.stat(input_audio)
+    _known_durations[os.path.abspath(input_audio)] = (stat.st_size, stat.st_mtime_ns, duration_s)
+
+def get_duration(
+    input_audio: str
+) -> float:
+    """
+    Get the duration of an audio file with sub-second precision.
+    WAV durations are read from the header, MP3 durations from the Xing/Info
+    or VBRI header, or by scanning frame headers. Other formats fall back to ffprobe.
+
+    Args:
+        input_audio (str): Path to the audio file.
+
+    Returns:
+        float: Audio duration in seconds.
+    """
+    if not os.path.exists(input_audio):
+        raise FileNotFoundError(f"Input file not found: {input_audio}")
+
+    stat = os.stat(input_audio)
+    known = _known_durations.get(os.path.abspath(input_audio))
+    if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+        return known[2]
+
+    extension = os.path.splitext(input_audio)[1].lower()
+    duration_s = None
+    if extension == ".wav":
+        duration_s = wav_duration(input_audio)
+    elif extension == ".mp3":
+        duration_s = mp3_duration(input_audio)
+
+    if duration_s is None:
+        duration_s = ffprobe_duration(input_audio)
+    return duration_s
+
+def wav_duration(
+    input_wav: str
+) -> float:
+    """
+    Read the duration of a WAV file from its header.
+
+    Args:
+        input_wav (str): Path to the WAV file.
+
+    Returns:
+        float: Duration in seconds, or None if the wave module cannot read the
+            file, e.g. floating point WAVs.
+    """
+    try:
+        with wave.open(input_wav, "rb") as w:
+            return w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+def mp3_duration(
+    input_mp3: str
+) -> float:
+    """
+    Read the duration of an MP3 file without decoding audio.
+    The frame count is taken from a Xing/Info or VBRI header when present, so
+    only the start of the file is read. Otherwise the file is streamed, every
+    frame header is scanned and frame durations are summed.
+
+    Args:
+        input_mp3 (str): Path to the MP3 file.
+
+    Returns:
+        float: Duration in seconds, or None if no MPEG Layer III frames are found.
+    """
+    with open(input_mp3, "rb") as f:
+        # Skip ID3v2 tag(s), sizes are stored as 7-bit syncsafe integers
+        audio_start = 0
+        tag = f.read(10)
+        while len(tag) == 10 and tag[:3] == b"ID3":
+            size = (tag[6] << 21) | (tag[7] << 14) | (tag[8] << 7) | tag[9]
+            footer = 10 if tag[5] & 0x10 else 0
+            audio_start += 10 + size + footer
+            f.seek(audio_start)
+            tag = f.read(10)
+
+        # Only the start of the audio is read when the first frame has a summary header
+        f.seek(audio_start)
+        data = f.read(MP3_SYNC_SEARCH_BYTES + MP3_MAX_FRAME_BYTES)
+
+        # Find the first valid frame header
+        first = None
+        offset = 0
+        search_end = min(len(data) - 4, MP3_SYNC_SEARCH_BYTES)
+        while offset < search_end:
+            first = _parse_mp3_frame_header(data, offset)
+            if first:
+                break
+            offset += 1
+        if not first:
+            return None
+
+        version, sample_rate, samples_per_frame, frame_length, mono = first
+
+        # Xing/Info header follows the side information of the first frame
+        if version == 3:
+            xing_offset = offset + 4 + (17 if mono else 32)
+        else:
+            xing_offset = offset + 4 + (9 if mono else 17)
+        if data[xing_offset:xing_offset + 4] in (b"Xing", b"Info"):
+            flags = struct.unpack(">I", data[xing_offset + 4:xing_offset + 8])[0]
+            if flags & 0x1:
+                frames = struct.unpack(">I", data[xing_offset + 8:xing_offset + 12])[0]
+                return frames * samples_per_frame / sample_rate
+
+        # VBRI header sits 32 bytes after the first frame header
+        vbri_offset = offset + 36
+        if data[vbri_offset:vbri_offset + 4] == b"VBRI":
+            frames = struct.unpack(">I", data[vbri_offset + 14:vbri_offset + 18])[0]
+            return frames * samples_per_frame / sample_rate
+
+        # No summary header, scan all frames, streaming the file in blocks
+        f.seek(audio_start + offset)
+        data = b""
+        offset = 0
+        total_samples = 0
+        while True:
+            if len(data) - offset < MP3_MAX_FRAME_BYTES:
+                data = data[offset:] + f.read(MP3_SCAN_BLOCK_BYTES)
+                offset = 0
+            frame = _parse_mp3_frame_header(data, offset)
+            if not frame:
+                break
+            total_samples += frame[2]
+            offset += frame[3]
+    return total_samples / sample_rate
+
+def _parse_mp3_frame_header(
+    data: bytes,
+    offset: int
+) -> tuple:
+    """
+    Parse an MPEG audio Layer III frame header.
+
+    Args:
+        data (bytes): MP3 file contents.
+        offset (int): Position of the candidate header.
+
+    Returns:
+        tuple: (version, sample rate, samples per frame, frame length in bytes, mono),
+            or None if no valid Layer III header starts at offset.
+    """
+    if offset + 4 > len(data):
+        return None
+    header = struct.unpack(">I", data[offset:offset + 4])[0]
+
+    # 11 bit frame sync, version, layer (01 = Layer III)
+    if header >> 21 != 0x7FF:
+        return None
+    version = (header >> 19) & 0x3
+    layer = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0x3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrate = MP3_BITRATES_KBPS[version][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][sample_rate_index]
+    padding = (header >> 9) & 0x1
+    mono = ((header >> 6) & 0x3) == 3
+
+    samples_per_frame = 1152 if version == 3 else 576
+    frame_length = (samples_per_frame // 8) * bitrate // sample_rate + padding
+    return version, sample_rate, samples_per_frame, frame_length, mono
+
+def ffprobe_duration(
+    input_audio: str
+) -> float:
+    """
+    Get the duration of an audio file with ffprobe, for formats without a
+    native header reader.
+
+    Args:
+        input_audio (str): Path to the audio file.
+
+    Returns:
+        float: Audio duration in seconds.
+    """
+    ffprobe_cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "csv=p=0",
+        input_audio
+    ]
+
+    try:
+        result = subprocess.run(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
+        return float(result.stdout.strip())
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffprobe command failed: {e.stderr}")
+    except ValueError:
+        raise RuntimeError(f"Could not determine duration from ffprobe output: {result.stdout}")
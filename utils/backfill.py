@@ -0,0 +1,235 @@
+import json, os, time, traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import config as c
+from utils.artifacts import collect_garbage
+from utils.cloud import sync_rss_feed_episodes, upload_rss_feed
+from utils.container_management import resident
+from utils.encoding import MAX_ENCODE_WORKERS
+from utils.news import NewsStory, fetch_news_story
+from utils.pipeline import save_episode_state, run_stages
+from utils.podcast import EPISODE_STAGES, new_episode, upload_episode
+from utils.resources import ResourceSampler, print_resource_summary
+from utils.scheduler import job_episode_args
+from utils.tracing import span, start_trace, stop_trace, write_chrome_trace, print_slowest
+
+"""
+Backfill mode builds many episodes in one run, e.g. to regenerate a persona's
+archive or to start a new persona with a week of episodes. Jobs are read from
+a JSON file:
+    [{"date": "2026-10-12", "persona": "KMART_RADIO", "title": "Kmart Radio News",
+      "articles": ["https://...", "https://..."], "tts_start_delay_ms": 12000,
+      "fade_duration_s": 5}]
+Personas and the optional job settings are the same as for scheduled jobs (see
+utils.scheduler), plus "chapters". "date" is the episode date and publication
+time in ISO 8601, UTC unless an offset is given. "articles" is the article set
+of the episode: article URLs, or stories saved as JSON with "title", "link" and
+"content". Without it, stories are fetched from RSS_NEWS_FEED as usual.
+
+Work is grouped by resource instead of by episode. The LLM stages of every
+episode run while the LLM container stays loaded, then the TTS stages of every
+episode while the TTS container stays loaded, then episodes are mixed and
+encoded in parallel, BACKFILL_WORKERS at a time. New episodes are uploaded
+together and the RSS feed is written and uploaded once. A failed job is left
+out of later phases and can be resumed on its own with its episode ID.
+"""
+BACKFILL_DIR = "./cache/backfill"
+BACKFILL_WORKERS = MAX_ENCODE_WORKERS
+
+# Number of articles fetched at once
+ARTICLE_FETCH_WORKERS = 8
+
+# Stages run in each phase, in order, see utils.podcast.EPISODE_STAGES
+BACKFILL_PHASES = [
+    ("fetch", ["fetch"], None),
+    ("llm", ["summarize", "segment"], "CONTAINER_LLM"),
+    ("tts", ["voice", "synthesize"], "CONTAINER_TTS"),
+    ("render", ["mix", "encode"], None)
+]
+
+def load_backfill_jobs(jobs_path: str) -> list[dict]:
+    """
+    Load and validate backfill jobs from a JSON file.
+
+    Args:
+        jobs_path (str): Path to the jobs file.
+
+    Returns:
+        list[dict]: Jobs, each with "date" parsed to a timezone-aware datetime.
+    """
+    with open(jobs_path, "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    for n, job in enumerate(jobs):
+        missing = [key for key in ("date", "persona", "title") if key not in job]
+        if missing:
+            raise ValueError(f"Backfill job {n} is missing: {', '.join(missing)}")
+        date = datetime.fromisoformat(job["date"])
+        job["date"] = date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+    return jobs
+
+def run_backfill(jobs: list[dict]) -> dict:
+    """
+    Build and publish a batch of episodes, see the module notes.
+
+    Args:
+        jobs (list[dict]): Backfill jobs, see load_backfill_jobs().
+
+    Returns:
+        dict: Run results, with keys:
+            "episodes": Per job "date", "persona", "episode_id", "status" ("published" or
+                "failed") and "error".
+            "timings": Time (s) spent in each phase.
+            "resources": Peak memory and CPU use of the process and containers.
+    """
+    run_timestamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')
+    os.makedirs(BACKFILL_DIR, exist_ok=True)
+    sampler = ResourceSampler(os.path.join(BACKFILL_DIR, f"resources-{run_timestamp}.csv")).start()
+    start_trace()
+
+    results = [{"date": job["date"].isoformat(), "persona": job["persona"], "episode_id": None, "status": "failed", "error": None} for job in jobs]
+    states = {}
+    timings = {}
+    try:
+        phase_start = time.perf_counter()
+        with span("backfill articles", "backfill", jobs=len(jobs)):
+            articles = _fetch_articles(jobs)
+        for n, job in enumerate(jobs):
+            if job.get("articles") and not articles[n]:
+                results[n]["error"] = "setup: none of the articles could be read"
+                continue
+            try:
+                states[n] = new_episode(
+                    **job_episode_args(job),
+                    news_stories=articles.get(n),
+                    chapters=job.get("chapters"),
+                    episode_date=job["date"]
+                )
+                results[n]["episode_id"] = states[n]["episode_id"]
+            except Exception as e:
+                traceback.print_exc()
+                results[n]["error"] = f"setup: {e}"
+        timings["articles"] = time.perf_counter() - phase_start
+
+        for phase, stage_names, container_setting in BACKFILL_PHASES:
+            phase_start = time.perf_counter()
+            stages = [stage for stage in EPISODE_STAGES if stage[0] in stage_names]
+            workers = BACKFILL_WORKERS if phase == "render" else 1
+            pending = [n for n in states if results[n]["error"] is None and not all(name in states[n]["stages"] for name in stage_names)]
+            if pending:
+                print(f"\n===== BACKFILL PHASE: {phase} ({len(pending)} episodes) =====")
+                with span(f"backfill {phase}", "backfill", episodes=len(pending)):
+                    if container_setting:
+                        with resident(getattr(c, container_setting)):
+                            _run_phase(states, pending, stages, results, workers)
+                    else:
+                        _run_phase(states, pending, stages, results, workers)
+            timings[phase] = time.perf_counter() - phase_start
+
+        phase_start = time.perf_counter()
+        with span("backfill publish", "backfill"):
+            _publish(states, results)
+        timings["publish"] = time.perf_counter() - phase_start
+    finally:
+        events = stop_trace()
+        write_chrome_trace(os.path.join(BACKFILL_DIR, f"trace-{run_timestamp}.json"), events)
+        print_slowest(events)
+        resources = sampler.stop()
+        print_resource_summary(resources)
+
+    collect_garbage(exclude={state["episode_id"] for state in states.values()})
+
+    published = sum(result["status"] == "published" for result in results)
+    print(f"\nBackfill: {published} of {len(jobs)} episodes published. Phase timings (s): " + ", ".join(f"{k}={v:.1f}" for k, v in timings.items()))
+    for result in results:
+        if result["status"] != "published":
+            print(f"  Failed: {result['date']} {result['persona']} ({result['episode_id'] or 'no episode'}): {result['error']}")
+    return {"episodes": results, "timings": timings, "resources": resources}
+
+def _fetch_articles(jobs):
+    """Fetch the article sets of all jobs concurrently. Returns stories by job index, for jobs with articles."""
+    fetches = [(n, article) for n, job in enumerate(jobs) for article in job.get("articles") or []]
+
+    def fetch(item):
+        _, article = item
+        if isinstance(article, dict):
+            return NewsStory(**article)
+        try:
+            return fetch_news_story(article)
+        except Exception as e:
+            print(f"Could not fetch article {article}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=ARTICLE_FETCH_WORKERS) as executor:
+        stories = list(executor.map(fetch, fetches))
+
+    articles = {n: [] for n, job in enumerate(jobs) if job.get("articles")}
+    for (n, _), story in zip(fetches, stories):
+        # Skip articles that cannot be parsed, as fetch_rss_news_stories() does
+        if story is not None and story.content:
+            articles[n].append(story)
+    return articles
+
+def _run_phase(states, pending, stages, results, workers):
+    """Run stages for each pending job, recording failures in results."""
+    def run(n):
+        try:
+            run_stages(states[n], stages)
+        except Exception as e:
+            traceback.print_exc()
+            results[n]["error"] = f"{', '.join(name for name, _ in stages)}: {e}"
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, pending))
+    else:
+        for n in pending:
+            run(n)
+
+def _publish(states, results):
+    """Upload every built episode, then write and upload the RSS feed once."""
+    ready = [n for n in states if results[n]["error"] is None and "publish" not in states[n]["stages"]]
+    if not ready:
+        return
+
+    def upload(n):
+        state = states[n]
+        params = state["params"]
+        try:
+            return upload_episode(
+                state["stages"]["encode"]["mp3"],
+                params["episode_title"],
+                params["episode_image_full_url"],
+                state["stages"]["mix"]["duration"],
+                state["stages"]["encode"]["renditions"],
+                params.get("pub_ts"),
+                state["stages"]["encode"].get("chapters")
+            )
+        except Exception as e:
+            traceback.print_exc()
+            results[n]["error"] = f"publish: {e}"
+            return None
+
+    print(f"\nUploading {len(ready)} episodes...")
+    with ThreadPoolExecutor(max_workers=BACKFILL_WORKERS) as executor:
+        entries = list(executor.map(upload, ready))
+
+    uploaded = [(n, entry) for n, entry in zip(ready, entries) if entry is not None]
+    if not uploaded:
+        return
+
+    # Episodes stay unpublished, and are published again on resume, when the feed fails to upload
+    try:
+        feed_files = sync_rss_feed_episodes([entry for _, entry in uploaded])
+        upload_rss_feed(feed_files)
+    except Exception as e:
+        traceback.print_exc()
+        for n, _ in uploaded:
+            results[n]["error"] = f"publish: {e}"
+        return
+
+    for n, _ in uploaded:
+        states[n]["stages"]["publish"] = {}
+        save_episode_state(states[n])
+        results[n]["status"] = "published"
@@ -0,0 +1,177 @@
+import hashlib, json, os, wave
+import numpy as np
+
+from utils.audio import remember_duration
+
+"""
+Chapter mode renders the news segment in parts: the intro, each story and the
+outro (see utils.llm.llama_cpp_news_segment_parts()). Each part is synthesized
+to its own WAV in the episode's CHAPTERS_DIRNAME directory, named by a hash of
+its text and TTS settings, so a re-render only synthesizes parts whose text
+changed. Parts are joined sample for sample with PART_GAP_MS of silence between
+them, so there are no encoder gaps at the joins, and the episode is encoded once
+with a chapter marker at the start of each part.
+"""
+CHAPTERS_DIRNAME = "chapters"
+PART_GAP_MS = 400
+
+# Podcasting 2.0 JSON chapters format version
+CHAPTERS_JSON_VERSION = "1.2.0"
+
+def part_key(
+    text: str,
+    voice_ref: str,
+    timesteps: int
+) -> str:
+    """
+    Cache key of a synthesized part. Parts with the same key have the same audio.
+
+    Args:
+        text (str): Part text.
+        voice_ref (str): Voice reference filename.
+        timesteps (int): TTS inference timesteps.
+
+    Returns:
+        str: Hex digest.
+    """
+    return hashlib.sha256(json.dumps([text, voice_ref, int(timesteps)]).encode("utf-8")).hexdigest()[:16]
+
+def part_wav_path(
+    work_dir: str,
+    key: str
+) -> str:
+    """Path of the synthesized WAV of a part in an episode work directory."""
+    return os.path.join(work_dir, CHAPTERS_DIRNAME, key + ".wav")
+
+def join_part_wavs(
+    part_wavs: list[str],
+    titles: list[str],
+    output_wav: str,
+    gap_ms: int = PART_GAP_MS
+) -> list[dict]:
+    """
+    Join part WAVs into one WAV, with silence between parts. PCM frames are
+    copied as-is, so the joins are sample accurate.
+
+    Args:
+        part_wavs (list[str]): Part WAV paths in playback order. All parts must have the same format.
+        titles (list[str]): Chapter title of each part.
+        output_wav (str): Path to the joined WAV.
+    Optional:
+        gap_ms (int): Silence (ms) between parts.
+
+    Returns:
+        list[dict]: Chapters, each with "title", "start_s" and "end_s" in the joined WAV.
+    """
+    if not part_wavs:
+        raise ValueError("No part WAVs to join")
+
+    chapters = []
+    frames = 0
+    with wave.open(output_wav, "wb") as output:
+        for n, (part_wav, title) in enumerate(zip(part_wavs, titles)):
+            with wave.open(part_wav, "rb") as part:
+                params = (part.getnchannels(), part.getsampwidth(), part.getframerate())
+                if n == 0:
+                    output.setnchannels(params[0])
+                    output.setsampwidth(params[1])
+                    output.setframerate(params[2])
+                    output_params = params
+                elif params != output_params:
+                    raise ValueError(f"Part WAV format does not match previous parts: {part_wav}")
+                else:
+                    gap_frames = params[2] * gap_ms // 1000
+                    output.writeframes(np.zeros(gap_frames * params[0], dtype=f"<i{params[1]}").tobytes())
+                    frames += gap_frames
+
+                start_frames = frames
+                output.writeframes(part.readframes(part.getnframes()))
+                frames += part.getnframes()
+            chapters.append({"title": title, "start_s": start_frames / params[2], "end_s": frames / params[2]})
+
+    remember_duration(output_wav, frames / output_params[2])
+    return chapters
+
+def shift_chapters(
+    chapters: list[dict],
+    offset_s: float,
+    duration_s: float = None
+) -> list[dict]:
+    """
+    Move chapters to their position in the mixed episode, e.g. after a background
+    track intro. The first chapter starts at 0 and the last ends at duration_s.
+
+    Args:
+        chapters (list[dict]): Chapters from join_part_wavs().
+        offset_s (float): Time (s) at which the joined WAV starts in the episode.
+    Optional:
+        duration_s (float): Episode duration (s).
+
+    Returns:
+        list[dict]: Shifted chapters.
+    """
+    shifted = [dict(chapter, start_s=chapter["start_s"] + offset_s, end_s=chapter["end_s"] + offset_s) for chapter in chapters]
+    if shifted:
+        shifted[0]["start_s"] = 0.0
+        if duration_s is not None:
+            shifted[-1]["end_s"] = max(shifted[-1]["end_s"], float(duration_s))
+    return shifted
+
+def write_ffmetadata(
+    chapters: list[dict],
+    output_path: str
+) -> str:
+    """
+    Write chapters as an ffmpeg metadata file, read with -map_chapters. MP3 output
+    gets ID3 CHAP frames, Opus gets chapter comments and AAC gets MP4 chapters.
+
+    Args:
+        chapters (list[dict]): Chapters with "title", "start_s" and "end_s".
+        output_path (str): Path to the metadata file.
+
+    Returns:
+        str: Metadata file path.
+    """
+    lines = [";FFMETADATA1"]
+    for chapter in chapters:
+        lines += [
+            "[CHAPTER]",
+            "TIMEBASE=1/1000",
+            f"START={round(chapter['start_s'] * 1000)}",
+            f"END={round(chapter['end_s'] * 1000)}",
+            f"title={_escape_ffmetadata(chapter['title'])}"
+        ]
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return output_path
+
+def _escape_ffmetadata(value):
+    """Escape special characters in an ffmpeg metadata value."""
+    for char in "\\=;#\n":
+        value = value.replace(char, "\\" + char)
+    return value
+
+def write_chapters_json(
+    chapters: list[dict],
+    output_path: str
+) -> str:
+    """
+    Write chapters in the Podcasting 2.0 JSON chapters format.
+
+    Args:
+        chapters (list[dict]): Chapters with "title", "start_s" and "end_s".
+        output_path (str): Path to the JSON file.
+
+    Returns:
+        str: JSON file path.
+    """
+    document = {
+        "version": CHAPTERS_JSON_VERSION,
+        "chapters": [
+            {"startTime": round(chapter["start_s"], 3), "endTime": round(chapter["end_s"], 3), "title": chapter["title"]}
+            for chapter in chapters
+        ]
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    return output_path
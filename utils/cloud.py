@@ -1,152 +1,379 @@
-import os, re, requests, shutil
+import hashlib, json, mimetypes, os, re, requests, shutil, threading, time
 from pathlib import Path
-import boto3
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
-from email.utils import formatdate
 from io import BytesIO
 
 import config as c
+from utils.files import file_hash
+from utils.tracing import span
+from utils.feed_store import FEED_WINDOW_SIZE, add_episode, import_feed_items, get_meta, set_meta, write_feed_pages, write_json_index_pages, gzip_feed
 
-# Initialize session with S3 client, compatible with Cloudflare & AWS
-session = boto3.session.Session()
-s3 = session.client(
-    "s3",
-    region_name=c.R2_REGION,
-    endpoint_url=f"https://{c.CLOUDFLARE_ACCOUNT_ID}.r2.cloudflarestorage.com",
-    aws_access_key_id=c.R2_ACCESS_KEY,
-    aws_secret_access_key=c.R2_SECRET_KEY
-)
+# S3 client, compatible with Cloudflare & AWS, created on first use by get_s3_client()
+_s3 = None
+_s3_lock = threading.Lock()
+
+# Multipart transfer settings: files above 8 MB are sent as 8 MB parts,
+# with up to 8 parts in flight per file
+TRANSFER_SETTINGS = {
+    "multipart_threshold": 8 * 1024 * 1024,
+    "multipart_chunksize": 8 * 1024 * 1024,
+    "max_concurrency": 8,
+    "use_threads": True
+}
+
+# Maximum number of files uploaded at once by upload_files_to_s3()
+MAX_UPLOAD_WORKERS = 4
+
+# Cache lifetimes for the main feed, and for full archive pages, which only change
+# after a back-dated episode
+FEED_CACHE_CONTROL = "public, max-age=300"
+ARCHIVE_CACHE_CONTROL = "public, max-age=604800"
+
+"""
+Local manifest of bucket contents (key, size, etag, mtime), so existence checks
+do not need to list the bucket. It is built from a full paginated listing the
+first time it is needed and updated on every upload through this module.
+"""
+MANIFEST_PATH = "./cache/bucket_manifest.json"
+_manifest = None
+_manifest_lock = threading.Lock()
+
+def get_s3_client():
+    """
+    Get the S3 client, creating a session with the R2 credentials on first use.
+    boto3 is only imported when cloud storage is used.
+    """
+    global _s3
+    with _s3_lock:
+        if _s3 is None:
+            import boto3
+            session = boto3.session.Session()
+            _s3 = session.client(
+                "s3",
+                region_name=c.R2_REGION,
+                endpoint_url=f"https://{c.CLOUDFLARE_ACCOUNT_ID}.r2.cloudflarestorage.com",
+                aws_access_key_id=c.R2_ACCESS_KEY,
+                aws_secret_access_key=c.R2_SECRET_KEY
+            )
+        return _s3
 
 def list_existing_s3_files():
     """
     Lists all existing files in the S3 or R2 bucket.
+    All pages of the listing are read, and the local bucket manifest is rebuilt.
     
     Returns:
         list(str): String list of all files in cloud storage.
     """
     try:
-        response = s3.list_objects_v2(Bucket=c.R2_BUCKET_NAME)
-        if "Contents" in response:
-            return [obj["Key"] for obj in response["Contents"]]
-        return []
+        return list(build_bucket_manifest())
     except Exception as e:
         print(f"Failed to list existing files in S3 / R2 bucket: {e}")
         return []
 
-def upload_to_s3(file_path):
+def build_bucket_manifest():
+    """
+    Rebuilds the local bucket manifest from a full, paginated bucket listing.
+
+    Returns:
+        dict: Object key -> {"size", "etag", "mtime"}.
+    """
+    global _manifest
+    objects = {}
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=c.R2_BUCKET_NAME):
+        for obj in page.get("Contents", []):
+            objects[obj["Key"]] = {
+                "size": obj["Size"],
+                "etag": obj["ETag"].strip('"'),
+                "mtime": obj["LastModified"].timestamp()
+            }
+
+    with _manifest_lock:
+        _manifest = objects
+        _save_bucket_manifest()
+    return objects
+
+def load_bucket_manifest():
+    """
+    Loads the local bucket manifest, building it from the bucket if there is none.
+
+    Returns:
+        dict: Object key -> {"size", "etag", "mtime"}.
+    """
+    global _manifest
+    with _manifest_lock:
+        if _manifest is not None:
+            return _manifest
+        if os.path.exists(MANIFEST_PATH):
+            with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("bucket") == c.R2_BUCKET_NAME:
+                _manifest = saved["objects"]
+                return _manifest
+    return build_bucket_manifest()
+
+def object_in_bucket(object_key):
+    """
+    Checks whether an object exists in the bucket, using the local manifest.
+
+    Args:
+        object_key (str): Object key in the bucket.
+    Returns:
+        bool: True if the object is in the manifest.
+    """
+    return object_key in load_bucket_manifest()
+
+def _record_upload(object_key, size, etag=None):
+    """Adds or updates an uploaded object in the local bucket manifest."""
+    with _manifest_lock:
+        if _manifest is None:
+            return
+        _manifest[object_key] = {"size": size, "etag": etag, "mtime": time.time()}
+        _save_bucket_manifest()
+
+def _save_bucket_manifest():
+    """Writes the manifest to MANIFEST_PATH. Caller must hold _manifest_lock."""
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"bucket": c.R2_BUCKET_NAME, "objects": _manifest}, f)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+def upload_to_s3(file_path, object_key=None, extra_args=None):
     """
     Uploads a file to the S3 or R2 bucket with public read permissions.
+    Large files are sent as concurrent multipart uploads. The upload is
+    skipped if an object with the same SHA-256 content hash already exists.
     
     Args:
         file_path (str): Path to the file to be uploaded.
+    Optional:
+        object_key (str): Object key in the bucket. Defaults to the file name.
+        extra_args (dict): Additional object settings, e.g. ContentEncoding, CacheControl.
     Returns:
         str: URL of uploaded file.
     """
-    file_name = os.path.basename(file_path)
+    file_name = object_key or os.path.basename(file_path)
+    with span("s3 upload", "cloud", key=file_name) as trace:
+        try:
+            content_hash = file_hash(file_path)
+            trace["bytes"] = os.path.getsize(file_path)
+            if remote_object_matches(file_name, content_hash, trace["bytes"]):
+                print(f"Skipping {file_name}, identical object already in bucket")
+                trace["skipped"] = True
+                return f"{c.PODCAST_CLOUD_REPO}/{file_name}"
+
+            print(f"Uploading {file_name}...")
+            upload_args = {"ACL": "public-read", "Metadata": {"sha256": content_hash}}
+            content_type = mimetypes.guess_type(file_name)[0]
+            if content_type:
+                upload_args["ContentType"] = content_type
+            upload_args.update(extra_args or {})
+            from boto3.s3.transfer import TransferConfig
+            s3 = get_s3_client()
+            s3.upload_file(file_path, c.R2_BUCKET_NAME, file_name, ExtraArgs=upload_args, Config=TransferConfig(**TRANSFER_SETTINGS))
+            # upload_file() does not return the response, the ETag is read back for the manifest
+            etag = s3.head_object(Bucket=c.R2_BUCKET_NAME, Key=file_name)["ETag"].strip('"')
+            _record_upload(file_name, os.path.getsize(file_path), etag)
+            return f"{c.PODCAST_CLOUD_REPO}/{file_name}"
+        except Exception as e:
+            print(f"Failed to upload {file_name}: {e}")
+            trace["error"] = str(e)
+            return None
+
+def upload_files_to_s3(file_paths):
+    """
+    Uploads several files to the S3 or R2 bucket concurrently, see upload_to_s3().
+
+    Args:
+        file_paths (list[str]): Paths to the files to be uploaded.
+    Returns:
+        list[str]: URL of each uploaded file, in the same order as file_paths.
+            None for files that failed to upload.
+    """
+    if not file_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(file_paths))) as executor:
+        return list(executor.map(upload_to_s3, file_paths))
+
+def remote_object_matches(object_key, content_hash, size):
+    """
+    Checks whether an object in the bucket has the given content, using a HEAD
+    request and the sha256 metadata recorded by upload_to_s3().
+
+    Args:
+        object_key (str): Object key in the bucket.
+        content_hash (str): SHA-256 hex digest of the local file.
+        size (int): Size of the local file (bytes).
+    Returns:
+        bool: True if the object exists with the same size and content hash.
+    """
+    # Objects missing from the manifest need no HEAD request
+    if not object_in_bucket(object_key):
+        return False
+    from botocore.exceptions import ClientError
     try:
-        print(f"Uploading {file_name}...")
-        s3.upload_file(file_path, c.R2_BUCKET_NAME, file_name, ExtraArgs={"ACL": "public-read"})
-        return f"{c.PODCAST_CLOUD_REPO}/{file_name}"
-    except Exception as e:
-        print(f"Failed to upload {file_name}: {e}")
-        return None
+        head = get_s3_client().head_object(Bucket=c.R2_BUCKET_NAME, Key=object_key)
+    except ClientError:
+        return False
+    return head.get("ContentLength") == size and head.get("Metadata", {}).get("sha256") == content_hash
 
-def fetch_existing_rss():
+def fetch_existing_rss(etag=None, last_modified=None):
     """
-    Download existing podcast RSS feed from remote storage.
+    Download existing podcast RSS feed from remote storage, with a conditional GET
+    when validators from a previous download are given.
 
+    Optional:
+        etag (str): ETag of the previously downloaded feed.
+        last_modified (str): Last-Modified value of the previously downloaded feed.
     Returns:
-        ElementTree: XML element tree of the existing podcast RSS feed.
+        Response: HTTP response (status 200 or 304), or None if the request failed.
     """
     rss_url = f"{c.PODCAST_CLOUD_REPO}/{c.PODCAST_RSS_FILENAME}"
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        response = requests.get(rss_url)
-        if response.status_code == 200:
-            return ET.parse(BytesIO(response.content))
+        response = requests.get(rss_url, headers=headers)
+        if response.status_code in (200, 304):
+            return response
     except Exception as e:
         print(f"Could not fetch existing RSS feed: {e}")
     return None
 
-def sync_rss_feed(episode_url, episode_title, episode_duration, episode_image):
+def reconcile_rss_feed():
     """
-    Generate a new podcast RSS feed, merging the latest episode to the
-    beginning of the existing podcast RSS feed on cloud storage.
+    Reconcile the local episode store with the public podcast RSS feed.
+    Episodes found only in the public feed, e.g. published from another machine,
+    are added to the store. The feed is only downloaded and parsed when it has
+    changed since the last reconciliation and differs from the last feed
+    published from here.
+
+    Returns:
+        int: Number of episodes added to the store.
+    """
+    response = fetch_existing_rss(get_meta("remote_etag"), get_meta("remote_last_modified"))
+    if response is None or response.status_code == 304:
+        return 0
+
+    set_meta("remote_etag", response.headers.get("ETag", ""))
+    set_meta("remote_last_modified", response.headers.get("Last-Modified", ""))
+    if hashlib.sha256(response.content).hexdigest() == get_meta("published_sha256"):
+        return 0
+
+    added = import_feed_items(ET.parse(BytesIO(response.content)))
+    if added:
+        print(f"Added {added} episodes from the public RSS feed to the local episode store")
+    return added
+
+def sync_rss_feed(episode_url, episode_title, episode_duration, episode_image, alternate_enclosures=None):
+    """
+    Add the latest episode to the local episode store, then write a new podcast
+    RSS feed from the store. The store is reconciled with the public feed first.
+    The main feed is limited to the newest PODCAST_FEED_WINDOW episodes (optional
+    setting, default FEED_WINDOW_SIZE), older episodes go to linked archive pages.
 
     Args:
         episode_url (str): Remote path to the new podcast episode MP3.
         episode_title (str): New podcast episode title.
         episode_duration (str): New podcast episode duration.
         episode_image (str): New podcast episode image.
+    Optional:
+        alternate_enclosures (list[dict]): Additional renditions of the episode, each with
+            "url", "type" and "length" (bytes). Listed as podcast:alternateEnclosure elements.
+    Returns:
+        list[tuple[str, bool]]: (path, complete) for each feed file written, main feed first.
+            The main feed holds the newest episodes, older ones are in archive pages.
+    """
+    return sync_rss_feed_episodes([{
+        "url": episode_url,
+        "title": episode_title,
+        "duration": episode_duration,
+        "image": episode_image,
+        "alternates": alternate_enclosures
+    }])
+
+def sync_rss_feed_episodes(episodes):
+    """
+    Add new episodes to the local episode store, then write the podcast RSS feed
+    once for all of them, see sync_rss_feed().
+
+    Args:
+        episodes (list[dict]): New episodes, each with "url", "title", "duration" and
+            "image", and optionally "alternates" (alternate enclosures), "chapters" (JSON
+            chapters URL) and "pub_ts" (publication time, default the modification time
+            of the local episode file).
     Returns:
-        ElementTree: XML element tree of the new podcast RSS feed.
-    """
-    existing_rss = fetch_existing_rss()
-    existing_items = {}
-
-    # Create new RSS structure
-    ET.register_namespace("itunes", "http://www.itunes.com/dtds/podcast-1.0.dtd")
-    rss = ET.Element("rss", version="2.0")
-    channel = ET.SubElement(rss, "channel")
-
-    # Podcast details
-    ET.SubElement(channel, "title").text = c.PODCAST_TITLE
-    ET.SubElement(channel, "link").text = c.PODCAST_CLOUD_REPO
-    ET.SubElement(channel, "description").text = c.PODCAST_DESCRIPTION
-    ET.SubElement(channel, "language").text = "en-us"
-
-    # Podcast image
-    image = ET.SubElement(channel, "image")
-    ET.SubElement(image, "url").text = c.PODCAST_CLOUD_REPO + c.PODCAST_MAIN_IMAGE_URL
-    ET.SubElement(image, "title").text = c.PODCAST_TITLE
-    ET.SubElement(image, "link").text = c.PODCAST_CLOUD_REPO
-
-    # If an existing RSS feed is available, extract old episodes
-    if existing_rss:
-        for item in existing_rss.findall(".//item"):
-            guid = item.find("guid")
-            if guid is not None:
-                url = guid.text
-                existing_items[url] = item
-
-    if episode_url not in existing_items:  # Ensure no duplicates
-        item = ET.SubElement(channel, "item")
-        file_name = os.path.basename(episode_url)
-
-        # Get file modification date, use as publication date
-        # Requires RFC 2822-compliant date string (formatted with email.utils)
-        file_path = os.path.join(c.PODCAST_ASSETS_DIRECTORY, file_name) 
-        mod_time = os.path.getmtime(file_path)
-        pub_date = formatdate(timeval=mod_time, usegmt=True)
-
-        ET.SubElement(item, "title").text = episode_title
-        ET.SubElement(item, "{http://www.itunes.com/dtds/podcast-1.0.dtd}duration").text = str(episode_duration)
-        ET.SubElement(item, "{http://www.itunes.com/dtds/podcast-1.0.dtd}image").text = episode_image
-        ET.SubElement(item, "link").text = episode_url
-        ET.SubElement(item, "guid").text = episode_url
-        ET.SubElement(item, "pubDate").text = pub_date
-
-        enclosure = ET.SubElement(item, "enclosure")
-        enclosure.set("url", episode_url)
-        enclosure.set("type", "audio/mpeg")
-
-        # Append old episodes
-        for url, item in existing_items.items():
-            channel.append(item)
-
-    return ET.ElementTree(rss)
-
-def upload_rss_feed(rss_tree):
-    """
-    Uploads the new podcast RSS feed to cloud storage with public read permissions.
+        list[tuple[str, bool]]: (path, complete) for each feed file written, main feed first.
+    """
+    reconcile_rss_feed()
+
+    for episode in episodes:
+        # Get file modification date, use as publication date unless one is given
+        file_name = os.path.basename(episode["url"])
+        file_path = os.path.join(c.PODCAST_ASSETS_DIRECTORY, file_name)
+
+        add_episode(
+            episode["url"],
+            episode["title"],
+            int(episode["duration"]),
+            episode["image"],
+            episode.get("pub_ts") or os.path.getmtime(file_path),
+            episode["url"],
+            "audio/mpeg",
+            os.path.getsize(file_path),
+            episode.get("alternates"),
+            episode.get("chapters")
+        )
+
+    feed_files = write_feed_pages(
+        c.PODCAST_ASSETS_DIRECTORY,
+        c.PODCAST_RSS_FILENAME,
+        c.PODCAST_CLOUD_REPO,
+        int(getattr(c, "PODCAST_FEED_WINDOW", FEED_WINDOW_SIZE))
+    )
+    return feed_files
+
+def upload_rss_feed(feed_files):
+    """
+    Uploads the new podcast RSS feed and its archive pages to cloud storage with
+    public read permissions. A compact JSON episode index for the web player is
+    written from the episode store and uploaded alongside the feed.
+    Each file is stored gzip-compressed, with Content-Encoding and Cache-Control
+    metadata. Full archive pages rarely change, so they are cached for much
+    longer than the main feed and index. Pages rewritten after a back-dated
+    episode are uploaded again.
 
     Args:
-        rss_tree (ElementTree): XML element tree of the new podcast RSS feed.
+        feed_files (list[tuple[str, bool]]): (path, complete) for each feed file,
+            main feed first, see utils.feed_store.write_feed_pages().
+
+    Raises:
+        RuntimeError: If the main feed fails to upload.
     """
-    rss_path = os.path.join(c.PODCAST_ASSETS_DIRECTORY, c.PODCAST_RSS_FILENAME)
-    rss_tree.write(rss_path, encoding="utf-8", xml_declaration=True)
-    
-    try:
-        s3.upload_file(rss_path, c.R2_BUCKET_NAME, c.PODCAST_RSS_FILENAME, ExtraArgs={"ACL": "public-read"})
-        print(f"RSS feed updated: {c.PODCAST_CLOUD_REPO}/{c.PODCAST_RSS_FILENAME}")
-    except Exception as e:
-        print(f"Failed to upload RSS feed: {e}")
\ No newline at end of file
+    index_filename = os.path.splitext(c.PODCAST_RSS_FILENAME)[0] + ".json"
+    index_files = write_json_index_pages(c.PODCAST_ASSETS_DIRECTORY, index_filename)
+
+    def upload_feed(feed_file):
+        feed_path, complete = feed_file
+        extra_args = {
+            "ContentType": "application/json" if feed_path.endswith(".json") else "application/rss+xml",
+            "ContentEncoding": "gzip",
+            "CacheControl": ARCHIVE_CACHE_CONTROL if complete else FEED_CACHE_CONTROL
+        }
+        return upload_to_s3(gzip_feed(feed_path), os.path.basename(feed_path), extra_args)
+
+    all_files = feed_files + index_files
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(all_files))) as executor:
+        urls = list(executor.map(upload_feed, all_files))
+
+    if not urls[0]:
+        raise RuntimeError(f"Failed to upload RSS feed: {feed_files[0][0]}")
+    set_meta("published_sha256", file_hash(feed_files[0][0]))
+    print(f"RSS feed updated: {urls[0]} ({len(feed_files) - 1} archive pages updated)")
+    if not urls[len(feed_files)]:
+        print("Failed to upload JSON episode index")
@@ -1,39 +1,193 @@
-import docker, time
+import json, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-client = docker.from_env()
+import config as c
+from utils.tracing import span
+
+"""
+Containers are stopped concurrently. Each container gets its stop signal at
+once, and is killed if it has not exited after its grace timeout, set per
+container name in CONTAINER_STOP_TIMEOUTS (default STOP_TIMEOUT_S).
+State changes are read from the Docker events stream instead of blocking on
+each container. A container with a health check is ready when Docker reports
+it healthy, at most boot_wait_time after it starts. Other containers are given
+the full boot_wait_time. The time spent in each transition is printed and traced.
+"""
+STOP_TIMEOUT_S = 10
+KILL_TIMEOUT_S = 5
+
+# Container states in which there is nothing to stop
+STOPPED_STATES = ("created", "exited", "dead")
+
+# Docker client, connected on first use by get_docker_client()
+_client = None
+
+# Containers kept running across episodes by resident(), e.g. for a backfill
+_resident = set()
+
+def get_docker_client():
+    """Get the Docker client, connecting to the Docker daemon on first use."""
+    global _client
+    if _client is None:
+        import docker
+        _client = docker.from_env()
+    return _client
+
+class _ContainerEvents():
+    """
+    Container events from the Docker events stream, read on a background thread.
+    Use as a context manager, opened before the actions whose events are awaited.
+    """
+    def __init__(self, actions):
+        self.actions = actions
+        self.seen = {}
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        self.stream = get_docker_client().events(decode=True, filters={"type": "container", "event": self.actions})
+        threading.Thread(target=self._read, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stream.close()
+
+    def _flag(self, container_id, action):
+        with self.lock:
+            return self.seen.setdefault((container_id, action), threading.Event())
+
+    def _read(self):
+        try:
+            for event in self.stream:
+                container_id = event.get("Actor", {}).get("ID") or event.get("id")
+                self._flag(container_id, event.get("Action") or event.get("status")).set()
+        except Exception:
+            pass  # Stream closed
+
+    def wait(self, container_id, action, timeout):
+        """Wait for an event on a container. Returns True if it happened within timeout (s)."""
+        return self._flag(container_id, action).wait(timeout)
+
+def stop_timeout(container_name):
+    """Grace timeout (s) before a container is killed, from CONTAINER_STOP_TIMEOUTS."""
+    timeouts = getattr(c, "CONTAINER_STOP_TIMEOUTS", None) or {}
+    if isinstance(timeouts, str):
+        timeouts = json.loads(timeouts)
+    return float(timeouts.get(container_name, STOP_TIMEOUT_S))
+
+@contextmanager
+def resident(container_name):
+    """
+    Keep a container running for a block of work that spans several episodes.
+    Inside the block, stop_container() and stop_all_containers() leave it running.
+    The container is stopped when the block exits.
+    """
+    _resident.add(container_name)
+    try:
+        yield
+    finally:
+        _resident.discard(container_name)
+        stop_container(container_name)
 
 def stop_all_containers(excluded_contatiners):
-    """Stop all running Docker containers, except excluded containers."""
+    """
+    Stop all running Docker containers, except excluded and resident containers.
+
+    Returns:
+        dict: Time (s) taken to stop each container, by container name.
+    """
     print(f"Containers excluded from global stop: {excluded_contatiners}")
-    for container in client.containers.list():
-        if container.name not in excluded_contatiners:
-            print(f"Stopping container: '{container.name}'")
-            container.stop()
+    containers = [
+        container for container in get_docker_client().containers.list()
+        if container.name not in excluded_contatiners and container.name not in _resident
+    ]
+    return _stop_containers(containers)
 
 def start_container(container_name, boot_wait_time):
-    """Start a container and wait N seconds for it to boot."""
+    """Start a container and wait up to N seconds for it to boot."""
+    from docker.errors import APIError, NotFound
     try:
         # Start the container if it's not already running
         print(f"Starting container '{container_name}'...")
-        container = client.containers.get(container_name)
+        container = get_docker_client().containers.get(container_name)
         if container.status != "running":
-            container.start()
-            time.sleep(boot_wait_time)
+            healthcheck = container.attrs.get("Config", {}).get("Healthcheck") or {}
+            has_healthcheck = healthcheck.get("Test", ["NONE"]) != ["NONE"]
+
+            with _ContainerEvents(["health_status"]) as events:
+                start = time.perf_counter()
+                with span("container start", "container", container=container_name):
+                    container.start()
+                started = time.perf_counter()
 
-    except docker.errors.NotFound:
+                with span("container boot wait", "container", container=container_name) as trace:
+                    if has_healthcheck:
+                        trace["ready"] = "healthy" if events.wait(container.id, "health_status: healthy", boot_wait_time) else "timeout"
+                    else:
+                        time.sleep(boot_wait_time)
+                        trace["ready"] = "boot wait"
+
+            print(f"Container '{container_name}' started in {started - start:.1f}s, ready after {time.perf_counter() - started:.1f}s ({trace['ready']})")
+
+    except NotFound:
         print(f"Container '{container_name}' not found.")
-    except docker.errors.APIError as e:
+    except APIError as e:
         print(f"An error occurred: {e}")
 
 def stop_container(container_name):
-    """Stop a container."""
+    """Stop a container, unless it is resident."""
+    from docker.errors import APIError, NotFound
+    if container_name in _resident:
+        return
     try:
-        container = client.containers.get(container_name)
-        print(f"Stopping container '{container_name}'...")
-        container.stop()
-        container.wait()  # Wait until container is stopped
+        container = get_docker_client().containers.get(container_name)
+        if container.status not in STOPPED_STATES:
+            _stop_containers([container])
 
-    except docker.errors.NotFound:
+    except NotFound:
         print(f"Container '{container_name}' not found.")
-    except docker.errors.APIError as e:
-        print(f"An error occurred: {e}")
\ No newline at end of file
+    except APIError as e:
+        print(f"An error occurred: {e}")
+
+def _stop_containers(containers):
+    """Stop containers concurrently. Returns the time (s) taken to stop each container, by name."""
+    if not containers:
+        return {}
+    with _ContainerEvents(["die"]) as events, ThreadPoolExecutor(max_workers=len(containers)) as pool:
+        stop_times = list(pool.map(lambda container: _stop_one(container, events), containers))
+    return {container.name: stop_time for container, stop_time in zip(containers, stop_times)}
+
+def _stop_one(container, events):
+    """
+    Send a container its stop signal and wait for it to exit, killing it after its grace timeout.
+
+    Returns:
+        float: Time (s) taken to stop the container.
+    """
+    from docker.errors import APIError
+
+    grace = stop_timeout(container.name)
+    stop_signal = container.attrs.get("Config", {}).get("StopSignal") or "SIGTERM"
+    print(f"Stopping container '{container.name}'...")
+
+    start = time.perf_counter()
+    with span("container stop", "container", container=container.name) as trace:
+        try:
+            container.kill(signal=stop_signal)
+            if events.wait(container.id, "die", grace):
+                trace["result"] = "stopped"
+            else:
+                print(f"Container '{container.name}' did not stop within {grace:.0f}s, killing it")
+                container.kill()
+                if not events.wait(container.id, "die", KILL_TIMEOUT_S):
+                    raise TimeoutError(f"Container '{container.name}' did not exit after being killed")
+                trace["result"] = "killed"
+        except APIError as e:
+            # 409: the container exited before it was signalled
+            if e.status_code != 409:
+                raise
+            trace["result"] = "not running"
+
+    stop_time = time.perf_counter() - start
+    print(f"Container '{container.name}' {trace['result']} in {stop_time:.1f}s")
+    return stop_time
@@ -0,0 +1,127 @@
+import json, os, re, threading
+import numpy as np
+
+"""
+Spoken duration prediction for TTS text, calibrated per voice.
+Each TTS chunk is described by a few text features (words, characters,
+pauses and a constant). Chunk durations are a linear function of the
+features. The weights are fitted per voice from the text and trimmed audio
+length of past chunks. Ridge regression pulls the fit toward DEFAULT_WEIGHTS,
+so a voice with few recorded chunks still gets sensible predictions.
+Recorded chunks are kept in CALIBRATION_PATH, MAX_SAMPLES_PER_VOICE per voice.
+"""
+CALIBRATION_PATH = "./cache/voice_durations.json"
+MAX_SAMPLES_PER_VOICE = 500
+
+# Seconds per word, per character, per pause mark, and per chunk
+DEFAULT_WEIGHTS = np.array([0.36, 0.005, 0.15, 0.2])
+
+# Features of a typical TTS chunk. Features are divided by these before fitting,
+# so every feature is about 1 per chunk and RIDGE_STRENGTH is in chunks
+FEATURE_SCALE = np.array([40.0, 200.0, 5.0, 1.0])
+
+# Strength of the pull toward DEFAULT_WEIGHTS, in chunks
+RIDGE_STRENGTH = 20.0
+
+PAUSE_PATTERN = re.compile(r"[.,;:!?…—]")
+
+_calibration = None
+_calibration_lock = threading.Lock()
+
+def text_features(text: str) -> np.ndarray:
+    """
+    Features of a TTS chunk used to predict its spoken duration.
+
+    Args:
+        text (str): Chunk text.
+
+    Returns:
+        np.ndarray: Word count, non-space character count, pause mark count and 1.
+    """
+    return np.array([
+        len(text.split()),
+        len(text) - text.count(" "),
+        len(PAUSE_PATTERN.findall(text)),
+        1.0
+    ])
+
+def _load_calibration():
+    """Recorded chunks by voice, read from CALIBRATION_PATH on first use. Caller must hold _calibration_lock."""
+    global _calibration
+    if _calibration is None:
+        _calibration = {}
+        if os.path.exists(CALIBRATION_PATH):
+            with open(CALIBRATION_PATH, "r", encoding="utf-8") as f:
+                _calibration = json.load(f)
+    return _calibration
+
+def record_chunk_durations(
+    voice_ref: str,
+    chunks: list[tuple[str, float]]
+):
+    """
+    Add synthesized chunks to the calibration data of a voice.
+
+    Args:
+        voice_ref (str): Voice reference filename.
+        chunks (list[tuple[str, float]]): Chunk text and trimmed audio duration (s).
+    """
+    if not chunks:
+        return
+    with _calibration_lock:
+        calibration = _load_calibration()
+        samples = calibration.get(voice_ref, []) + [[text, round(seconds, 3)] for text, seconds in chunks]
+        calibration[voice_ref] = samples[-MAX_SAMPLES_PER_VOICE:]
+
+        os.makedirs(os.path.dirname(CALIBRATION_PATH), exist_ok=True)
+        tmp_path = CALIBRATION_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(calibration, f)
+        os.replace(tmp_path, CALIBRATION_PATH)
+
+def voice_weights(voice_ref: str) -> tuple[np.ndarray, int]:
+    """
+    Fit the duration model of a voice from its recorded chunks.
+
+    Args:
+        voice_ref (str): Voice reference filename.
+
+    Returns:
+        tuple[np.ndarray, int]: Model weights, see DEFAULT_WEIGHTS, and the number of chunks fitted.
+    """
+    with _calibration_lock:
+        samples = list(_load_calibration().get(voice_ref, []))
+    if not samples:
+        return DEFAULT_WEIGHTS, 0
+
+    features = np.array([text_features(text) for text, _ in samples]) / FEATURE_SCALE
+    durations = np.array([seconds for _, seconds in samples])
+
+    # Ridge regression toward the default weights on scaled features: (XᵀX + λI) w = Xᵀy + λ w₀
+    ridge = RIDGE_STRENGTH * np.eye(len(DEFAULT_WEIGHTS))
+    weights = np.linalg.solve(features.T @ features + ridge, features.T @ durations + ridge @ (DEFAULT_WEIGHTS * FEATURE_SCALE))
+    return weights / FEATURE_SCALE, len(samples)
+
+def predict_spoken_seconds(
+    chunks: list[str],
+    voice_ref: str,
+    chunk_gap_ms: int = 0
+) -> float:
+    """
+    Predict the spoken duration of text split into TTS chunks.
+
+    Args:
+        chunks (list[str]): TTS chunks, e.g. from utils.tts.get_chunks().
+        voice_ref (str): Voice reference filename.
+    Optional:
+        chunk_gap_ms (int): Silence inserted between chunks (ms).
+
+    Returns:
+        float: Predicted duration (s).
+    """
+    chunks = list(chunks)
+    if not chunks:
+        return 0.0
+    weights, _ = voice_weights(voice_ref)
+    chunk_seconds = np.maximum(np.array([text_features(chunk) for chunk in chunks]) @ weights, 0.0)
+    return float(chunk_seconds.sum() + chunk_gap_ms / 1000 * (len(chunks) - 1))
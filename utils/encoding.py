@@ -0,0 +1,174 @@
+import os, re, subprocess, time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.tracing import span
+
+"""
+Episode audio encoders. A rendition is a dict with a "codec" and a "quality":
+    {"codec": "mp3", "quality": "v2"}
+    {"codec": "opus", "quality": "48k"}
+    {"codec": "aac", "quality": "64k"}
+MP3 supports the VBR/CBR levels in MP3_QUALITIES. Opus and AAC take a bitrate.
+"""
+
+# Supported MP3 quality levels: VBR (v0, v2) or CBR bitrates
+MP3_QUALITIES = {"v0", "v2", "64k", "192k", "320k"}
+
+# File extension and MIME type for each supported codec
+CODEC_FORMATS = {
+    "mp3": (".mp3", "audio/mpeg"),
+    "opus": (".opus", "audio/ogg"),
+    "aac": (".m4a", "audio/mp4")
+}
+
+# Maximum number of encoders run at once
+MAX_ENCODE_WORKERS = 4
+
+def mp3_encoder_args(quality):
+    """
+    Build ffmpeg LAME encoder arguments for an MP3 quality level.
+
+    Args:
+        quality (str): Supports: v0, v2, 64k, 192k, 320k
+
+    Returns:
+        list[str]: ffmpeg output arguments for the audio codec.
+    """
+
+    # Validate MP3 quality level
+    if quality not in MP3_QUALITIES:
+        raise ValueError(f"Invalid quality level: {quality}. Supported values: {MP3_QUALITIES}")
+
+    if quality.startswith("v"):
+        # Variable Bit Rate (VBR), 0 = highest, 9 = lowest
+        return ["-codec:a", "libmp3lame", "-q:a", quality[1:]]
+
+    # Constant Bit Rate (CBR), e.g. 192k, 320k
+    return ["-codec:a", "libmp3lame", "-b:a", quality]
+
+def encoder_args(codec, quality):
+    """
+    Build ffmpeg encoder arguments for a rendition.
+
+    Args:
+        codec (str): Supports: mp3, opus, aac
+        quality (str): MP3 quality level, or bitrate for Opus and AAC (e.g. 48k).
+
+    Returns:
+        list[str]: ffmpeg output arguments for the audio codec.
+    """
+    if codec not in CODEC_FORMATS:
+        raise ValueError(f"Invalid codec: {codec}. Supported values: {set(CODEC_FORMATS)}")
+
+    if codec == "mp3":
+        return mp3_encoder_args(quality)
+
+    if not re.fullmatch(r"\d+k", quality):
+        raise ValueError(f"Invalid {codec} bitrate: {quality}. Expected a bitrate such as 48k")
+
+    if codec == "opus":
+        return ["-codec:a", "libopus", "-b:a", quality]
+
+    # AAC in an MP4 container, with the index up front for progressive playback
+    return ["-codec:a", "aac", "-b:a", quality, "-movflags", "+faststart"]
+
+def rendition_path(output_base, codec, quality):
+    """
+    Output path for a rendition.
+
+    Args:
+        output_base (str): Output path without extension, e.g. ./tts_output
+        codec (str): Rendition codec.
+        quality (str): Rendition quality.
+
+    Returns:
+        str: Output file path, e.g. ./tts_output_opus_48k.opus
+    """
+    extension = CODEC_FORMATS[codec][0]
+    return f"{output_base}_{codec}_{quality}{extension}"
+
+def encode_rendition(source_file, codec, quality, output_base=None, metadata_file=None):
+    """
+    Encode one rendition of an audio file with ffmpeg.
+
+    Args:
+        source_file (str): Path to the source audio file, e.g. a mastered WAV.
+        codec (str): Supports: mp3, opus, aac
+        quality (str): MP3 quality level, or bitrate for Opus and AAC.
+    Optional:
+        output_base (str): Output path without extension. Defaults to the source path.
+        metadata_file (str): ffmpeg metadata file with chapters, see utils.chapters.write_ffmetadata().
+
+    Returns:
+        dict: Rendition details: "codec", "quality", "path", "mime_type",
+            "size" (bytes) and "encode_s" (encode time in seconds).
+    """
+    args = encoder_args(codec, quality)
+    if output_base is None:
+        output_base = os.path.splitext(source_file)[0]
+    output_path = rendition_path(output_base, codec, quality)
+
+    # Chapters are read from a second input that has no streams
+    metadata_args = ["-i", metadata_file, "-map", "0:a", "-map_chapters", "1"] if metadata_file else []
+
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-loglevel", "error",
+        "-i", source_file,
+        *metadata_args,
+        *args,
+        "-y", # Overwrite output file if it exists
+        output_path
+    ]
+
+    start = time.perf_counter()
+    try:
+        with span("ffmpeg encode", "ffmpeg", codec=codec, quality=quality):
+            subprocess.run(ffmpeg_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg command failed ({codec} {quality}): {e.stderr.decode()}")
+    encode_s = time.perf_counter() - start
+
+    return {
+        "codec": codec,
+        "quality": quality,
+        "path": os.path.abspath(output_path),
+        "mime_type": CODEC_FORMATS[codec][1],
+        "size": os.path.getsize(output_path),
+        "encode_s": encode_s
+    }
+
+def encode_renditions(source_file, renditions, output_base=None, max_workers=MAX_ENCODE_WORKERS, metadata_file=None):
+    """
+    Encode several renditions of one source file concurrently.
+    Each encoder is a separate ffmpeg process, so encodes run in parallel
+    across CPU cores while this process only waits on them.
+
+    Args:
+        source_file (str): Path to the source audio file.
+        renditions (list[dict]): Renditions to encode, each with "codec" and "quality".
+    Optional:
+        output_base (str): Output path without extension. Defaults to the source path.
+        max_workers (int): Maximum number of encoders run at once.
+        metadata_file (str): ffmpeg metadata file with chapters, added to every rendition.
+
+    Returns:
+        list[dict]: Rendition details in the same order as renditions, see encode_rendition().
+    """
+    if not os.path.exists(source_file):
+        raise FileNotFoundError(f"Input file not found: {source_file}")
+
+    # Validate every rendition before starting any encoder
+    for rendition in renditions:
+        encoder_args(rendition["codec"], rendition["quality"])
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(renditions)))) as executor:
+        futures = [
+            executor.submit(encode_rendition, source_file, rendition["codec"], rendition["quality"], output_base, metadata_file)
+            for rendition in renditions
+        ]
+        results = [future.result() for future in futures]
+
+    for result in results:
+        print(f"Encoded {result['codec']} ({result['quality']}): {result['size'] / 1e6:.1f} MB in {result['encode_s']:.1f}s")
+    return results
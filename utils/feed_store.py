@@ -0,0 +1,476 @@
+import gzip, json, os, shutil, sqlite3
+from email.utils import formatdate, parsedate_to_datetime
+from xml.sax.saxutils import escape, quoteattr
+
+import config as c
+
+"""
+Local episode store, the source of truth for the podcast RSS feed.
+Episodes are rows in a SQLite database kept in the podcast assets directory.
+The feed XML is streamed from the rows, newest first, so publishing an
+episode never needs to download or parse the public feed.
+"""
+FEED_DB_FILENAME = "episodes.db"
+
+ITUNES_NAMESPACE = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+PODCAST_NAMESPACE = "https://podcastindex.org/namespace/1.0"
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+HISTORY_NAMESPACE = "http://purl.org/syndication/history/1.0"
+
+# Media type of Podcasting 2.0 JSON chapters, see utils.chapters.write_chapters_json()
+CHAPTERS_TYPE = "application/json+chapters"
+
+"""
+The main feed holds the newest FEED_WINDOW_SIZE episodes. Older episodes are
+written to archive pages of the same size, numbered from the oldest, and linked
+with RFC 5005 paging relations. Full archive pages only change when an episode
+older than their newest episode is added, e.g. by a backfill or when the store
+is reconciled with the public feed. Each paged file set keeps the earliest
+publication time added since it was last written (meta key DIRTY_FROM_PREFIX +
+filename), and every page from that point on is rewritten.
+"""
+FEED_WINDOW_SIZE = 100
+
+# Number of episodes per page of the web player's JSON episode index
+JSON_INDEX_PAGE_SIZE = 20
+
+DIRTY_FROM_PREFIX = "dirty_from:"
+
+def _connect():
+    """Open the episode store, creating its tables if needed."""
+    db_path = os.path.join(c.PODCAST_ASSETS_DIRECTORY, FEED_DB_FILENAME)
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS episodes (
+            guid TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            link TEXT,
+            duration INTEGER,
+            image TEXT,
+            pub_ts REAL NOT NULL,
+            enclosure_url TEXT NOT NULL,
+            enclosure_type TEXT NOT NULL,
+            enclosure_length INTEGER,
+            alternates TEXT,
+            chapters_url TEXT
+        )
+    """)
+    # Stores created before chapters were published have no chapters_url column
+    if "chapters_url" not in {row["name"] for row in connection.execute("PRAGMA table_info(episodes)")}:
+        connection.execute("ALTER TABLE episodes ADD COLUMN chapters_url TEXT")
+    connection.execute("CREATE INDEX IF NOT EXISTS episodes_pub_ts ON episodes (pub_ts DESC)")
+    connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    return connection
+
+def add_episode(
+    guid: str,
+    title: str,
+    duration: int,
+    image: str,
+    pub_ts: float,
+    enclosure_url: str,
+    enclosure_type: str = "audio/mpeg",
+    enclosure_length: int = None,
+    alternates: list[dict] = None,
+    chapters_url: str = None
+) -> bool:
+    """
+    Add an episode to the store. Episodes with an existing guid are ignored.
+
+    Args:
+        guid (str): Unique episode ID, the episode URL.
+        title (str): Episode title.
+        duration (int): Episode duration (s).
+        image (str): Episode image URL.
+        pub_ts (float): Publication time (Unix timestamp).
+        enclosure_url (str): Episode audio URL.
+    Optional:
+        enclosure_type (str): Episode audio MIME type.
+        enclosure_length (int): Episode audio size (bytes).
+        alternates (list[dict]): Alternate enclosures, each with "url", "type" and "length".
+        chapters_url (str): Podcasting 2.0 JSON chapters URL.
+
+    Returns:
+        bool: True if the episode was added.
+    """
+    with _connect() as connection:
+        cursor = connection.execute(
+            "INSERT OR IGNORE INTO episodes (guid, title, link, duration, image, pub_ts, enclosure_url,"
+            " enclosure_type, enclosure_length, alternates, chapters_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (guid, title, guid, duration, image, pub_ts, enclosure_url, enclosure_type,
+             enclosure_length, json.dumps(alternates) if alternates else None, chapters_url)
+        )
+        # Pages from this episode on move, see _archive_pages_to_write()
+        if cursor.rowcount == 1:
+            connection.execute(
+                "UPDATE meta SET value = ? WHERE key LIKE ? AND (value = '' OR CAST(value AS REAL) > ?)",
+                (repr(float(pub_ts)), DIRTY_FROM_PREFIX + "%", float(pub_ts))
+            )
+    connection.close()
+    return cursor.rowcount == 1
+
+def import_feed_items(rss_tree) -> int:
+    """
+    Add episodes from a parsed RSS feed that are missing from the store.
+
+    Args:
+        rss_tree (ElementTree): XML element tree of a podcast RSS feed.
+
+    Returns:
+        int: Number of episodes added.
+    """
+    added = 0
+    for item in rss_tree.findall(".//item"):
+        guid = item.findtext("guid")
+        enclosure = item.find("enclosure")
+        if not guid or enclosure is None:
+            continue
+
+        pub_date = item.findtext("pubDate")
+        duration = item.findtext(f"{{{ITUNES_NAMESPACE}}}duration")
+        length = enclosure.get("length")
+
+        alternates = []
+        for alternate in item.findall(f"{{{PODCAST_NAMESPACE}}}alternateEnclosure"):
+            source = alternate.find(f"{{{PODCAST_NAMESPACE}}}source")
+            if source is not None and alternate.get("default") != "true":
+                alternates.append({
+                    "url": source.get("uri"),
+                    "type": alternate.get("type"),
+                    "length": int(alternate.get("length", 0))
+                })
+
+        chapters = item.find(f"{{{PODCAST_NAMESPACE}}}chapters")
+
+        added += add_episode(
+            guid,
+            item.findtext("title", ""),
+            int(duration) if duration and duration.isdigit() else None,
+            item.findtext(f"{{{ITUNES_NAMESPACE}}}image"),
+            parsedate_to_datetime(pub_date).timestamp() if pub_date else 0.0,
+            enclosure.get("url"),
+            enclosure.get("type", "audio/mpeg"),
+            int(length) if length and length.isdigit() else None,
+            alternates,
+            chapters.get("url") if chapters is not None else None
+        )
+    return added
+
+def episode_count() -> int:
+    """Number of episodes in the store."""
+    with _connect() as connection:
+        count = connection.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+    connection.close()
+    return count
+
+def iter_episodes(
+    limit: int = None,
+    offset: int = 0
+):
+    """
+    Iterate over stored episodes, newest first.
+
+    Optional:
+        limit (int): Maximum number of episodes. All episodes if None.
+        offset (int): Number of newest episodes to skip.
+
+    Returns:
+        Iterator[dict]: Episode rows, with "alternates" decoded to a list.
+    """
+    connection = _connect()
+    try:
+        rows = connection.execute(
+            "SELECT * FROM episodes ORDER BY pub_ts DESC LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset)
+        )
+        for row in rows:
+            episode = dict(row)
+            episode["alternates"] = json.loads(episode["alternates"]) if episode["alternates"] else []
+            yield episode
+    finally:
+        connection.close()
+
+def get_meta(key: str) -> str:
+    """Read a value from the store's metadata table, or None if unset."""
+    with _connect() as connection:
+        row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    connection.close()
+    return row[0] if row else None
+
+def set_meta(key: str, value: str):
+    """Write a value to the store's metadata table."""
+    with _connect() as connection:
+        connection.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+    connection.close()
+
+def feed_xml_chunks(episodes, links=None, archive=False):
+    """
+    Stream a podcast RSS feed as XML text.
+
+    Args:
+        episodes (Iterable[dict]): Episode rows, newest first, see iter_episodes().
+    Optional:
+        links (list[tuple[str, str]]): Feed paging links as (relation, URL) pairs,
+            e.g. ("self", ...), ("prev-archive", ...).
+        archive (bool): Mark the feed as an archive page (RFC 5005).
+
+    Returns:
+        Iterator[str]: Pieces of the feed XML document, in order.
+    """
+    yield "<?xml version='1.0' encoding='utf-8'?>\n"
+    yield (
+        f'<rss xmlns:itunes="{ITUNES_NAMESPACE}" xmlns:podcast="{PODCAST_NAMESPACE}"'
+        f' xmlns:atom="{ATOM_NAMESPACE}" xmlns:fh="{HISTORY_NAMESPACE}" version="2.0">'
+    )
+    yield "<channel>"
+
+    # Feed paging and archive relations
+    for relation, url in links or []:
+        yield f'<atom:link rel={quoteattr(relation)} href={quoteattr(url)} type="application/rss+xml" />'
+    if archive:
+        yield "<fh:archive />"
+
+    # Podcast details
+    yield f"<title>{escape(c.PODCAST_TITLE)}</title>"
+    yield f"<link>{escape(c.PODCAST_CLOUD_REPO)}</link>"
+    yield f"<description>{escape(c.PODCAST_DESCRIPTION)}</description>"
+    yield "<language>en-us</language>"
+
+    # Podcast image
+    yield "<image>"
+    yield f"<url>{escape(c.PODCAST_CLOUD_REPO + c.PODCAST_MAIN_IMAGE_URL)}</url>"
+    yield f"<title>{escape(c.PODCAST_TITLE)}</title>"
+    yield f"<link>{escape(c.PODCAST_CLOUD_REPO)}</link>"
+    yield "</image>"
+
+    for episode in episodes:
+        yield _item_xml(episode)
+
+    yield "</channel></rss>"
+
+def _item_xml(episode):
+    """Serialize one episode row as an RSS <item> element."""
+    parts = ["<item>", f"<title>{escape(episode['title'])}</title>"]
+    if episode["duration"] is not None:
+        parts.append(f"<itunes:duration>{episode['duration']}</itunes:duration>")
+    if episode["image"]:
+        parts.append(f"<itunes:image>{escape(episode['image'])}</itunes:image>")
+    parts.append(f"<link>{escape(episode['link'])}</link>")
+    parts.append(f"<guid>{escape(episode['guid'])}</guid>")
+
+    # Requires RFC 2822-compliant date string (formatted with email.utils)
+    parts.append(f"<pubDate>{formatdate(timeval=episode['pub_ts'], usegmt=True)}</pubDate>")
+
+    length = f" length={quoteattr(str(episode['enclosure_length']))}" if episode["enclosure_length"] is not None else ""
+    parts.append(f"<enclosure url={quoteattr(episode['enclosure_url'])}{length} type={quoteattr(episode['enclosure_type'])} />")
+
+    # List every rendition, with the main enclosure as the default
+    if episode["alternates"]:
+        renditions = [{"url": episode["enclosure_url"], "type": episode["enclosure_type"], "length": episode["enclosure_length"] or 0}]
+        for i, rendition in enumerate(renditions + episode["alternates"]):
+            default = ' default="true"' if i == 0 else ""
+            parts.append(
+                f"<podcast:alternateEnclosure type={quoteattr(rendition['type'])} length={quoteattr(str(rendition['length']))}{default}>"
+                f"<podcast:source uri={quoteattr(rendition['url'])} />"
+                "</podcast:alternateEnclosure>"
+            )
+
+    if episode["chapters_url"]:
+        parts.append(f'<podcast:chapters url={quoteattr(episode["chapters_url"])} type="{CHAPTERS_TYPE}" />')
+
+    parts.append("</item>")
+    return "".join(parts)
+
+def write_feed(output_path: str):
+    """
+    Write the podcast RSS feed for all stored episodes to a file.
+
+    Args:
+        output_path (str): Path to the RSS feed XML file.
+    """
+    _write_chunks(output_path, feed_xml_chunks(iter_episodes()))
+
+def archive_filename(rss_filename: str, page: int) -> str:
+    """
+    Filename of a feed archive page, e.g. podcast.xml -> podcast-archive-1.xml
+
+    Args:
+        rss_filename (str): Main feed filename.
+        page (int): Archive page number, 1 is the oldest page.
+
+    Returns:
+        str: Archive page filename.
+    """
+    stem, extension = os.path.splitext(rss_filename)
+    return f"{stem}-archive-{page}{extension}"
+
+def write_feed_pages(
+    output_dir: str,
+    rss_filename: str,
+    base_url: str,
+    window: int = FEED_WINDOW_SIZE
+) -> list[tuple[str, bool]]:
+    """
+    Write the main podcast feed with the newest episodes, plus archive pages
+    for older episodes. Only archive pages that are new, or that can have changed
+    since the last run (the two newest, and any page after a back-dated episode),
+    are written, so the work per run does not grow with the archive.
+
+    Args:
+        output_dir (str): Directory for the feed files.
+        rss_filename (str): Main feed filename.
+        base_url (str): Public URL of the directory the feeds are served from.
+    Optional:
+        window (int): Number of episodes in the main feed and in each archive page.
+
+    Returns:
+        list[tuple[str, bool]]: (path, complete) for each file written, main feed first.
+            complete is True for full archive pages, which only change after a back-dated episode.
+    """
+    total = episode_count()
+    pages = _archive_page_count(total, window)
+
+    def url(page):
+        return f"{base_url}/{archive_filename(rss_filename, page) if page else rss_filename}"
+
+    # Main feed: newest episodes, linking to the newest archive page
+    main_path = os.path.join(output_dir, rss_filename)
+    links = [("self", url(0))]
+    if pages:
+        links.append(("prev-archive", url(pages)))
+    _write_chunks(main_path, feed_xml_chunks(iter_episodes(limit=window), links))
+    written = [(main_path, False)]
+
+    for page, limit, offset in _archive_pages_to_write(total, window, output_dir, rss_filename):
+        links = [("self", url(page)), ("current", url(0))]
+        if page > 1:
+            links.append(("prev-archive", url(page - 1)))
+        if page < pages:
+            links.append(("next-archive", url(page + 1)))
+
+        page_path = os.path.join(output_dir, archive_filename(rss_filename, page))
+        episodes = iter_episodes(limit=limit, offset=offset)
+        _write_chunks(page_path, feed_xml_chunks(episodes, links, archive=True))
+        written.append((page_path, limit == window))
+
+    set_meta(DIRTY_FROM_PREFIX + rss_filename, "")
+    return written
+
+def write_json_index_pages(
+    output_dir: str,
+    index_filename: str,
+    page_size: int = JSON_INDEX_PAGE_SIZE
+) -> list[tuple[str, bool]]:
+    """
+    Write a compact JSON episode index for the web player, paged like the feed.
+    The main index holds the newest episodes and names the next (older) page
+    in "next". Older pages are numbered from the oldest, and full pages only change
+    after a back-dated episode.
+
+        {"title": ..., "image": ..., "next": "podcast-archive-3.json",
+         "episodes": [{"title", "date", "duration", "url", "image"}, ...]}
+
+    Args:
+        output_dir (str): Directory for the index files.
+        index_filename (str): Main index filename, e.g. podcast.json
+    Optional:
+        page_size (int): Number of episodes per index page.
+
+    Returns:
+        list[tuple[str, bool]]: (path, complete) for each file written, main index first.
+            complete is True for full archive pages, which only change after a back-dated episode.
+    """
+    total = episode_count()
+    pages = _archive_page_count(total, page_size)
+
+    def write_page(path, episodes, next_page):
+        index = {
+            "title": c.PODCAST_TITLE,
+            "image": c.PODCAST_CLOUD_REPO + c.PODCAST_MAIN_IMAGE_URL,
+            "next": archive_filename(index_filename, next_page) if next_page else None,
+            "episodes": [
+                {
+                    "title": episode["title"],
+                    "date": int(episode["pub_ts"]),
+                    "duration": episode["duration"],
+                    "url": episode["enclosure_url"],
+                    "image": episode["image"]
+                }
+                for episode in episodes
+            ]
+        }
+        _write_chunks(path, [json.dumps(index, separators=(",", ":"))])
+
+    main_path = os.path.join(output_dir, index_filename)
+    write_page(main_path, iter_episodes(limit=page_size), pages)
+    written = [(main_path, False)]
+
+    for page, limit, offset in _archive_pages_to_write(total, page_size, output_dir, index_filename):
+        page_path = os.path.join(output_dir, archive_filename(index_filename, page))
+        write_page(page_path, iter_episodes(limit=limit, offset=offset), page - 1)
+        written.append((page_path, limit == page_size))
+
+    set_meta(DIRTY_FROM_PREFIX + index_filename, "")
+    return written
+
+def _archive_page_count(total, window):
+    """Number of archive pages needed for the episodes beyond the newest window."""
+    return -(-max(0, total - window) // window)
+
+def _archive_pages_to_write(total, window, output_dir, filename):
+    """
+    Archive pages that need writing: pages missing from output_dir, the two
+    newest pages, which change as episodes move out of the main window, and
+    every page from the oldest episode added since the pages were last written.
+    Page N holds chronological episodes [(N - 1) * window, N * window).
+    Pages written before changes were tracked for filename are all rewritten once.
+
+    Returns:
+        Iterator[tuple[int, int, int]]: (page, limit, offset) for iter_episodes().
+    """
+    archived = max(0, total - window)
+    pages = _archive_page_count(total, window)
+
+    dirty_from = get_meta(DIRTY_FROM_PREFIX + filename)
+    if dirty_from is None:
+        first_dirty = 1
+    elif dirty_from == "":
+        first_dirty = pages + 1
+    else:
+        with _connect() as connection:
+            older = connection.execute("SELECT COUNT(*) FROM episodes WHERE pub_ts < ?", (float(dirty_from),)).fetchone()[0]
+        connection.close()
+        first_dirty = older // window + 1
+
+    for page in range(1, pages + 1):
+        page_path = os.path.join(output_dir, archive_filename(filename, page))
+        if page < min(pages - 1, first_dirty) and os.path.exists(page_path):
+            continue
+        page_end = min(page * window, archived)
+        yield page, page_end - (page - 1) * window, total - page_end
+
+def gzip_feed(feed_path: str) -> str:
+    """
+    Write a gzip-compressed copy of a feed or index file next to it (.gz suffix).
+    The gzip header timestamp is fixed, so unchanged feeds compress to identical bytes.
+
+    Args:
+        feed_path (str): Path to the feed XML or JSON index file.
+
+    Returns:
+        str: Path to the compressed file.
+    """
+    gz_path = feed_path + ".gz"
+    with open(feed_path, "rb") as src, open(gz_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=9, mtime=0) as dst:
+            shutil.copyfileobj(src, dst)
+    return gz_path
+
+def _write_chunks(output_path, chunks):
+    """Write text chunks to a file, replacing it atomically."""
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, output_path)
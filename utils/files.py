@@ -0,0 +1,21 @@
+import hashlib
+
+"""
+Filesystem helpers shared across the pipeline.
+"""
+
+def file_hash(file_path: str) -> str:
+    """
+    SHA-256 hash of a file's contents.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -1,9 +1,9 @@
-import re, random, time
-import openai
+import re, random, threading, time
 from typing import Literal
 
 import config as c
 from utils.news import NewsStory
+from utils.tracing import span
 
 """
 Multiple retries are made if LLM API calls fail. This accounts
@@ -13,6 +13,59 @@ The time to wait between retries (RETRY_INTERVAL) is given in seconds.
 MAX_RETRIES = 5
 RETRY_INTERVAL = 1
 
+# OpenAI API client, created on first use and kept so its connection pool stays warm
+_client = None
+_client_key = None
+_client_lock = threading.Lock()
+
+def get_llm_client():
+    """
+    Get the OpenAI API client for llama.cpp. The openai package is imported on
+    first use. A new client is created if the API base URL or key has changed.
+    """
+    global _client, _client_key
+    with _client_lock:
+        if _client is None or _client_key != (c.LLAMA_CPP_BASE_URL, c.LLAMA_CPP_API_KEY):
+            import openai
+            _client = openai.OpenAI(
+                base_url= c.LLAMA_CPP_BASE_URL,
+                api_key = c.LLAMA_CPP_API_KEY
+            )
+            _client_key = (c.LLAMA_CPP_BASE_URL, c.LLAMA_CPP_API_KEY)
+        return _client
+
+# Reasoning blocks of reasoning models, with any tag name casing, attributes or spacing
+REASONING_TAGS = "think|thinking|reasoning"
+REASONING_BLOCK_PATTERN = re.compile(rf"<\s*({REASONING_TAGS})\b[^>]*>.*?<\s*/\s*\1\s*>", re.DOTALL | re.IGNORECASE)
+REASONING_OPEN_PATTERN = re.compile(rf"<\s*({REASONING_TAGS})\b[^>]*>", re.IGNORECASE)
+REASONING_CLOSE_PATTERN = re.compile(rf"<\s*/\s*({REASONING_TAGS})\s*>", re.IGNORECASE)
+
+def strip_reasoning(text: str) -> str:
+    """
+    Remove reasoning blocks from LLM output. Handles closed blocks, a closing
+    tag without an opening tag (the opening tag was part of the chat template),
+    and an opening tag that is never closed (output cut off while reasoning).
+
+    Args:
+        text (str): LLM output.
+
+    Returns:
+        str: LLM output without reasoning.
+    """
+    text = REASONING_BLOCK_PATTERN.sub("", text or "")
+
+    # Everything before a stray closing tag is reasoning
+    closing = list(REASONING_CLOSE_PATTERN.finditer(text))
+    if closing:
+        text = text[closing[-1].end():]
+
+    # Everything after an unclosed opening tag is reasoning
+    opening = REASONING_OPEN_PATTERN.search(text)
+    if opening:
+        text = text[:opening.start()]
+
+    return text.strip()
+
 def llama_cpp_summarize_text(
     system_prompt: str,
     summary_prompt: str,
@@ -36,21 +89,18 @@ def llama_cpp_summarize_text(
     while retries < MAX_RETRIES:
         try:
             print("Summarizing text with llama.cpp...")
-            client = openai.OpenAI(
-                base_url= c.LLAMA_CPP_BASE_URL,
-                api_key = c.LLAMA_CPP_API_KEY
-            )
-            completion = client.chat.completions.create(
-                model="",
-                messages=[
-                    {"role": "system", "content": f'''{system_prompt}'''},
-                    {"role": "user", "content": f'''{summary_prompt}{text}'''}
-                ]
-            )
+            client = get_llm_client()
+            with span("llm summarize", "llm", chars=len(text)):
+                completion = client.chat.completions.create(
+                    model="",
+                    messages=[
+                        {"role": "system", "content": f'''{system_prompt}'''},
+                        {"role": "user", "content": f'''{summary_prompt}{text}'''}
+                    ]
+                )
             
             # Capture LLM output and remove <think> block(s) from reasoning model
-            llm_output = completion.choices[0].message.content
-            llm_output = re.sub(r"<think>.*?</think>.", '', llm_output, flags=re.DOTALL)
+            llm_output = strip_reasoning(completion.choices[0].message.content)
             
             return llm_output
 
@@ -107,38 +157,35 @@ def llama_cpp_news_segment_concurrent(
     while retries < MAX_RETRIES:
         try:
             print(f"Building news segment llama.cpp (concurrent, {build_mode})...")
-            client = openai.OpenAI(
-                base_url= c.LLAMA_CPP_BASE_URL,
-                api_key = c.LLAMA_CPP_API_KEY
-            )
+            client = get_llm_client()
             
             if build_mode == "character":
-                completion = client.chat.completions.create(
-                    model="",
-                    messages=[
-                        {"role": "system", "content": f'''{system_prompt}'''},
-                        {"role": "user", "content": f'''{segment_prompt}{"\n\n".join(character_summaries)}'''}
-                    ]
-                )
+                with span("llm segment", "llm", stories=len(news_stories)):
+                    completion = client.chat.completions.create(
+                        model="",
+                        messages=[
+                            {"role": "system", "content": f'''{system_prompt}'''},
+                            {"role": "user", "content": f'''{segment_prompt}{"\n\n".join(character_summaries)}'''}
+                        ]
+                    )
 
                 # Capture output and remove <think> block(s) from reasoning model
-                llm_output = completion.choices[0].message.content
-                llm_output = re.sub(r"<think>.*?</think>.", '', llm_output, flags=re.DOTALL)
+                llm_output = strip_reasoning(completion.choices[0].message.content)
                 news_segment += llm_output
                 
                 return news_segment
             elif build_mode == "normal":
-                completion = client.chat.completions.create(
-                    model="",
-                    messages=[
-                        {"role": "system", "content": f'''{system_prompt}'''},
-                        {"role": "user", "content": f'''{segment_prompt}{"\n\n".join(normal_summaries)}'''}
-                    ]
-                )
+                with span("llm segment", "llm", stories=len(news_stories)):
+                    completion = client.chat.completions.create(
+                        model="",
+                        messages=[
+                            {"role": "system", "content": f'''{system_prompt}'''},
+                            {"role": "user", "content": f'''{segment_prompt}{"\n\n".join(normal_summaries)}'''}
+                        ]
+                    )
                 
                 # Capture output and remove <think> block(s) from reasoning model
-                llm_output = completion.choices[0].message.content
-                llm_output = re.sub(r"<think>.*?</think>.", '', llm_output, flags=re.DOTALL)
+                llm_output = strip_reasoning(completion.choices[0].message.content)
                 news_segment += llm_output
                 
                 return news_segment
@@ -174,8 +221,31 @@ def llama_cpp_news_segment_iterative(
     Returns:
         str: Full news segment text.
     """
+    parts = llama_cpp_news_segment_parts(system_prompt, intro_prompt, outro_prompt, news_stories)
+    return "\n\n".join(part["text"] for part in parts)
+
+def llama_cpp_news_segment_parts(
+    system_prompt: str,
+    intro_prompt: str,
+    outro_prompt: str,
+    news_stories: list[NewsStory]
+) -> list[dict]:
+    """
+    Builds the parts of an iterative news segment with llama.cpp via the OpenAI API:
+    a generated intro, each story's character summary with a randomized transition,
+    and a generated outro. Used for chapters, see utils/chapters.py.
+    Multiple retries are made if API calls fail.
+
+    Args:
+        system_prompt (str): User-defined system prompt.
+        intro_prompt (str): User-defined prompt to generate news segment intro.
+        outro_prompt (str): User-defined prompt to generate news segment outtro.
+        news_stories (list[NewsStory]): A list of NewsStory objects to process.
+
+    Returns:
+        list[dict]: Segment parts in playback order, each with "title" and "text".
+    """
     
-    news_segment = ''
     character_summaries = [story.summary_character for story in news_stories]
 
     # Check for empty character summaries and raise an error if found
@@ -186,54 +256,47 @@ def llama_cpp_news_segment_iterative(
     while retries < MAX_RETRIES:
         try:
             print("Building news segment with llama.cpp (iterative)...")
-            client = openai.OpenAI(
-                base_url= c.LLAMA_CPP_BASE_URL,
-                api_key = c.LLAMA_CPP_API_KEY
-            )
+            client = get_llm_client()
             
             # Intro creation
-            completion = client.chat.completions.create(
-            model="",
-            messages=[
-                {"role": "system", "content": f'''{system_prompt}'''},
-                {"role": "user", "content": f'''{intro_prompt}{"\n\n".join(character_summaries)}'''}
-            ]
-            )
+            with span("llm intro", "llm", stories=len(news_stories)):
+                completion = client.chat.completions.create(
+                model="",
+                messages=[
+                    {"role": "system", "content": f'''{system_prompt}'''},
+                    {"role": "user", "content": f'''{intro_prompt}{"\n\n".join(character_summaries)}'''}
+                ]
+                )
 
             # Capture output and remove <think> block(s) from reasoning model
-            llm_output = completion.choices[0].message.content
-            llm_output = re.sub(r"<think>.*?</think>.", '', llm_output, flags=re.DOTALL)
-            news_segment += llm_output + "\n\n"
+            parts = [{"title": "Intro", "text": strip_reasoning(completion.choices[0].message.content)}]
 
-            # News story character summary aggregation
+            # News story character summaries, one part per story
             count = 0
-            for summary in character_summaries:
+            for story, summary in zip(news_stories, character_summaries):
                 if count == 0:
-                    news_segment += random.choice(["First, ", "Firstly, ", "First up, ", "To kick things off, "])
-                    news_segment += summary + "\n\n"
+                    transition = random.choice(["First, ", "Firstly, ", "First up, ", "To kick things off, "])
                 elif count < (len(character_summaries) - 1):
-                    news_segment += random.choice(["In other news, ", "Meanwhile, ", "Moving on, ", "Elsewhere, ", "Turning to our next story, "])
-                    news_segment += summary + "\n\n"
+                    transition = random.choice(["In other news, ", "Meanwhile, ", "Moving on, ", "Elsewhere, ", "Turning to our next story, "])
                 else:
-                    news_segment += random.choice(["Lastly, ", "Finally, ", "In our final story, "])
-                    news_segment += summary + "\n\n"
+                    transition = random.choice(["Lastly, ", "Finally, ", "In our final story, "])
+                parts.append({"title": story.title, "text": transition + summary})
                 count += 1
 
             # Outro creation
-            completion = client.chat.completions.create(
-            model="",
-            messages=[
-                {"role": "system", "content": f'''{system_prompt}'''},
-                {"role": "user", "content": f'''{outro_prompt}{"\n\n".join(character_summaries)}'''}
-            ]
-            )
+            with span("llm outro", "llm", stories=len(news_stories)):
+                completion = client.chat.completions.create(
+                model="",
+                messages=[
+                    {"role": "system", "content": f'''{system_prompt}'''},
+                    {"role": "user", "content": f'''{outro_prompt}{"\n\n".join(character_summaries)}'''}
+                ]
+                )
             
             # Capture output and remove <think> block(s) from reasoning model
-            llm_output = completion.choices[0].message.content
-            llm_output = re.sub(r"<think>.*?</think>.", '', llm_output, flags=re.DOTALL)
-            news_segment += llm_output
+            parts.append({"title": "Outro", "text": strip_reasoning(completion.choices[0].message.content)})
             
-            return news_segment
+            return parts
         
         except Exception as e:
             print(f"Attempt {retries + 1} failed: {e}")
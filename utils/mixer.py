@@ -0,0 +1,220 @@
+import os, subprocess, tempfile, threading, wave
+import numpy as np
+
+import config as c
+from utils.files import file_hash
+from utils.tracing import span
+
+"""
+In-process background music mixer.
+Background tracks (beds) are decoded once per sample rate and cached as
+memory-mappable NumPy arrays, keyed by a hash of the track contents.
+Mixing is done with vectorized NumPy operations, one block at a time,
+so the mixed episode can be streamed straight to an encoder.
+Episodes are mixed at the output rate (MIX_SAMPLE_RATE). Speech at a lower
+rate is resampled up by ffmpeg as it is read, so music keeps its full band.
+"""
+BED_CACHE_DIR = "./cache/beds"
+MIX_SAMPLE_RATE = 44100
+
+# Number of frames mixed per output block
+MIX_BLOCK_FRAMES = 65536
+
+# Speech read short of its expected length by more than this (s) means the TTS file is damaged
+MAX_SPEECH_SHORTFALL_S = 0.1
+
+# Held while a bed is decoded, so concurrent mixes decode and write each cache entry once
+_bed_cache_lock = threading.Lock()
+
+def load_bed(
+    bg_track: str,
+    sample_rate: int
+) -> np.ndarray:
+    """
+    Load a background track as stereo float32 samples at the given sample rate.
+    The first request decodes and resamples the track with ffmpeg and caches the
+    result in BED_CACHE_DIR. Later requests memory-map the cached array.
+
+    Args:
+        bg_track (str): Background track filename, relative to BG_TRACKS_DIR.
+        sample_rate (int): Sample rate (Hz) to decode to.
+
+    Returns:
+        np.ndarray: Read-only samples shaped (frames, 2).
+    """
+    bg_track_path = os.path.join(c.BG_TRACKS_DIR, bg_track)
+    if not os.path.exists(bg_track_path):
+        raise FileNotFoundError(f"Background track file not found: {bg_track_path}")
+
+    cache_path = os.path.join(BED_CACHE_DIR, f"{file_hash(bg_track_path)}_{sample_rate}.npy")
+    with _bed_cache_lock:
+        _decode_bed(bg_track, bg_track_path, cache_path, sample_rate)
+
+    return np.load(cache_path, mmap_mode="r")
+
+def _decode_bed(bg_track, bg_track_path, cache_path, sample_rate):
+    """Decode a background track to a cache entry, or mark an existing entry as used. Caller must hold _bed_cache_lock."""
+    if not os.path.exists(cache_path):
+        print(f"Decoding background track: {bg_track}")
+        ffmpeg_cmd = [
+            "ffmpeg",
+            "-i", bg_track_path,
+            "-f", "f32le",
+            "-ac", "2",
+            "-ar", str(sample_rate),
+            "pipe:1"
+        ]
+        try:
+            with span("ffmpeg decode bed", "ffmpeg", bg_track=bg_track):
+                result = subprocess.run(ffmpeg_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"ffmpeg command failed: {e.stderr.decode()}")
+
+        samples = np.frombuffer(result.stdout, dtype="<f4").reshape(-1, 2)
+
+        # Write to a temporary file first so a partial cache entry is never used
+        os.makedirs(BED_CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, samples)
+        os.replace(tmp_path, cache_path)
+
+    else:
+        # Mark the cache entry as used, for artifact retention (see utils/artifacts.py)
+        os.utime(cache_path)
+
+def mix_background(
+    tts_file: str,
+    bg_track: str,
+    tts_start_delay_ms: int,
+    fade_duration_s: int
+):
+    """
+    Mix a TTS WAV file over a background track, yielding stereo float32 blocks
+    at MIX_SAMPLE_RATE.
+
+    Background track starts at the beginning.
+    TTS audio is delayed by tts_start_delay_ms and copied to both channels.
+    Background track fades out for fade_duration_s, starting when TTS ends.
+    Output stops fade_duration_s after TTS ends (1 s when there is no fade),
+    or earlier if both inputs end first. Samples are not clipped, so a
+    loudness stage downstream sees the true mix.
+
+    Args:
+        tts_file (str): Path to the mono 16-bit TTS WAV file.
+        bg_track (str): Background track filename.
+        tts_start_delay_ms (int): Delay in milliseconds before TTS starts.
+        fade_duration_s (int): Duration of music fade-out in seconds, starting from TTS end.
+
+    Returns:
+        tuple[int, int, Iterator[np.ndarray]]: Sample rate (Hz), total output
+            frames, and an iterator of blocks shaped (frames, 2).
+    """
+    if not tts_start_delay_ms: tts_start_delay_ms = 0
+    if not fade_duration_s or fade_duration_s < 0: fade_duration_s = 0
+
+    sample_rate = MIX_SAMPLE_RATE
+    bed = load_bed(bg_track, sample_rate)
+    tts_frames, read_speech, close_speech = _open_speech(tts_file, sample_rate)
+
+    # Timings in frames
+    delay = sample_rate * tts_start_delay_ms // 1000
+    fade_start = delay + tts_frames
+    fade_length = sample_rate * fade_duration_s
+    # Pad when there is no fade, otherwise final milliseconds of TTS audio are truncated
+    total_frames = fade_start + (fade_length if fade_duration_s >= 1 else sample_rate)
+    total_frames = min(total_frames, max(len(bed), fade_start))
+
+    def blocks():
+        speech_frames = 0
+        completed = False
+        try:
+            for start in range(0, total_frames, MIX_BLOCK_FRAMES):
+                end = min(start + MIX_BLOCK_FRAMES, total_frames)
+                t = np.arange(start, end)
+
+                # Background bed with fade-out gain, silent past its end
+                mixed = np.zeros((end - start, 2), dtype=np.float32)
+                bed_end = min(end, len(bed))
+                if bed_end > start:
+                    mixed[:bed_end - start] = bed[start:bed_end]
+                if fade_length > 0:
+                    gain = np.clip(1.0 - (t - fade_start) / fade_length, 0.0, 1.0)
+                else:
+                    gain = (t < fade_start).astype(np.float32)
+                mixed *= gain[:, None].astype(np.float32)
+
+                # Delayed TTS, read in order and copied to both output channels
+                tts_start = max(start, delay)
+                tts_end = min(end, fade_start)
+                if tts_end > tts_start:
+                    speech = read_speech(tts_end - tts_start)
+                    mixed[tts_start - start:tts_start - start + len(speech)] += speech[:, None]
+                    speech_frames += len(speech)
+
+                yield mixed
+            completed = True
+        finally:
+            # Errors are only raised for a finished mix, not when the caller stops early
+            close_speech(completed)
+        if tts_frames - speech_frames > MAX_SPEECH_SHORTFALL_S * sample_rate:
+            raise RuntimeError(f"TTS audio ended early: {speech_frames} of {tts_frames} frames read from {tts_file}")
+
+    return sample_rate, total_frames, blocks()
+
+def _open_speech(tts_file, sample_rate):
+    """
+    Open a 16-bit TTS WAV for sequential reading at a sample rate, first channel only.
+    Speech at another rate is resampled by ffmpeg, streamed over a pipe.
+
+    Returns:
+        tuple: Frames at sample_rate, read(n) returning up to n float32 samples, and
+            close(check), which raises RuntimeError if check is set and ffmpeg failed.
+    """
+    with wave.open(tts_file, "rb") as w:
+        sample_width, channels, framerate, frames = w.getsampwidth(), w.getnchannels(), w.getframerate(), w.getnframes()
+    if sample_width != 2:
+        raise ValueError(f"Unsupported TTS sample width: {sample_width * 8} bit. Supported values: 16")
+
+    if framerate == sample_rate:
+        tts_wav = wave.open(tts_file, "rb")
+
+        def read(n):
+            raw = tts_wav.readframes(n)
+            return np.frombuffer(raw, dtype="<i2").reshape(-1, channels)[:, 0] / np.float32(32767.0)
+        return frames, read, lambda check: tts_wav.close()
+
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-loglevel", "error",
+        "-i", tts_file,
+        "-af", "pan=mono|c0=c0",
+        "-ar", str(sample_rate),
+        "-f", "f32le",
+        "pipe:1"
+    ]
+    processes = []
+
+    # ffmpeg starts on the first read, so an unused mix leaves no process behind
+    # stderr goes to a file, so ffmpeg cannot block on a full pipe while stdout is read
+    def read(n):
+        if not processes:
+            stderr = tempfile.TemporaryFile()
+            processes.append((subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=stderr), stderr))
+        return np.frombuffer(processes[0][0].stdout.read(n * 4), dtype="<f4")
+
+    def close(check):
+        for process, stderr in processes:
+            if check:
+                # Drain the few frames past the expected length, so ffmpeg exits cleanly
+                process.stdout.read()
+            process.stdout.close()
+            process.wait()
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace")
+            stderr.close()
+            if check and process.returncode != 0:
+                raise RuntimeError(f"ffmpeg command failed: {message}")
+
+    # The resampler output length can differ by a few frames, read() then returns fewer samples
+    return round(frames * sample_rate / framerate), read, close
@@ -1,8 +1,9 @@
 import requests
 import xml.etree.ElementTree as ET
-from newsplease import NewsPlease
 
 import config as c
+from utils.ranking import rank_candidates, strip_html
+from utils.tracing import span
 
 # HTTP headers for web requests to make them seem legit, e.g. iPhone headers
 HTTP_HEADERS = {
@@ -45,10 +46,13 @@ def fetch_news_story(
     Returns:
         list[NewsStory]: A list of NewsStory objects.
     """
-    article = NewsPlease.from_url(
-        url=article_link, 
-        request_args={'headers': HTTP_HEADERS}
-    )
+    from newsplease import NewsPlease
+
+    with span("article fetch", "news", link=article_link):
+        article = NewsPlease.from_url(
+            url=article_link, 
+            request_args={'headers': HTTP_HEADERS}
+        )
 
     story = NewsStory()
     story.title = article.title
@@ -57,46 +61,75 @@ def fetch_news_story(
 
     return story
 
+def fetch_rss_candidates(
+    rss_feed: str
+) -> list[dict]:
+    """
+    Fetch the items of an RSS feed as story candidates, without fetching articles.
+
+    Args:
+        rss_feed (str): RSS news feed URL with links to articles.
+
+    Returns:
+        list[dict]: Candidates in feed order, each with "title", "link" and
+            "description" (plain text, typically the lead paragraph).
+    """
+    with span("rss fetch", "news", url=rss_feed):
+        response = requests.get(rss_feed, headers=HTTP_HEADERS)
+    xml_root = ET.fromstring(response.content)
+
+    candidates = []
+    for item in xml_root.findall('.//item'):
+        title, link = item.findtext('title'), item.findtext('link')
+        if not title or not link:
+            continue
+        candidates.append({
+            "title": title.strip(),
+            "link": link.strip(),
+            "description": " ".join(strip_html(item.findtext('description')).split())
+        })
+    return candidates
+
 def fetch_rss_news_stories(
     rss_feed: str,
-    top_n_stories: int
+    top_n_stories: int,
+    recent_titles: list[str] = None
 ) -> list[NewsStory]:
     """
     Fetch a list of the Top N news stories from an RSS feed.
-    
+    The first CANDIDATE_POOL_SIZE feed items (default 4 * top_n_stories) are
+    ranked from their titles and descriptions for relevance, novelty and
+    diversity (see utils/ranking.py). Full articles are only fetched for the
+    picks, with the next ranked candidate replacing any article that cannot be parsed.
+
     Args:
         rss_feed (str): RSS news feed URL with links to articles.
-        top_n_stories (int): Number of stories to fetch from top of feed.
+        top_n_stories (int): Number of stories to fetch.
+    Optional:
+        recent_titles (list[str]): Titles of recently covered stories, ranked down as repeats.
 
     Returns:
-        list[NewsStory]: A list of NewsStory objects.
+        list[NewsStory]: A list of NewsStory objects, in ranked order.
     """
-    response = requests.get(rss_feed, headers=HTTP_HEADERS)
-    rss_feed = response.content
-    xml_root = ET.fromstring(rss_feed)
+    from newsplease import NewsPlease
 
-    # Get all items in RSS feed
-    rss_items = xml_root.findall('.//item')
+    pool_size = int(getattr(c, "CANDIDATE_POOL_SIZE", None) or 4 * top_n_stories)
+    candidates = fetch_rss_candidates(rss_feed)[:max(pool_size, top_n_stories)]
+    with span("rank stories", "news", candidates=len(candidates)):
+        ranked = rank_candidates(candidates, recent_titles)
 
     stories_list = []
-
-    # Parse the first N items in RSS feed, skipping broken items
-    story_number = 0
-    count = 0
-    while count < top_n_stories:
-        story = NewsStory()
-        story.title = rss_items[story_number].find('title').text
-        story.link = rss_items[story_number].find('link').text
-        story.content = NewsPlease.from_url(
-            url=story.link, 
-            request_args={'headers': HTTP_HEADERS}).maintext
+    for n in ranked:
+        if len(stories_list) >= top_n_stories:
+            break
+        story = NewsStory(title=candidates[n]["title"], link=candidates[n]["link"])
+        with span("article fetch", "news", link=story.link):
+            story.content = NewsPlease.from_url(
+                url=story.link, 
+                request_args={'headers': HTTP_HEADERS}).maintext
         # Skip past links that cannot be parsed, e.g. breaking news live feeds
-        if not story.content:
-            story_number += 1
-            count = count
-        else:
+        if story.content:
             stories_list.append(story)
-            story_number += 1
-            count += 1
 
-    return stories_list
\ No newline at end of file
+    print(f"Selected {len(stories_list)} of {len(candidates)} candidate news stories")
+    return stories_list
@@ -0,0 +1,182 @@
+import json, os, time
+from datetime import datetime, timezone
+
+from utils.resources import set_stage
+from utils.tracing import span
+
+"""
+Stage engine for long running jobs such as building an episode.
+A job is identified by an ID and owns a work directory under EPISODES_WORK_DIR.
+Each stage is a function that takes the job state and returns a dict of
+outputs. Outputs are saved to the state file as soon as a stage completes,
+so a failed job can be resumed from the first incomplete stage.
+"""
+EPISODES_WORK_DIR = "./cache/episodes"
+STATE_FILENAME = "state.json"
+
+def new_episode_id() -> str:
+    """
+    Create an episode ID from the current UTC time, e.g. 20260219-071500
+    A numeric suffix is added if an episode with the same ID already exists.
+
+    Returns:
+        str: Episode ID.
+    """
+    base_id = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    episode_id, suffix = base_id, 1
+    while os.path.exists(os.path.join(EPISODES_WORK_DIR, episode_id)):
+        suffix += 1
+        episode_id = f"{base_id}-{suffix}"
+    return episode_id
+
+def episode_work_dir(episode_id: str) -> str:
+    """
+    Get the work directory for an episode, creating it if needed.
+
+    Args:
+        episode_id (str): Episode ID.
+
+    Returns:
+        str: Absolute path to the episode work directory.
+    """
+    work_dir = os.path.abspath(os.path.join(EPISODES_WORK_DIR, episode_id))
+    os.makedirs(work_dir, exist_ok=True)
+    return work_dir
+
+def load_episode_state(episode_id: str) -> dict:
+    """
+    Load the saved state of an episode.
+
+    Args:
+        episode_id (str): Episode ID.
+
+    Returns:
+        dict: Episode state, or None if the episode has no saved state.
+    """
+    state_path = os.path.join(EPISODES_WORK_DIR, episode_id, STATE_FILENAME)
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def recent_episode_states(
+    completed_stage: str,
+    limit: int
+) -> list[dict]:
+    """
+    Load the saved states of the most recent episodes that completed a stage.
+
+    Args:
+        completed_stage (str): Stage name, e.g. "publish".
+        limit (int): Maximum number of episodes.
+
+    Returns:
+        list[dict]: Episode states, newest first.
+    """
+    if not os.path.isdir(EPISODES_WORK_DIR):
+        return []
+
+    states = []
+    # Episode IDs start with the creation time, so they sort by age
+    for episode_id in sorted(os.listdir(EPISODES_WORK_DIR), reverse=True):
+        state = load_episode_state(episode_id)
+        if state and completed_stage in state["stages"]:
+            states.append(state)
+            if len(states) >= limit:
+                break
+    return states
+
+def new_episode_state(episode_id: str, params: dict) -> dict:
+    """
+    Create and save the state of a new episode.
+
+    Args:
+        episode_id (str): Episode ID.
+        params (dict): JSON serializable job parameters, available to every stage.
+
+    Returns:
+        dict: Episode state with keys "episode_id", "work_dir", "params" and
+            "stages" (outputs of completed stages, by stage name).
+    """
+    state = {
+        "episode_id": episode_id,
+        "work_dir": episode_work_dir(episode_id),
+        "params": params,
+        "stages": {}
+    }
+    save_episode_state(state)
+    return state
+
+def save_episode_state(state: dict):
+    """Write the episode state to its work directory, replacing the file atomically."""
+    state_path = os.path.join(state["work_dir"], STATE_FILENAME)
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+def invalidate_stages(
+    state: dict,
+    removed_paths: set
+) -> list[str]:
+    """
+    Mark stages incomplete when their output files are gone. The first completed
+    stage with an output among removed_paths is dropped from the state, with every
+    stage completed after it, so a resumed run rebuilds them in order.
+
+    Args:
+        state (dict): Episode state.
+        removed_paths (set[str]): Absolute paths of removed files.
+
+    Returns:
+        list[str]: Names of the dropped stages.
+    """
+    names = list(state["stages"])
+    for n, name in enumerate(names):
+        if _output_paths(state["stages"][name]) & removed_paths:
+            for dropped in names[n:]:
+                del state["stages"][dropped]
+            return names[n:]
+    return []
+
+def _output_paths(outputs):
+    """Absolute paths of all strings in stage outputs, at any depth."""
+    if isinstance(outputs, str):
+        return {os.path.abspath(outputs)}
+    values = outputs.values() if isinstance(outputs, dict) else outputs if isinstance(outputs, list) else []
+    return set().union(*(_output_paths(value) for value in values))
+
+def run_stages(
+    state: dict,
+    stages: list
+) -> dict:
+    """
+    Run stages in order, skipping stages already completed in the state.
+    The state is saved after every completed stage.
+
+    Args:
+        state (dict): Episode state, see new_episode_state().
+        stages (list[tuple[str, Callable]]): Stage names and functions. Each function
+            takes the state and returns a JSON serializable dict of outputs.
+
+    Returns:
+        dict: Stage timings (s) for the stages run, by stage name.
+    """
+    timings = {}
+    for name, stage in stages:
+        if name in state["stages"]:
+            print(f"Skipping completed stage: {name}")
+            continue
+
+        print(f"\n----- STAGE: {name} ({state['episode_id']}) -----")
+        stage_start = time.perf_counter()
+        set_stage(name)
+        try:
+            with span(name, "stage", episode_id=state["episode_id"]):
+                state["stages"][name] = stage(state)
+        finally:
+            set_stage(None)
+        timings[name] = time.perf_counter() - stage_start
+        save_episode_state(state)
+
+    return timings
@@ -1,22 +1,86 @@
-import os, re, requests, shutil
+import json, os, re, requests, sys, threading, time, wave
 from pathlib import Path
 from datetime import datetime, timezone
 import subprocess
 
-from utils.cloud import *
+from utils.artifacts import place_file, track_artifact, collect_garbage
+from utils.cloud import upload_files_to_s3, sync_rss_feed_episodes, upload_rss_feed
 from utils.news import NewsStory,fetch_rss_news_stories
-from utils.container_management import *
-from utils.llm import *
-from utils.tts import *
+from utils.container_management import stop_all_containers, start_container, stop_container
+from utils.llm import llama_cpp_summarize_text, llama_cpp_news_segment_concurrent, llama_cpp_news_segment_iterative, llama_cpp_news_segment_parts
+from utils.segment_check import clean_news_segment, check_news_segment
+from utils.tts import OUTPUT_WAV_FILENAME, maskgct_generate_audio, estimate_spoken_seconds, get_chunks
+from utils.audio import get_duration
+from utils.mixer import MIX_SAMPLE_RATE, mix_background
+from utils.voice_prep import VOICE_PROBE_TEXT, voice_prep_enabled, prepare_voice_ref, latency_report
+from utils.chapters import PART_GAP_MS, part_key, part_wav_path, join_part_wavs, shift_chapters, write_ffmetadata, write_chapters_json
+from utils.encoding import MP3_QUALITIES, mp3_encoder_args, encode_renditions
+from utils.pipeline import new_episode_id, new_episode_state, load_episode_state, save_episode_state, recent_episode_states, run_stages
+from utils.resources import ResourceSampler, print_resource_summary
+from utils.tracing import span, start_trace, stop_trace, write_chrome_trace, print_slowest
 
 import config as c
 
-def create_episode(character_system_prompt, character_voice_ref, episode_image, title, bg_track=None, tts_start_delay_ms=None, fade_duration_s=None):
+"""
+Preview mode renders a cheap draft of an episode for checking persona prompts
+and news segments. Only the first PREVIEW_CHUNKS text chunks are synthesized
+with PREVIEW_TIMESTEPS inference steps, encoded at PREVIEW_QUALITY, and the
+episode is not uploaded.
+"""
+PREVIEW_TIMESTEPS = 10
+PREVIEW_CHUNKS = 3
+PREVIEW_QUALITY = "64k"
+PREVIEW_WAV_FILENAME = "tts_preview.wav"
+
+# Single pass loudness normalization to podcast levels (EBU R128 based)
+LOUDNORM_FILTER = "loudnorm=I=-16:TP=-1.5:LRA=11"
+
+# Number of PCM frames written to ffmpeg per pipe write
+PCM_PIPE_FRAMES = 65536
+
+# Number of times a news segment that fails the checks in utils/segment_check.py is regenerated
+SEGMENT_REGENERATIONS = 2
+SEGMENT_RETRY_NOTE = (
+    "\n\nYour previous news segment could not be used. Write plain spoken text only, "
+    "as complete sentences, without markdown, tags or notes. Problems found:\n"
+)
+
+"""
+Episodes can target a fixed length (EPISODE_TARGET_SECONDS, or per job). The spoken
+length of the news segment is predicted per voice (utils/duration.py) before TTS.
+Stories are dropped when their summaries alone are too long, and a segment more than
+LENGTH_TOLERANCE off target is rewritten by the LLM, up to LENGTH_REWRITES times.
+"""
+LENGTH_TOLERANCE = 0.1
+LENGTH_REWRITES = 2
+LENGTH_REWRITE_PROMPT = (
+    "Rewrite the following news segment to about {words} words. Keep your voice, "
+    "the stories and their order. Reply with the spoken text only.\n\n"
+)
+
+# Number of recently published episodes whose stories are ranked down as repeats
+NOVELTY_EPISODES = 3
+
+"""
+Chapter mode (CHAPTER_MODE, or per episode) builds the news segment as separate
+parts, the intro, each story and the outro, and renders each part on its own.
+The parts of an episode are saved to SEGMENT_PARTS_FILENAME in its work directory.
+After a part's text is edited there, rerender_episode() synthesizes only the
+changed parts and rebuilds the episode. See utils/chapters.py.
+"""
+SEGMENT_PARTS_FILENAME = "segment_parts.json"
+
+def create_episode(character_system_prompt, character_voice_ref, episode_image, title, bg_track=None, tts_start_delay_ms=None, fade_duration_s=None, preview=False, preview_chunks=PREVIEW_CHUNKS, episode_id=None, news_stories=None, target_duration_s=None, chapters=None, publish=True):
     """
     Creates a new podcast episode from scratch and uploads it to the cloud.
     Podcast RSS feed is pulled and updated with an entry for the new episode.
     Adding a background track is OPTIONAL and configurable.
 
+    The episode is built in stages (see EPISODE_STAGES). Stage outputs are saved
+    to a per-episode work directory, so a failed run can be resumed by passing
+    its episode_id. Completed stages are skipped and the saved parameters of the
+    episode are used in place of the arguments.
+
     Args:
         character_system_prompt (str): System prompt defining character personality.
         character_voice_ref (str): Path to voice sample for text-to-speech (TTS).
@@ -26,18 +90,125 @@ def create_episode(character_system_prompt, character_voice_ref, episode_image,
         bg_track (str): Podcast background track filename.
         tts_start_delay_ms (int): Wait time (ms) to play background track before voice starts.
         fade_duration_s (int): Fade out duration (s) for background track when longer than voice track.
+        preview (bool): Render a low quality draft of the first preview_chunks text chunks. Nothing is uploaded.
+        preview_chunks (int): Number of text chunks synthesized in preview mode.
+        episode_id (str): ID of an earlier run to resume, see utils.pipeline.
+        news_stories (list[NewsStory]): Stories fetched ahead of time. The fetch stage is skipped.
+        target_duration_s (int): Target episode length (s), default EPISODE_TARGET_SECONDS. The news
+            segment is steered toward it before TTS, see _fit_segment_length().
+        chapters (bool): Render the intro, each story and the outro as chapters, default CHAPTER_MODE.
+            Not used in preview mode.
+        publish (bool): Publish the episode. When False, the run stops after encoding and a later
+            resume publishes it, e.g. after fixing chapters with rerender_episode().
+
+    Returns:
+        dict: Run results, with keys:
+            "episode_id": Episode ID, used to resume the run.
+            "timings": Measured stage timings (s) for this run.
+            "resources": Peak memory and CPU use of the process and containers, see utils/resources.py.
+        In preview mode, also:
+            "mp3": Path to the preview MP3.
+            "news_segment": Full news segment text.
+            "estimates": Estimated stage timings (s) for a full quality render.
     """
 
-    # Fetch list of news stories from a public news feed
-    news_stories = fetch_rss_news_stories(c.RSS_NEWS_FEED, int(c.TOP_N_STORIES))
-    
+    state = load_episode_state(episode_id) if episode_id else None
+    if episode_id and state is None:
+        raise FileNotFoundError(f"No saved state for episode: {episode_id}")
+
+    if state is None:
+        state = new_episode(
+            character_system_prompt, character_voice_ref, episode_image, title,
+            bg_track=bg_track, tts_start_delay_ms=tts_start_delay_ms, fade_duration_s=fade_duration_s,
+            preview=preview, preview_chunks=preview_chunks, news_stories=news_stories,
+            target_duration_s=target_duration_s, chapters=chapters
+        )
+    else:
+        print(f"Resuming episode {state['episode_id']}, completed stages: {', '.join(state['stages']) or 'none'}")
+
+    # Previews and held episodes stop before publishing
+    stages = [stage for stage in EPISODE_STAGES if not ((state["params"]["preview"] or not publish) and stage[0] == "publish")]
+
+    # Each run of an episode, including resumed runs, writes its own trace and resource samples
+    run_timestamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')
+    trace_path = os.path.join(state["work_dir"], f"trace-{run_timestamp}.json")
+    sampler = ResourceSampler(os.path.join(state["work_dir"], f"resources-{run_timestamp}.csv")).start()
+    start_trace()
+    try:
+        timings = run_stages(state, stages)
+    finally:
+        events = stop_trace()
+        write_chrome_trace(trace_path, events)
+        print_slowest(events)
+        resources = sampler.stop()
+        print_resource_summary(resources)
+
+    # Remove old intermediates of earlier episodes under the retention policy
+    collect_garbage(exclude={state["episode_id"]})
+
+    if state["params"]["preview"]:
+        news_segment = _read_text(state["stages"]["segment"]["news_segment"])
+        estimates = estimate_full_render(timings, news_segment, state["params"]["preview_chunks"])
+        print("\nPreview timings (s): " + ", ".join(f"{k}={v:.1f}" for k, v in timings.items()))
+        print("Full render estimate (s): " + ", ".join(f"{k}={v:.1f}" for k, v in estimates.items()))
+        return {"episode_id": state["episode_id"], "mp3": state["stages"]["encode"]["mp3"], "news_segment": news_segment, "timings": timings, "estimates": estimates, "resources": resources}
+
+    return {"episode_id": state["episode_id"], "timings": timings, "resources": resources}
+
+def new_episode(character_system_prompt, character_voice_ref, episode_image, title, bg_track=None, tts_start_delay_ms=None, fade_duration_s=None, preview=False, preview_chunks=PREVIEW_CHUNKS, news_stories=None, target_duration_s=None, chapters=None, episode_date=None):
+    """
+    Create the saved state of a new episode, without running any stages.
+    Arguments are the same as create_episode(), plus:
+
+    Optional:
+        episode_date (datetime): Episode date, prepended to the title and used as the
+            publication time. Naive datetimes are taken as UTC. By default the current
+            date is used, and the episode is dated when it is published.
+
+    Returns:
+        dict: Episode state, see utils.pipeline.new_episode_state().
+    """
+    if episode_date is not None and episode_date.tzinfo is None:
+        episode_date = episode_date.replace(tzinfo=timezone.utc)
+
+    state = new_episode_state(new_episode_id(), {
+        "character_system_prompt": character_system_prompt,
+        "character_voice_ref": character_voice_ref,
+        "episode_title": (episode_date or datetime.now(timezone.utc)).strftime("%Y-%m-%d") + " " + title,
+        "episode_image_full_url": c.PODCAST_CLOUD_REPO + episode_image,
+        "bg_track": bg_track,
+        "tts_start_delay_ms": tts_start_delay_ms,
+        "fade_duration_s": fade_duration_s,
+        "preview": preview,
+        "preview_chunks": preview_chunks,
+        "target_duration_s": target_duration_s or getattr(c, "EPISODE_TARGET_SECONDS", None),
+        "chapters": (chapter_mode_enabled() if chapters is None else bool(chapters)) and not preview,
+        "pub_ts": episode_date.timestamp() if episode_date else None
+    })
+    if news_stories is not None:
+        stories_path = os.path.join(state["work_dir"], "stories.json")
+        _write_stories(stories_path, news_stories)
+        state["stages"]["fetch"] = {"stories": stories_path}
+        save_episode_state(state)
+    return state
+
+def _fetch_stage(state):
+    """Fetch list of news stories from a public news feed."""
+    news_stories = fetch_rss_news_stories(c.RSS_NEWS_FEED, int(c.TOP_N_STORIES), recent_story_titles())
+    stories_path = os.path.join(state["work_dir"], "stories.json")
+    _write_stories(stories_path, news_stories)
+    return {"stories": stories_path}
+
+def _summarize_stage(state):
+    """Add character summary to each news story."""
+    news_stories = _read_stories(state["stages"]["fetch"]["stories"])
+
     stop_all_containers(c.EXCLUDED_CONTAINERS)
     start_container(c.CONTAINER_LLM, int(c.BOOT_WAIT_LLM))
 
-    # Add character summary to each news story
     for story in news_stories:
         story.summary_character = llama_cpp_summarize_text(
-            character_system_prompt,
+            state["params"]["character_system_prompt"],
             c.SUMMARY_CHARACTER,
             story.content
         )
@@ -50,49 +221,437 @@ def create_episode(character_system_prompt, character_voice_ref, episode_image,
     #         story.content
     #     )
 
-    # Build news segment from character summaries in one prompt
-    news_segment = llama_cpp_news_segment_concurrent(
-        character_system_prompt,
-        c.NEWS_SEGMENT_FULL,
-        news_stories,
-        "character"
-    )
+    stories_path = os.path.join(state["work_dir"], "stories_summarized.json")
+    _write_stories(stories_path, news_stories)
+    return {"stories": stories_path}
 
-    # # Build news segment from character summaries iteratively and stitch
-    # news_segment = llama_cpp_news_segment_iterative(
-    #     character_system_prompt,
-    #     c.NEWS_SEGMENT_INTRO,
-    #     c.NEWS_SEGMENT_OUTRO,
-    #     news_stories
-    # )
-    
-    print(news_segment)
+def _segment_stage(state):
+    """Build news segment from character summaries in one prompt."""
+    news_stories = _read_stories(state["stages"]["summarize"]["stories"])
 
+    # No-op when the LLM container is still running from the summarize stage
+    start_container(c.CONTAINER_LLM, int(c.BOOT_WAIT_LLM))
+
+    # Drop the lowest ranked stories when their summaries alone run past the target length
+    news_stories = _trim_stories(news_stories, state["params"])
+
+    # Check the segment before TTS and regenerate it while the LLM is still loaded
+    max_regenerations = int(getattr(c, "SEGMENT_REGENERATIONS", SEGMENT_REGENERATIONS))
+    system_prompt = state["params"]["character_system_prompt"]
+    chapters = state["params"].get("chapters")
+    for attempt in range(max_regenerations + 1):
+        if chapters:
+            # Build news segment from character summaries iteratively, one part per chapter
+            parts = llama_cpp_news_segment_parts(
+                system_prompt,
+                c.NEWS_SEGMENT_INTRO,
+                c.NEWS_SEGMENT_OUTRO,
+                news_stories
+            )
+        else:
+            parts = [{"title": "News", "text": llama_cpp_news_segment_concurrent(
+                system_prompt,
+                c.NEWS_SEGMENT_FULL,
+                news_stories,
+                "character"
+            )}]
+        with span("segment check", "llm", attempt=attempt) as trace:
+            for part in parts:
+                part["text"] = clean_news_segment(part["text"])
+            news_segment = "\n\n".join(part["text"] for part in parts)
+            problems = check_news_segment(news_segment, len(news_stories))
+            trace["problems"] = problems
+        if not problems:
+            break
+
+        print(f"News segment failed checks (attempt {attempt + 1} of {max_regenerations + 1}): {'; '.join(problems)}")
+        system_prompt = state["params"]["character_system_prompt"] + SEGMENT_RETRY_NOTE + "\n".join(f"- {p}" for p in problems)
+    else:
+        raise ValueError(f"News segment failed checks after {max_regenerations + 1} attempts: {'; '.join(problems)}")
+
+    outputs = {"attempts": attempt + 1, "stories": len(news_stories)}
+    if chapters:
+        # A rewrite would merge the parts, chapters are only steered by dropping stories
+        predicted_s = _predict_parts_seconds(parts, state["params"]["character_voice_ref"])
+        print(f"Predicted spoken length: {predicted_s:.0f}s in {len(parts)} chapters")
+        outputs["parts"] = _write_parts(state, parts)
+    else:
+        news_segment, predicted_s = _fit_segment_length(news_segment, state["params"], len(news_stories))
+
+    print(news_segment)
     stop_container(c.CONTAINER_LLM)
+
+    outputs["news_segment"] = _write_segment_text(state, news_segment)
+    outputs["predicted_s"] = predicted_s
+    return outputs
+
+def _write_segment_text(state, news_segment):
+    """Save the full news segment text of an episode. Returns its path."""
+    segment_path = os.path.join(state["work_dir"], "news_segment.txt")
+    with open(segment_path, "w", encoding="utf-8") as f:
+        f.write(news_segment)
+    return segment_path
+
+def _write_parts(state, parts):
+    """Save the news segment parts of an episode in chapter mode. Returns their path."""
+    parts_path = os.path.join(state["work_dir"], SEGMENT_PARTS_FILENAME)
+    with open(parts_path, "w", encoding="utf-8") as f:
+        json.dump(parts, f, indent=2)
+    return parts_path
+
+def _read_parts(state):
+    """Load the news segment parts saved by _write_parts()."""
+    with open(state["stages"]["segment"]["parts"], "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _predict_parts_seconds(parts, voice_ref):
+    """Predicted spoken length (s) of news segment parts joined as chapters."""
+    return sum(estimate_spoken_seconds(part["text"], voice_ref) for part in parts) + PART_GAP_MS / 1000 * (len(parts) - 1)
+
+def chapter_mode_enabled():
+    """Whether new episodes are rendered as chapters by default (CHAPTER_MODE)."""
+    return str(getattr(c, "CHAPTER_MODE", "")).strip().lower() in ("1", "true", "yes")
+
+def _spoken_target_s(params):
+    """Target length (s) of the spoken segment, or None. The background track intro is not spoken."""
+    target_s = params.get("target_duration_s")
+    if not target_s:
+        return None
+    return float(target_s) - (params["tts_start_delay_ms"] or 0) / 1000
+
+def _trim_stories(news_stories, params):
+    """
+    Drop stories from the end of the list (the lowest ranked) while the predicted
+    spoken length of the character summaries exceeds the target by more than
+    LENGTH_TOLERANCE. At least one story is kept.
+    """
+    target_s = _spoken_target_s(params)
+    if target_s is None:
+        return news_stories
+
+    voice_ref = params["character_voice_ref"]
+    while len(news_stories) > 1:
+        summaries_s = estimate_spoken_seconds(" ".join(story.summary_character for story in news_stories), voice_ref)
+        if summaries_s <= target_s * (1 + LENGTH_TOLERANCE):
+            break
+        print(f"Summaries predicted at {summaries_s:.0f}s for a {target_s:.0f}s target, dropping story: {news_stories[-1].title}")
+        news_stories = news_stories[:-1]
+    return news_stories
+
+def _fit_segment_length(news_segment, params, n_stories):
+    """
+    Predict the spoken length of a news segment and, when a target episode length is
+    set and the prediction is off by more than LENGTH_TOLERANCE, ask the LLM to rewrite
+    the segment to a length in words that fits the target. Rewrites must pass the segment
+    checks and get closer to the target to be kept. Up to LENGTH_REWRITES rewrites are made.
+
+    Args:
+        news_segment (str): Checked news segment text.
+        params (dict): Episode parameters.
+        n_stories (int): Number of news stories in the segment.
+
+    Returns:
+        tuple[str, float]: News segment and its predicted spoken length (s).
+    """
+    voice_ref = params["character_voice_ref"]
+    predicted_s = estimate_spoken_seconds(news_segment, voice_ref)
+    target_s = _spoken_target_s(params)
+    if target_s is None:
+        print(f"Predicted spoken length: {predicted_s:.0f}s")
+        return news_segment, predicted_s
+
+    for _ in range(LENGTH_REWRITES):
+        if abs(predicted_s - target_s) <= LENGTH_TOLERANCE * target_s:
+            break
+
+        target_words = max(1, round(len(news_segment.split()) * target_s / max(predicted_s, 1.0)))
+        print(f"Predicted spoken length {predicted_s:.0f}s, target {target_s:.0f}s. Rewriting to about {target_words} words...")
+        with span("segment rewrite", "llm", predicted_s=predicted_s, target_s=target_s, target_words=target_words) as trace:
+            rewritten = clean_news_segment(llama_cpp_summarize_text(
+                params["character_system_prompt"],
+                LENGTH_REWRITE_PROMPT.format(words=target_words),
+                news_segment
+            ))
+            problems = check_news_segment(rewritten, n_stories)
+            rewritten_s = estimate_spoken_seconds(rewritten, voice_ref)
+            trace.update(problems=problems, rewritten_s=rewritten_s)
+
+        if problems:
+            print(f"Rewritten segment failed checks: {'; '.join(problems)}")
+        elif abs(rewritten_s - target_s) < abs(predicted_s - target_s):
+            news_segment, predicted_s = rewritten, rewritten_s
+
+    print(f"Predicted spoken length: {predicted_s:.0f}s, target {target_s:.0f}s")
+    return news_segment, predicted_s
+
+def _voice_stage(state):
+    """Prepare the voice reference sent with every TTS chunk, see utils/voice_prep.py."""
+    if not voice_prep_enabled():
+        print("Voice preparation disabled (VOICE_PREP), using the raw voice reference")
+        return {"voice_wav": None}
+    prepared = prepare_voice_ref(os.path.join(c.MASKGCT_VOICES_DIR, state["params"]["character_voice_ref"]))
+    if prepared["cached"]:
+        print(f"Using cached voice reference: {prepared['path']} ({prepared['source_s']:.1f}s to {prepared['prepared_s']:.1f}s)")
+    return {"voice_wav": prepared["path"], "source_s": prepared["source_s"], "prepared_s": prepared["prepared_s"]}
+
+def _probe_raw_voice(state, timesteps):
+    """
+    Synthesize VOICE_PROBE_TEXT once with the raw voice reference, when references
+    are prepared and no raw latency is recorded for the voice, so the latency change
+    can be reported. Run while the TTS container is up.
+    """
+    voice_ref = state["params"]["character_voice_ref"]
+    if not voice_prep_enabled() or latency_report(voice_ref, timesteps)["raw_s_per_100_chars"] is not None:
+        return
+    print("Measuring TTS latency with the raw voice reference...")
+    probe_wav = maskgct_generate_audio(
+        c.MASKGCT_VOICES_DIR,
+        voice_ref,
+        timesteps,
+        VOICE_PROBE_TEXT,
+        output_wav=os.path.join(state["work_dir"], "voice_probe.wav"),
+        prepare_voice=False
+    )
+    os.remove(probe_wav)
+
+def _report_voice_latency(params, timesteps):
+    """Print and return the TTS latency change from voice preparation, see utils.voice_prep.latency_report()."""
+    report = latency_report(params["character_voice_ref"], timesteps)
+    if report["change_pct"] is not None:
+        print(f"TTS latency per 100 characters: {report['prepared_s_per_100_chars']:.2f}s with the prepared voice reference, "
+              f"{report['raw_s_per_100_chars']:.2f}s raw ({report['change_pct']:+.1f}%)")
+    return report
+
+def _synthesize_stage(state):
+    """Generate podcast audio from the news segment."""
+    params = state["params"]
+    if params.get("chapters"):
+        return _synthesize_parts(state)
+    news_segment = _read_text(state["stages"]["segment"]["news_segment"])
+    timesteps = PREVIEW_TIMESTEPS if params["preview"] else int(c.MASKGCT_TIMESTEPS)
+
+    stop_all_containers(c.EXCLUDED_CONTAINERS)
     start_container(c.CONTAINER_TTS, int(c.BOOT_WAIT_TTS))
+    if not params["preview"]:
+        _probe_raw_voice(state, timesteps)
 
-    # Generate podcast audio
     output_wav = maskgct_generate_audio(
         c.MASKGCT_VOICES_DIR,
-        character_voice_ref,
-        c.MASKGCT_TIMESTEPS,
-        news_segment
+        params["character_voice_ref"],
+        timesteps,
+        news_segment,
+        max_chunks=params["preview_chunks"] if params["preview"] else None,
+        output_wav=os.path.join(state["work_dir"], PREVIEW_WAV_FILENAME if params["preview"] else OUTPUT_WAV_FILENAME)
     )
 
     stop_container(c.CONTAINER_TTS)
 
-    if bg_track:
-        output_wav = add_background_track(output_wav, bg_track, tts_start_delay_ms,fade_duration_s)
-    
-    # Create MP3 from generated WAV in variable bitrate V2 quality
-    output_mp3 = wav_to_mp3(output_wav, "v2")
+    track_artifact(state, output_wav, "intermediate")
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    episode_title = timestamp + " " + title
-    episode_image_full_url = c.PODCAST_CLOUD_REPO + episode_image
-    update_podcast(output_mp3, episode_title, episode_image_full_url)
+    spoken_s = get_duration(output_wav)
+    if not params["preview"]:
+        print(f"Spoken length: {spoken_s:.1f}s, predicted {state['stages']['segment'].get('predicted_s', 0.0):.1f}s")
+    return {"tts_wav": output_wav, "spoken_s": spoken_s, "voice_latency": _report_voice_latency(params, timesteps)}
+
+def _synthesize_parts(state):
+    """
+    Generate podcast audio from the news segment parts in chapter mode. Parts are
+    cached by text and TTS settings, and only parts without audio are synthesized.
+    The TTS container is not started when every part is cached.
+    """
+    params = state["params"]
+    voice_ref = params["character_voice_ref"]
+    timesteps = int(c.MASKGCT_TIMESTEPS)
+    parts = _read_parts(state)
+    part_wavs = [part_wav_path(state["work_dir"], part_key(part["text"], voice_ref, timesteps)) for part in parts]
+
+    # Identical parts share one WAV
+    missing = {part_wav: part for part, part_wav in zip(parts, part_wavs) if not os.path.exists(part_wav)}
+    print(f"Chapters: {len(set(part_wavs)) - len(missing)} cached, {len(missing)} to synthesize")
+
+    if missing:
+        stop_all_containers(c.EXCLUDED_CONTAINERS)
+        start_container(c.CONTAINER_TTS, int(c.BOOT_WAIT_TTS))
+        _probe_raw_voice(state, timesteps)
+        for part_wav, part in missing.items():
+            os.makedirs(os.path.dirname(part_wav), exist_ok=True)
+            with span("tts part", "tts", title=part["title"]):
+                # Written under a temporary name, so an interrupted part is never taken as cached
+                maskgct_generate_audio(c.MASKGCT_VOICES_DIR, voice_ref, timesteps, part["text"], output_wav=part_wav + ".tmp")
+            os.replace(part_wav + ".tmp", part_wav)
+        stop_container(c.CONTAINER_TTS)
+
+    for part_wav in part_wavs:
+        track_artifact(state, part_wav, "intermediate")
+
+    output_wav = os.path.join(state["work_dir"], OUTPUT_WAV_FILENAME)
+    chapters = join_part_wavs(part_wavs, [part["title"] for part in parts], output_wav)
+    track_artifact(state, output_wav, "intermediate")
+
+    spoken_s = get_duration(output_wav)
+    print(f"Spoken length: {spoken_s:.1f}s, predicted {state['stages']['segment'].get('predicted_s', 0.0):.1f}s")
+    return {"tts_wav": output_wav, "spoken_s": spoken_s, "parts": part_wavs, "chapters": chapters, "parts_synthesized": len(missing), "voice_latency": _report_voice_latency(params, timesteps)}
+
+def _mix_stage(state):
+    """Mix background track and normalize loudness into a master WAV."""
+    params = state["params"]
+    master_wav = os.path.join(state["work_dir"], "master.wav")
+    track_artifact(state, master_wav, "intermediate")
+    duration = render_master_wav(
+        state["stages"]["synthesize"]["tts_wav"],
+        master_wav,
+        params["bg_track"],
+        params["tts_start_delay_ms"],
+        params["fade_duration_s"]
+    )
+    return {"master_wav": master_wav, "duration": duration}
+
+def _encode_stage(state):
+    """
+    Encode the episode from the master WAV.
+    Episodes use variable bitrate V2 quality. Additional renditions
+    (EPISODE_RENDITIONS) are encoded in parallel from the same master.
+    """
+    master_wav = state["stages"]["mix"]["master_wav"]
+    if state["params"]["preview"]:
+        renditions = [{"codec": "mp3", "quality": PREVIEW_QUALITY}]
+    else:
+        renditions = [{"codec": "mp3", "quality": "v2"}] + (getattr(c, "EPISODE_RENDITIONS", None) or [])
+
+    # Chapter markers, placed after the background track intro
+    outputs = {}
+    metadata_file = None
+    chapters = state["stages"]["synthesize"].get("chapters")
+    if chapters:
+        params = state["params"]
+        offset_s = (params["tts_start_delay_ms"] or 0) / 1000 if params["bg_track"] else 0.0
+        chapters = shift_chapters(chapters, offset_s, state["stages"]["mix"]["duration"])
+        metadata_file = write_ffmetadata(chapters, os.path.join(state["work_dir"], "chapters.ffmetadata"))
+        outputs["chapters"] = write_chapters_json(chapters, os.path.join(state["work_dir"], "chapters.json"))
+
+    results = encode_renditions(master_wav, renditions, output_base=os.path.join(state["work_dir"], "episode"), metadata_file=metadata_file)
+    for result in results:
+        track_artifact(state, result["path"], "output")
+
+    # The master is only needed to encode, and is the largest file in the work dir
+    os.remove(master_wav)
+    return {"mp3": results[0]["path"], "renditions": results[1:], **outputs}
+
+def _publish_stage(state):
+    """Upload the episode and update the podcast RSS feed."""
+    params = state["params"]
+    update_podcast(
+        state["stages"]["encode"]["mp3"],
+        params["episode_title"],
+        params["episode_image_full_url"],
+        state["stages"]["mix"]["duration"],
+        state["stages"]["encode"]["renditions"],
+        params.get("pub_ts"),
+        state["stages"]["encode"].get("chapters")
+    )
+    return {}
+
+# Episode stages in run order, see create_episode()
+EPISODE_STAGES = [
+    ("fetch", _fetch_stage),
+    ("summarize", _summarize_stage),
+    ("segment", _segment_stage),
+    ("voice", _voice_stage),
+    ("synthesize", _synthesize_stage),
+    ("mix", _mix_stage),
+    ("encode", _encode_stage),
+    ("publish", _publish_stage)
+]
+
+def rerender_episode(episode_id, publish=False):
+    """
+    Rebuild the audio of an unpublished chapter mode episode after its parts were
+    edited in SEGMENT_PARTS_FILENAME. Only parts whose text changed are synthesized,
+    the others are reused, then the episode is joined, mixed and encoded again.
+
+    Args:
+        episode_id (str): Episode ID.
+    Optional:
+        publish (bool): Publish the episode after rebuilding it.
+
+    Returns:
+        dict: Run results, see create_episode().
+    """
+    state = load_episode_state(episode_id)
+    if state is None:
+        raise FileNotFoundError(f"No saved state for episode: {episode_id}")
+    if not state["params"].get("chapters") or "parts" not in state["stages"].get("segment", {}):
+        raise ValueError(f"Episode {episode_id} was not built in chapter mode")
+    if "publish" in state["stages"]:
+        raise ValueError(f"Episode {episode_id} is already published")
+
+    # Keep the full segment text in step with the edited parts
+    _write_segment_text(state, "\n\n".join(part["text"] for part in _read_parts(state)))
+    for name in ("voice", "synthesize", "mix", "encode"):
+        state["stages"].pop(name, None)
+    save_episode_state(state)
+
+    return create_episode(None, None, None, None, episode_id=episode_id, publish=publish)
+
+def recent_story_titles(limit=NOVELTY_EPISODES):
+    """Titles of the stories covered by the last few published episodes, newest first."""
+    titles = []
+    for state in recent_episode_states("publish", limit):
+        stories_path = state["stages"].get("fetch", {}).get("stories")
+        if stories_path and os.path.exists(stories_path):
+            titles += [story.title for story in _read_stories(stories_path)]
+    return titles
+
+def _write_stories(output_path, news_stories):
+    """Save a list of NewsStory objects as JSON."""
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump([vars(story) for story in news_stories], f, indent=2)
+
+def _read_stories(input_path):
+    """Load a list of NewsStory objects saved by _write_stories()."""
+    with open(input_path, "r", encoding="utf-8") as f:
+        return [NewsStory(**story) for story in json.load(f)]
+
+def _read_text(input_path):
+    """Read a UTF-8 text file."""
+    with open(input_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def estimate_full_render(preview_timings, news_segment, preview_chunks):
+    """
+    Estimate stage timings for a full quality render from a preview run.
+    TTS time is scaled by the number of text chunks and by the ratio of
+    full to preview inference timesteps. Mixing and encoding are scaled
+    by the number of text chunks. Stages skipped by a resumed preview count as 0.
+
+    Args:
+        preview_timings (dict): Measured stage timings (s) from the preview run.
+        news_segment (str): Full news segment text.
+        preview_chunks (int): Number of text chunks synthesized in the preview.
 
-def update_podcast(input_mp3, episode_title, episode_image_full_url):
+    Returns:
+        dict: Estimated stage timings (s), including "total".
+    """
+    total_chunks = sum(1 for _ in get_chunks(news_segment, 250))
+    chunk_ratio = total_chunks / max(1, min(preview_chunks, total_chunks))
+    timestep_ratio = int(c.MASKGCT_TIMESTEPS) / PREVIEW_TIMESTEPS
+
+    # Container boot time does not scale with the amount of audio
+    boot_wait = int(c.BOOT_WAIT_TTS)
+    tts_inference = max(0.0, preview_timings.get("synthesize", 0.0) - boot_wait)
+
+    estimates = {
+        "fetch": preview_timings.get("fetch", 0.0),
+        "summarize": preview_timings.get("summarize", 0.0),
+        "segment": preview_timings.get("segment", 0.0),
+        "synthesize": boot_wait + tts_inference * chunk_ratio * timestep_ratio,
+        "mix": preview_timings.get("mix", 0.0) * chunk_ratio,
+        "encode": preview_timings.get("encode", 0.0) * chunk_ratio
+    }
+    estimates["total"] = sum(estimates.values())
+    return estimates
+
+def update_podcast(input_mp3, episode_title, episode_image_full_url, episode_duration=None, renditions=None, pub_ts=None, chapters_json=None):
     """
     Update podcast on Cloudflare R2 bucket.
 
@@ -100,9 +659,31 @@ def update_podcast(input_mp3, episode_title, episode_image_full_url):
         input_mp3 (str): Absolute path to the podcast MP3 file.
         episode_title (str): title tag assigned to the podcast episode in RSS feed.
         episode_image_full_url (str): itunes:image tag assigned to the episode in RSS feed.
+    Optional:
+        episode_duration (int): Episode duration (s), if already known. Measured from the MP3 otherwise.
+        renditions (list[dict]): Additional renditions from encode_renditions(), published
+            as alternate enclosures of the episode.
+        pub_ts (float): Publication time (Unix timestamp), default the time the MP3 is placed.
+        chapters_json (str): Path to the episode's JSON chapters, published and linked from the feed.
     """
 
     print(f"Updating podcast on Cloudflare...")
+    feed_episode = upload_episode(input_mp3, episode_title, episode_image_full_url, episode_duration, renditions, pub_ts, chapters_json)
+    feed_files = sync_rss_feed_episodes([feed_episode])
+    upload_rss_feed(feed_files)
+
+def upload_episode(input_mp3, episode_title, episode_image_full_url, episode_duration=None, renditions=None, pub_ts=None, chapters_json=None):
+    """
+    Place an episode and its renditions in the podcast assets directory and upload
+    them, without updating the RSS feed. Arguments are the same as update_podcast().
+
+    Returns:
+        dict: Feed entry for utils.cloud.sync_rss_feed_episodes().
+
+    Raises:
+        RuntimeError: If the episode file fails to upload. Failed renditions and
+            chapters are left out of the feed entry.
+    """
 
     # Ensure the input file exists
     input_path = Path(input_mp3)
@@ -110,17 +691,53 @@ def update_podcast(input_mp3, episode_title, episode_image_full_url):
         raise FileNotFoundError(f"Input file not found: {input_mp3}")
 
     # Get the duration of the input MP3
-    episode_duration = get_audio_duration(input_mp3)
+    if episode_duration is None:
+        episode_duration = get_audio_duration(input_mp3)
     
-    # Copy the input MP3 to podcast assets directory and rename with epsiode title
+    # Place the input MP3 in the podcast assets directory, named with the episode title
+    # A hardlink is used where possible, see utils.artifacts.place_file()
     new_filename = episode_title + " " + str(episode_duration) + "s.mp3"
     podcast_mp3 = os.path.join(c.PODCAST_ASSETS_DIRECTORY, new_filename)
-    shutil.copy2(input_mp3, podcast_mp3)
-
-    episode_url = upload_to_s3(podcast_mp3)
-
-    rss_tree = sync_rss_feed(episode_url, episode_title, episode_duration, episode_image_full_url)
-    upload_rss_feed(rss_tree)
+    place_file(input_mp3, podcast_mp3)
+
+    # Place additional renditions, e.g. low bitrate Opus for mobile
+    rendition_files = []
+    for rendition in renditions or []:
+        extension = os.path.splitext(rendition["path"])[1]
+        rendition_file = os.path.join(c.PODCAST_ASSETS_DIRECTORY, new_filename[:-4] + " " + rendition["quality"] + extension)
+        place_file(rendition["path"], rendition_file)
+        rendition_files.append(rendition_file)
+
+    # Place the JSON chapters, named like the episode
+    chapters_files = []
+    if chapters_json:
+        chapters_files.append(os.path.join(c.PODCAST_ASSETS_DIRECTORY, new_filename[:-4] + " chapters.json"))
+        place_file(chapters_json, chapters_files[0])
+
+    # Upload the episode, its renditions and chapters concurrently, before the feed references them
+    episode_url, *rendition_urls = upload_files_to_s3([podcast_mp3] + rendition_files + chapters_files)
+    if not episode_url:
+        raise RuntimeError(f"Failed to upload episode: {podcast_mp3}")
+    chapters_url = rendition_urls.pop() if chapters_files else None
+
+    alternate_enclosures = []
+    for rendition, rendition_url in zip(renditions or [], rendition_urls):
+        if rendition_url:
+            alternate_enclosures.append({
+                "url": rendition_url,
+                "type": rendition["mime_type"],
+                "length": rendition["size"]
+            })
+
+    return {
+        "url": episode_url,
+        "title": episode_title,
+        "duration": episode_duration,
+        "image": episode_image_full_url,
+        "alternates": alternate_enclosures,
+        "chapters": chapters_url,
+        "pub_ts": pub_ts
+    }
 
 def add_background_track(tts_file, bg_track, tts_start_delay_ms, fade_duration_s):
     """
@@ -206,6 +823,7 @@ def add_background_track(tts_file, bg_track, tts_start_delay_ms, fade_duration_s
 def get_audio_duration(input_audio):
     """
     Gets the duration of an audio file.
+    Durations are read from file headers where possible, see utils.audio.get_duration().
 
     Args:
         input_audio (str): Path to the audio file.
@@ -219,37 +837,7 @@ def get_audio_duration(input_audio):
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_audio}")
 
-    # Construct ffmpeg command to get duration
-    ffmpeg_cmd = [
-        "ffmpeg",
-        "-i", str(input_path),  # Input file
-        "-f", "null",           # Output format (null to suppress output)
-        "-"                     # Output to stdout
-    ]
-
-    # Run ffmpeg command and capture stderr
-    try:
-        result = subprocess.run(
-            ffmpeg_cmd,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"ffmpeg command failed: {e.stderr}")
-
-    # Parse the duration from ffmpeg's stderr output
-    for line in result.stderr.splitlines():
-        if "Duration" in line:
-            # Extract the duration string (e.g., "00:01:23.45")
-            duration_str = line.split("Duration: ")[1].split(",")[0].strip()
-            # Convert to seconds
-            hours, minutes, seconds = map(float, duration_str.split(":"))
-            duration_seconds = hours * 3600 + minutes * 60 + seconds
-            return int(duration_seconds)
-
-    # If duration not found, raise an error
-    raise RuntimeError("Could not determine duration from ffmpeg output.")
+    return int(get_duration(str(input_path)))
 
 def wav_to_mp3(input_wav, quality):
     """
@@ -259,16 +847,14 @@ def wav_to_mp3(input_wav, quality):
 
     Args:
         input_wav (str): Path to the WAV file.
-        quality (str): Supports: v0, v2, 192k, 320k
+        quality (str): Supports: v0, v2, 64k, 192k, 320k
 
     Returns:
         str: Output MP3 file path (absolute path).
     """
 
     # Validate MP3 quality level
-    valid_qualities = {"v0", "v2", "192k", "320k"}
-    if quality not in valid_qualities:
-        raise ValueError(f"Invalid quality level: {quality}. Supported values: {valid_qualities}")
+    encoder_args = mp3_encoder_args(quality)
 
     # Ensure the input file exists
     input_path = Path(input_wav)
@@ -282,24 +868,12 @@ def wav_to_mp3(input_wav, quality):
         os.remove(output_mp3)
 
     # Construct ffmpeg command
-    if quality.startswith("v"):
-        # Variable Bit Rate (VBR)
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-i", str(input_path),  # Input file
-            "-codec:a", "libmp3lame",  # Use LAME MP3 codec
-            "-q:a", quality[1:],  # VBR quality (0 = highest, 9 = lowest)
-            str(output_mp3)  # Output file
-        ]
-    else:
-        # Constant Bit Rate (CBR)
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-i", str(input_path),  # Input file
-            "-codec:a", "libmp3lame",  # Use LAME MP3 codec
-            "-b:a", quality,  # CBR bitrate (e.g., 192k, 320k)
-            str(output_mp3)  # Output file
-        ]
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-i", str(input_path),  # Input file
+        *encoder_args,
+        str(output_mp3)  # Output file
+    ]
 
     # Run ffmpeg command
     try:
@@ -309,4 +883,104 @@ def wav_to_mp3(input_wav, quality):
 
     # Return absolute path to the output MP3 file
     print(f"WAV to MP3 ({quality}): {output_mp3.resolve()}")
-    return str(output_mp3.resolve())
\ No newline at end of file
+    return str(output_mp3.resolve())
+
+def pipe_to_ffmpeg(ffmpeg_cmd, pcm_blocks):
+    """
+    Run an ffmpeg command that reads raw PCM from stdin (pipe:0).
+
+    Args:
+        ffmpeg_cmd (list[str]): Full ffmpeg command.
+        pcm_blocks (Iterable[bytes]): Raw PCM data, written to ffmpeg in order.
+    """
+    process = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    # Drain stderr in the background so ffmpeg never blocks on a full pipe
+    stderr = []
+    stderr_reader = threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+    stderr_reader.start()
+
+    try:
+        for block in pcm_blocks:
+            process.stdin.write(block)
+        process.stdin.close()
+    except BrokenPipeError:
+        # ffmpeg exited early, its error output is reported below
+        pass
+
+    process.wait()
+    stderr_reader.join()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg command failed: {b''.join(stderr).decode(errors='replace')}")
+
+def _read_wav_blocks(input_wav):
+    """Yield raw PCM frames from a WAV file, PCM_PIPE_FRAMES at a time."""
+    with wave.open(input_wav, "rb") as w:
+        while True:
+            frames = w.readframes(PCM_PIPE_FRAMES)
+            if not frames:
+                break
+            yield frames
+
+def render_master_wav(tts_file, output_wav, bg_track=None, tts_start_delay_ms=None, fade_duration_s=None):
+    """
+    Render the mastered episode WAV: background mix and loudness normalization.
+    The background track is mixed in-process (see utils.mixer) and streamed to
+    ffmpeg as raw PCM over a pipe. The master is kept only until every rendition
+    is encoded from it, so a failed encode is resumed without mixing again.
+
+    Background track timing matches add_background_track().
+
+    Args:
+        tts_file (str): Path to the mono TTS WAV file.
+        output_wav (str): Path to the master WAV file.
+    Optional:
+        bg_track (str): Background track filename.
+        tts_start_delay_ms (int): Delay in milliseconds before TTS starts.
+        fade_duration_s (int): Duration of music fade-out in seconds, starting from TTS end.
+
+    Returns:
+        int: Episode duration (s).
+    """
+
+    # Ensure the input file exists
+    tts_path = Path(tts_file)
+    if not tts_path.exists():
+        raise FileNotFoundError(f"TTS file not found: {tts_file}")
+
+    if bg_track:
+        framerate, total_frames, blocks = mix_background(str(tts_path), bg_track, tts_start_delay_ms, fade_duration_s)
+        pcm_input = ["-f", "f32le", "-ar", str(framerate), "-ac", "2", "-i", "pipe:0"]
+        pcm_blocks = (block.astype("<f4").tobytes() for block in blocks)
+        output_rate = MIX_SAMPLE_RATE
+    else:
+        # TTS format and duration come from the WAV header, no decode required
+        with wave.open(str(tts_path), "rb") as w:
+            channels = w.getnchannels()
+            sample_width = w.getsampwidth()
+            framerate = w.getframerate()
+            total_frames = w.getnframes()
+
+        if sample_width != 2:
+            raise ValueError(f"Unsupported TTS sample width: {sample_width * 8} bit. Supported values: 16")
+
+        pcm_input = ["-f", "s16le", "-ar", str(framerate), "-ac", str(channels), "-i", "pipe:0"]
+        pcm_blocks = _read_wav_blocks(str(tts_path))
+        output_rate = framerate
+
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-loglevel", "error",
+        *pcm_input,
+        "-af", f"{LOUDNORM_FILTER},aresample={output_rate}",
+        "-c:a", "pcm_s16le",
+        "-y", # Overwrite output file if it exists
+        str(output_wav)
+    ]
+
+    print("\nRendering episode master...")
+    with span("ffmpeg render master", "ffmpeg", bg_track=bg_track):
+        pipe_to_ffmpeg(ffmpeg_cmd, pcm_blocks)
+
+    return int(total_frames / framerate)
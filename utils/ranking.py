@@ -0,0 +1,168 @@
+import html, re
+import numpy as np
+
+"""
+Story ranking for picking a diverse top N from a larger pool of feed items.
+Candidates are compared as TF-IDF vectors of their cheap text (title and
+description), built with vectorized NumPy operations. Each candidate gets a
+relevance score from its feed position, its centrality in the pool (topics
+covered by several items matter more) and the amount of text, scaled down
+when it repeats a recently covered story. Maximal marginal relevance (MMR)
+then orders the pool so that each pick is relevant but unlike earlier picks.
+"""
+
+# Relevance weights: feed position, centrality in the pool, text substance
+POSITION_WEIGHT = 0.5
+CENTRALITY_WEIGHT = 0.3
+SUBSTANCE_WEIGHT = 0.2
+
+# MMR trade-off between relevance (1.0) and diversity (0.0)
+MMR_LAMBDA = 0.7
+
+# Words ignored when building TF-IDF vectors
+STOP_WORDS = set("""
+a about after again against all also an and any are as at be because been before being between both but by
+can could did do does doing down during each few for from further had has have having he her here hers him his
+how i if in into is it its just more most my new no nor not now of off on once only or other our out over own
+said same says she should so some such than that the their them then there these they this those through to too
+under until up very was we were what when where which while who whom why will with would you your
+""".split())
+
+def strip_html(text: str) -> str:
+    """Remove HTML tags and entities from feed item text."""
+    return html.unescape(re.sub(r"<[^>]+>", " ", text or ""))
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens, without stop words and very short words."""
+    return [w for w in re.findall(r"[a-z0-9']+", text.lower()) if len(w) > 2 and w not in STOP_WORDS]
+
+def tfidf_matrix(
+    texts: list[str],
+    extra_texts: list[str] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build L2-normalized TF-IDF vectors for a set of texts.
+
+    Args:
+        texts (list[str]): Texts that define the vocabulary and document frequencies.
+    Optional:
+        extra_texts (list[str]): Texts projected onto the same vocabulary, e.g.
+            recently covered stories. Words outside the vocabulary are ignored.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Vectors for texts, shaped (len(texts), vocabulary),
+            and for extra_texts, shaped (len(extra_texts), vocabulary).
+    """
+    tokens = [tokenize(text) for text in texts]
+    vocabulary = {word: i for i, word in enumerate(sorted({w for doc in tokens for w in doc}))}
+
+    def counts(docs):
+        matrix = np.zeros((len(docs), max(1, len(vocabulary))), dtype=np.float32)
+        rows = [i for i, doc in enumerate(docs) for w in doc if w in vocabulary]
+        cols = [vocabulary[w] for doc in docs for w in doc if w in vocabulary]
+        np.add.at(matrix, (rows, cols), 1.0)
+        return matrix
+
+    tf = np.log1p(counts(tokens))
+    document_frequency = np.count_nonzero(tf, axis=0)
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+
+    def normalize(matrix):
+        weighted = matrix * idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        return weighted / np.where(norms == 0, 1, norms)
+
+    extra = counts([tokenize(text) for text in extra_texts or []])
+    return normalize(tf), normalize(np.log1p(extra))
+
+def relevance_scores(
+    vectors: np.ndarray,
+    lengths: np.ndarray,
+    recent_vectors: np.ndarray = None
+) -> np.ndarray:
+    """
+    Score candidates from feed position, centrality and substance, each scaled
+    to [0, 1], then scale by novelty against recently covered stories.
+
+    Args:
+        vectors (np.ndarray): Candidate TF-IDF vectors, in feed order.
+        lengths (np.ndarray): Number of words of text for each candidate.
+    Optional:
+        recent_vectors (np.ndarray): TF-IDF vectors of recently covered stories.
+
+    Returns:
+        np.ndarray: Relevance score of each candidate.
+    """
+    n = len(vectors)
+    position = 1.0 / (1.0 + 0.1 * np.arange(n))
+
+    # Mean similarity to the rest of the pool, not rescaled so that one
+    # duplicate pair does not outweigh the feed order
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+    centrality = similarity.sum(axis=1) / max(1, n - 1)
+
+    substance = np.log1p(lengths)
+    if substance.max() > 0:
+        substance = substance / substance.max()
+
+    scores = POSITION_WEIGHT * position + CENTRALITY_WEIGHT * centrality + SUBSTANCE_WEIGHT * substance
+
+    # A story that closely matches a recently covered one keeps little of its score
+    if recent_vectors is not None and len(recent_vectors):
+        novelty = 1.0 - np.clip((vectors @ recent_vectors.T).max(axis=1), 0.0, 1.0)
+        scores = scores * novelty
+    return scores
+
+def mmr_order(
+    vectors: np.ndarray,
+    scores: np.ndarray,
+    mmr_lambda: float = MMR_LAMBDA
+) -> list[int]:
+    """
+    Order candidates by maximal marginal relevance.
+
+    Args:
+        vectors (np.ndarray): Candidate TF-IDF vectors.
+        scores (np.ndarray): Relevance score of each candidate.
+        mmr_lambda (float): Trade-off between relevance (1.0) and diversity (0.0).
+
+    Returns:
+        list[int]: Candidate indices, best first. Every candidate is included,
+            so later entries can replace picks that fail to extract.
+    """
+    similarity = vectors @ vectors.T
+    max_similarity = np.zeros(len(scores))
+    remaining = np.ones(len(scores), dtype=bool)
+    order = []
+    for _ in range(len(scores)):
+        mmr = mmr_lambda * scores - (1 - mmr_lambda) * max_similarity
+        best = int(np.argmax(np.where(remaining, mmr, -np.inf)))
+        order.append(best)
+        remaining[best] = False
+        max_similarity = np.maximum(max_similarity, similarity[best])
+    return order
+
+def rank_candidates(
+    candidates: list[dict],
+    recent_texts: list[str] = None
+) -> list[int]:
+    """
+    Rank feed items for selection, see the module description.
+
+    Args:
+        candidates (list[dict]): Feed items in feed order, each with "title" and "description".
+    Optional:
+        recent_texts (list[str]): Titles or text of recently covered stories.
+
+    Returns:
+        list[int]: Candidate indices, best first.
+    """
+    if not candidates:
+        return []
+
+    texts = [f"{item['title']} {item['description']}" for item in candidates]
+    vectors, recent_vectors = tfidf_matrix(texts, recent_texts)
+    lengths = np.array([len(text.split()) for text in texts], dtype=np.float32)
+    scores = relevance_scores(vectors, lengths, recent_vectors)
+    return mmr_order(vectors, scores)
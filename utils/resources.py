@@ -0,0 +1,182 @@
+import csv, os, sys, threading, time
+
+import config as c
+from utils.container_management import get_docker_client
+
+"""
+Resource usage sampling for episode runs. A background thread records the
+memory (RSS) and CPU use of this process, and of the managed LLM and TTS
+containers from the Docker stats API, every SAMPLE_INTERVAL_S seconds
+(RESOURCE_SAMPLE_INTERVAL_S). Each sample is tagged with the pipeline stage
+running at the time (see set_stage()) and written to a CSV time series.
+CPU is given in percent of one core. Process RSS is read from /proc and is
+only sampled on Linux; elsewhere only the peak RSS of the process is known.
+"""
+SAMPLE_INTERVAL_S = 2.0
+CSV_COLUMNS = ["t_s", "stage", "source", "memory_mb", "cpu_pct"]
+
+# Name of the pipeline stage running in this process, used to tag samples
+_stage = None
+
+def set_stage(name: str):
+    """Set the pipeline stage that new samples are tagged with, or None between stages."""
+    global _stage
+    _stage = name
+
+def process_rss_bytes() -> int:
+    """Resident set size of this process in bytes, or None if it cannot be read."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+def process_peak_rss_bytes() -> int:
+    """Peak resident set size of this process in bytes, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def container_memory_bytes(stats: dict) -> int:
+    """Container memory use from Docker stats, excluding reclaimable page cache, as shown by docker stats."""
+    memory = stats.get("memory_stats", {})
+    details = memory.get("stats", {})
+    cache = details.get("inactive_file", details.get("total_inactive_file", 0))
+    return max(0, memory.get("usage", 0) - cache)
+
+class ResourceSampler():
+    """
+    Samples process and container resource use on a background thread.
+    Call start() before the work to measure and stop() after it.
+    """
+    def __init__(self, output_csv, containers=None, interval_s=None):
+        self.output_csv = output_csv
+        self.containers = containers if containers is not None else [c.CONTAINER_LLM, c.CONTAINER_TTS]
+        self.interval_s = float(interval_s or getattr(c, "RESOURCE_SAMPLE_INTERVAL_S", SAMPLE_INTERVAL_S))
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.peaks = {}
+        self.docker_available = True
+        self.one_shot = True
+        self.prev_cpu = {}
+
+    def start(self):
+        """Start sampling."""
+        self.start_time = time.perf_counter()
+        self.prev_cpu["process"] = (self.start_time, sum(os.times()[:2]))
+        self.thread.start()
+        return self
+
+    def stop(self) -> dict:
+        """
+        Stop sampling, take a final sample and write the time series.
+
+        Returns:
+            dict: Peak values by source ("process" or a container name), see summary().
+        """
+        self.stop_event.set()
+        self.thread.join()
+        print(f"Resource samples written: {self.output_csv}")
+        return self.summary()
+
+    def summary(self) -> dict:
+        """
+        Peak values by source, each a dict with "memory_mb", "memory_stage", "cpu_pct"
+        and "cpu_stage" (stage running at the peak). The process also gets "peak_rss_mb",
+        the peak RSS of the whole process lifetime reported by the OS.
+        """
+        peaks = {source: dict(values) for source, values in self.peaks.items()}
+        peak_rss = process_peak_rss_bytes()
+        if peak_rss is not None:
+            peaks.setdefault("process", {})["peak_rss_mb"] = round(peak_rss / 2**20, 1)
+        return peaks
+
+    def _run(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_csv)), exist_ok=True)
+        with open(self.output_csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            while True:
+                stopping = self.stop_event.wait(self.interval_s)
+                for row in self._sample():
+                    writer.writerow(row)
+                f.flush()
+                if stopping:
+                    break
+
+    def _sample(self):
+        """Take one sample of each source. Returns CSV rows."""
+        now = time.perf_counter()
+        t, stage = round(now - self.start_time, 2), _stage
+        rows = []
+
+        rss = process_rss_bytes()
+        cpu_time = sum(os.times()[:2])
+        prev_time, prev_cpu_time = self.prev_cpu["process"]
+        self.prev_cpu["process"] = (now, cpu_time)
+        cpu_pct = 100 * (cpu_time - prev_cpu_time) / max(now - prev_time, 1e-6)
+        rows.append(self._record(t, stage, "process", None if rss is None else rss / 2**20, cpu_pct))
+
+        for name, stats in self._container_stats():
+            cpu = stats.get("cpu_stats", {})
+            total, system = cpu.get("cpu_usage", {}).get("total_usage", 0), cpu.get("system_cpu_usage", 0)
+            prev_total, prev_system = self.prev_cpu.get(name, (total, system))
+            self.prev_cpu[name] = (total, system)
+            online_cpus = cpu.get("online_cpus") or 1
+            cpu_pct = 100 * online_cpus * (total - prev_total) / (system - prev_system) if system > prev_system else 0.0
+            rows.append(self._record(t, stage, name, container_memory_bytes(stats) / 2**20, cpu_pct))
+        return rows
+
+    def _record(self, t, stage, source, memory_mb, cpu_pct):
+        """Update the peaks of a source and build its CSV row."""
+        peaks = self.peaks.setdefault(source, {"memory_mb": 0.0, "memory_stage": None, "cpu_pct": 0.0, "cpu_stage": None})
+        if memory_mb is not None and memory_mb > peaks["memory_mb"]:
+            peaks.update(memory_mb=round(memory_mb, 1), memory_stage=stage)
+        if cpu_pct > peaks["cpu_pct"]:
+            peaks.update(cpu_pct=round(cpu_pct, 1), cpu_stage=stage)
+        return [t, stage or "", source, "" if memory_mb is None else round(memory_mb, 1), round(cpu_pct, 1)]
+
+    def _container_stats(self):
+        """Docker stats of the running managed containers, as (name, stats) pairs."""
+        if not self.containers or not self.docker_available:
+            return []
+        try:
+            running = [container for container in get_docker_client().containers.list() if container.name in self.containers]
+        except Exception as e:
+            print(f"Container sampling disabled, Docker unavailable: {e}")
+            self.docker_available = False
+            return []
+
+        from docker.errors import InvalidVersion
+        results = []
+        for container in running:
+            try:
+                if self.one_shot:
+                    try:
+                        stats = container.stats(stream=False, one_shot=True)
+                    except InvalidVersion:
+                        # Docker API < 1.41, fall back to regular stats, which take about a second
+                        self.one_shot = False
+                        stats = container.stats(stream=False)
+                else:
+                    stats = container.stats(stream=False)
+                results.append((container.name, stats))
+            except Exception as e:
+                # The container may have stopped since it was listed
+                print(f"Could not read stats for container '{container.name}': {e}")
+        return results
+
+def print_resource_summary(peaks: dict):
+    """Print peak memory and CPU use by source, with the stage running at each peak."""
+    if not peaks:
+        return
+    print("\nPeak resource use:")
+    for source, values in peaks.items():
+        line = f"{source:>20}: {values.get('memory_mb', 0.0):8.1f} MB ({values.get('memory_stage') or '-'}), {values.get('cpu_pct', 0.0):6.1f}% CPU ({values.get('cpu_stage') or '-'})"
+        if "peak_rss_mb" in values:
+            line += f", process peak RSS {values['peak_rss_mb']:.1f} MB"
+        print(line)
@@ -0,0 +1,304 @@
+import json, os, queue, threading, time, traceback
+from datetime import datetime, timedelta
+
+import config as c
+from utils.news import fetch_rss_news_stories
+from utils.podcast import create_episode, recent_story_titles
+
+"""
+Daemon mode: a resident process that builds episodes on a cron-like schedule.
+Modules, service clients and caches stay loaded between runs. News is
+prefetched PREFETCH_LEAD_S before each scheduled slot. Due jobs go to a
+bounded queue served by a single worker, so only one episode is built at a
+time (the LLM and TTS containers share the GPU) and jobs never share files.
+
+The schedule is read from the EPISODE_SCHEDULE setting, a JSON list of jobs:
+    [{"name": "kmart-morning", "cron": "0 7 * * *", "persona": "KMART_RADIO",
+      "title": "Kmart Radio News", "tts_start_delay_ms": 12000, "fade_duration_s": 5,
+      "target_duration_s": 300}]
+A persona name selects the SYSTEM_CHARACTER_<persona>, MASKGCT_VOICE_REF_<persona>,
+PODCAST_EPISODE_IMAGE_URL_<persona> and (optional) BG_TRACK_<persona> settings.
+Cron expressions use local time: minute hour day-of-month month day-of-week.
+A time matches when every field matches.
+"""
+PREFETCH_LEAD_S = 600
+SCHEDULE_POLL_S = 30
+MAX_QUEUED_JOBS = 4
+STATUS_PATH = "./cache/daemon_status.json"
+
+# Allowed range of each cron field: minute, hour, day of month, month, day of week (0 or 7 = Sunday)
+CRON_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+def parse_cron_field(field, low, high):
+    """
+    Parse one cron field into the set of values it matches.
+    Supports *, numbers, ranges (1-5), lists (1,3,5) and steps (*/15, 0-30/10).
+
+    Args:
+        field (str): Cron field.
+        low (int): Lowest allowed value.
+        high (int): Highest allowed value.
+
+    Returns:
+        set[int]: Matching values.
+    """
+    values = set()
+    for part in field.split(","):
+        part, _, step = part.partition("/")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(v) for v in part.split("-", 1))
+        else:
+            start = end = int(part)
+            if step:
+                end = high
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Invalid cron field: {field}. Allowed range: {low}-{high}")
+        values.update(range(start, end + 1, int(step) if step else 1))
+    return values
+
+def parse_cron(expr):
+    """
+    Parse a five field cron expression.
+
+    Args:
+        expr (str): Cron expression, e.g. "0 7 * * 1-5"
+
+    Returns:
+        list[set[int]]: Matching values of each field.
+    """
+    fields = expr.split()
+    if len(fields) != 5:
+        raise ValueError(f"Invalid cron expression: {expr}. Expected 5 fields: minute hour day month weekday")
+    parsed = [parse_cron_field(field, low, high) for field, (low, high) in zip(fields, CRON_FIELD_RANGES)]
+
+    # Day of week 7 is also Sunday
+    if 7 in parsed[4]:
+        parsed[4] = (parsed[4] - {7}) | {0}
+    return parsed
+
+def next_run_time(expr, after):
+    """
+    Get the first time after a given time that matches a cron expression.
+
+    Args:
+        expr (str): Cron expression.
+        after (datetime): Search start, exclusive.
+
+    Returns:
+        datetime: Next matching time, to the minute.
+    """
+    minutes, hours, days, months, weekdays = parse_cron(expr)
+    t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = t + timedelta(days=366 * 4)
+    while t < limit:
+        # Skip whole days that cannot match, then whole hours
+        if t.month not in months or t.day not in days or (t.isoweekday() % 7) not in weekdays:
+            t = t.replace(hour=0, minute=0) + timedelta(days=1)
+        elif t.hour not in hours:
+            t = t.replace(minute=0) + timedelta(hours=1)
+        elif t.minute not in minutes:
+            t += timedelta(minutes=1)
+        else:
+            return t
+    raise ValueError(f"Cron expression never matches: {expr}")
+
+def load_schedule():
+    """
+    Load the episode schedule from the EPISODE_SCHEDULE setting.
+
+    Returns:
+        list[dict]: Jobs, each with a unique "name" and a validated "cron" expression.
+    """
+    jobs = getattr(c, "EPISODE_SCHEDULE", None) or []
+    if isinstance(jobs, str):
+        jobs = json.loads(jobs)
+
+    names = set()
+    for n, job in enumerate(jobs):
+        job.setdefault("name", f"{job['persona'].lower()}-{n}")
+        if job["name"] in names:
+            raise ValueError(f"Duplicate job name in EPISODE_SCHEDULE: {job['name']}")
+        names.add(job["name"])
+        parse_cron(job["cron"])
+    return jobs
+
+def job_episode_args(job):
+    """
+    Build create_episode() arguments for a scheduled job from its persona settings.
+
+    Args:
+        job (dict): Scheduled job, see load_schedule().
+
+    Returns:
+        dict: Keyword arguments for create_episode().
+    """
+    persona = job["persona"]
+    return {
+        "character_system_prompt": getattr(c, f"SYSTEM_CHARACTER_{persona}"),
+        "character_voice_ref": getattr(c, f"MASKGCT_VOICE_REF_{persona}"),
+        "episode_image": getattr(c, f"PODCAST_EPISODE_IMAGE_URL_{persona}"),
+        "title": job["title"],
+        "bg_track": job.get("bg_track", getattr(c, f"BG_TRACK_{persona}", None)),
+        "tts_start_delay_ms": job.get("tts_start_delay_ms"),
+        "fade_duration_s": job.get("fade_duration_s"),
+        "target_duration_s": job.get("target_duration_s")
+    }
+
+class EpisodeScheduler():
+    """
+    Runs scheduled episode jobs until stopped. Job status, the queue and the
+    timings and peak resource use of each job's last run are written to STATUS_PATH as JSON.
+    """
+    def __init__(self, jobs, status_path=STATUS_PATH):
+        self.jobs = {job["name"]: job for job in jobs}
+        self.status_path = status_path
+        self.job_queue = queue.Queue(maxsize=MAX_QUEUED_JOBS)
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+
+        # Prefetched news, shared by jobs that run close together: (fetch time, stories)
+        self.news = None
+        self.news_lock = threading.Lock()
+        self.prefetching = False
+
+        now = datetime.now()
+        self.status = {
+            "pid": os.getpid(),
+            "started": now.isoformat(timespec="seconds"),
+            "running": None,
+            "queued": [],
+            "jobs": {
+                name: {"cron": job["cron"], "next_run": next_run_time(job["cron"], now).isoformat(), "prefetched": False, "last_run": None}
+                for name, job in self.jobs.items()
+            }
+        }
+
+    def run(self):
+        """Run the schedule loop in this thread and the job worker in another, until stop() is called."""
+        worker = threading.Thread(target=self._worker, daemon=True)
+        worker.start()
+        self._write_status()
+        print(f"Episode scheduler started with {len(self.jobs)} jobs: {', '.join(self.jobs)}")
+
+        while not self.stop_event.is_set():
+            now = datetime.now()
+            for name in self.jobs:
+                with self.lock:
+                    job_status = self.status["jobs"][name]
+                    next_run = datetime.fromisoformat(job_status["next_run"])
+
+                    if not job_status["prefetched"] and now >= next_run - timedelta(seconds=PREFETCH_LEAD_S):
+                        job_status["prefetched"] = True
+                        self._start_prefetch()
+
+                    if now >= next_run:
+                        job_status["next_run"] = next_run_time(self.jobs[name]["cron"], now).isoformat()
+                        job_status["prefetched"] = False
+                        self._enqueue(name)
+            self._write_status()
+            self.stop_event.wait(self._seconds_to_next_event())
+
+        self.job_queue.put(None)
+        worker.join()
+        print("Episode scheduler stopped")
+
+    def stop(self):
+        """Stop scheduling. A job in progress is finished first."""
+        self.stop_event.set()
+
+    def _enqueue(self, name):
+        """Queue a due job, or record it as skipped when the queue is full. Caller must hold self.lock."""
+        try:
+            self.job_queue.put_nowait(name)
+            self.status["queued"].append(name)
+            print(f"Queued job: {name}")
+        except queue.Full:
+            self.status["jobs"][name]["last_run"] = {"status": "skipped", "error": "Job queue full", "queued_at": datetime.now().isoformat(timespec="seconds")}
+            print(f"Job queue full, skipping: {name}")
+
+    def _seconds_to_next_event(self):
+        """Time until the next prefetch or job slot, at most SCHEDULE_POLL_S."""
+        now = datetime.now()
+        wait = SCHEDULE_POLL_S
+        with self.lock:
+            for job_status in self.status["jobs"].values():
+                next_run = datetime.fromisoformat(job_status["next_run"])
+                event = next_run if job_status["prefetched"] else next_run - timedelta(seconds=PREFETCH_LEAD_S)
+                wait = min(wait, max(0.0, (event - now).total_seconds()))
+        return wait
+
+    def _start_prefetch(self):
+        """Prefetch news in the background, unless news is already fresh or being fetched."""
+        with self.news_lock:
+            if self.prefetching or (self.news and time.time() - self.news[0] <= PREFETCH_LEAD_S):
+                return
+            self.prefetching = True
+        threading.Thread(target=self._prefetch_news, daemon=True).start()
+
+    def _prefetch_news(self):
+        """Fetch news stories ahead of a scheduled slot."""
+        news = None
+        try:
+            news_stories = fetch_rss_news_stories(c.RSS_NEWS_FEED, int(c.TOP_N_STORIES), recent_story_titles())
+            news = (time.time(), news_stories)
+            print(f"Prefetched {len(news_stories)} news stories")
+        except Exception as e:
+            print(f"News prefetch failed, stories will be fetched when the job runs: {e}")
+        with self.news_lock:
+            self.news = news or self.news
+            self.prefetching = False
+
+    def _take_news(self):
+        """Prefetched news stories, if fetched within 2 * PREFETCH_LEAD_S, otherwise None."""
+        with self.news_lock:
+            if self.news and time.time() - self.news[0] <= 2 * PREFETCH_LEAD_S:
+                return self.news[1]
+        return None
+
+    def _worker(self):
+        """Run queued jobs one at a time. An error outside the job itself, e.g. writing the status file, skips to the next job."""
+        while True:
+            name = self.job_queue.get()
+            if name is None:
+                break
+            try:
+                self._run_job(name)
+            except Exception:
+                traceback.print_exc()
+
+    def _run_job(self, name):
+        """Run a job, recording its last run in the status."""
+        started = datetime.now()
+        with self.lock:
+            self.status["queued"].remove(name)
+            self.status["running"] = name
+        self._write_status()
+
+        last_run = {"started": started.isoformat(timespec="seconds")}
+        try:
+            print(f"\nRunning job: {name}")
+            result = create_episode(**job_episode_args(self.jobs[name]), news_stories=self._take_news())
+            last_run.update(status="ok", episode_id=result["episode_id"], timings=result["timings"], resources=result["resources"])
+        except Exception as e:
+            traceback.print_exc()
+            last_run.update(status="failed", error=str(e))
+        last_run["duration_s"] = (datetime.now() - started).total_seconds()
+
+        with self.lock:
+            self.status["running"] = None
+            self.status["jobs"][name]["last_run"] = last_run
+        self._write_status()
+
+    def _write_status(self):
+        """Write the daemon status file, replacing it atomically. Writes from both threads are serialized by self.lock."""
+        with self.lock:
+            self.status["updated"] = datetime.now().isoformat(timespec="seconds")
+            status = json.dumps(self.status, indent=2)
+            os.makedirs(os.path.dirname(self.status_path), exist_ok=True)
+            tmp_path = self.status_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(status)
+            os.replace(tmp_path, self.status_path)
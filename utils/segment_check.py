@@ -0,0 +1,127 @@
+import re, unicodedata
+
+"""
+Quality gate for LLM generated news segments, run before text-to-speech.
+A bad segment (leaked reasoning or chat template tags, markdown, truncated
+or runaway output, text in another script) costs many minutes of TTS and
+gives unusable audio. The checks are structural and take milliseconds.
+Markdown is removed and common symbols are spelled out in place by
+clean_news_segment(); anything else that fails the checks is regenerated
+while the LLM container is still running. A few characters the TTS model may
+not read (e.g. a proper noun in another script) only give a warning, since a
+regenerated segment is written from the same story summaries.
+"""
+
+# Length bounds of a news segment, in words
+MIN_WORDS_PER_STORY = 25
+MAX_WORDS_PER_STORY = 400
+MAX_WORDS_EXTRA = 300  # Allowance for intro and outro
+
+# Characters a segment may end with, anything else is treated as truncated output
+SENTENCE_END_CHARS = ".!?…\"'”’)"
+
+# Punctuation and symbols the TTS model reads correctly, besides letters, digits and whitespace
+SPEAKABLE_SYMBOLS = set(".,;:!?'\"()-–—…’‘“”%$€£&/+@")
+
+# Share of non-space characters that are not speakable above which a segment fails, instead of a warning
+MAX_UNSUPPORTED_SHARE = 0.05
+
+# Currency symbols the TTS model does not read, spoken after the amount
+CURRENCY_WORDS = {"¥": "yen", "₹": "rupees", "₩": "won", "₽": "rubles", "₺": "lira", "₿": "bitcoin", "¢": "cents"}
+
+LEAKED_TAG_PATTERN = re.compile(r"</?[a-zA-Z][\w-]*(\s[^<>]*)?/?>|<\|[^|<>]*\|>|\[/?INST\]")
+
+MARKDOWN_PATTERNS = [
+    (re.compile(r"^\s{0,3}#{1,6}\s+", re.MULTILINE), ""),                 # Headings
+    (re.compile(r"^\s*[-*+•]\s+", re.MULTILINE), ""),                     # Bullet lists
+    (re.compile(r"^\s*\d+[.)]\s+", re.MULTILINE), ""),                    # Numbered lists
+    (re.compile(r"^\s*([-*_]\s*){3,}$", re.MULTILINE), ""),               # Horizontal rules
+    (re.compile(r"(\*\*|__)(.+?)\1", re.DOTALL), r"\2"),                  # Bold
+    (re.compile(r"(?<![\w*])\*(?!\s)([^*\n]+?)(?<!\s)\*(?![\w*])"), r"\1"),  # Italics
+    (re.compile(r"`+([^`]*)`+"), r"\1"),                                  # Code
+    (re.compile(r"\[([^\]]+)\]\([^)]+\)"), r"\1")                         # Links
+]
+
+_currency = "".join(CURRENCY_WORDS)
+SYMBOL_PATTERNS = [
+    (re.compile(r"\s*°\s*F\b"), " degrees Fahrenheit"),
+    (re.compile(r"\s*°\s*C\b"), " degrees Celsius"),
+    (re.compile(r"\s*°"), " degrees"),
+    (re.compile(r"#(?=\d)"), "number "),
+    (re.compile(r"#(?=\w)"), "hashtag "),
+    (re.compile(r"(?<=\d)\s*[*×]\s*(?=\d)"), " times "),
+    (re.compile(r"\s*=\s*"), " equals "),
+    (re.compile(r"~\s*(?=\d)"), "about "),
+    (re.compile(r"\[(?!/?INST\])([^\[\]]*)\]"), r"(\1)"),         # Brackets, keeping leaked [INST] tags
+    (re.compile(r"\{([^{}]*)\}"), r"(\1)"),
+    (re.compile(rf"([{_currency}])\s*(\d+(?:[.,]\d+)*(?:\s(?:million|billion|trillion))?)"),
+     lambda m: f"{m.group(2)} {CURRENCY_WORDS[m.group(1)]}"),
+    (re.compile(rf"(\d+(?:[.,]\d+)*)\s*([{_currency}])"), lambda m: f"{m.group(1)} {CURRENCY_WORDS[m.group(2)]}")
+]
+
+def clean_news_segment(text: str) -> str:
+    """
+    Remove markdown formatting from a news segment, keeping the spoken text,
+    and spell out symbols the TTS model does not read (degrees, #, =, brackets,
+    currencies in CURRENCY_WORDS).
+
+    Args:
+        text (str): News segment text.
+
+    Returns:
+        str: News segment without markdown.
+    """
+    for pattern, replacement in MARKDOWN_PATTERNS + SYMBOL_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+def check_news_segment(
+    text: str,
+    n_stories: int
+) -> list[str]:
+    """
+    Run structural checks on a news segment before text-to-speech.
+
+    Args:
+        text (str): News segment text, after clean_news_segment().
+        n_stories (int): Number of news stories in the segment.
+
+    Returns:
+        list[str]: Problems found, empty if the segment passes.
+    """
+    problems = []
+
+    tags = [m.group(0) for m in LEAKED_TAG_PATTERN.finditer(text)]
+    if tags:
+        problems.append(f"Leaked tags: {', '.join(sorted(set(tags))[:5])}")
+
+    if any(pattern.search(text) for pattern, _ in MARKDOWN_PATTERNS):
+        problems.append("Markdown formatting")
+
+    n_words = len(text.split())
+    min_words = MIN_WORDS_PER_STORY * n_stories
+    max_words = MAX_WORDS_PER_STORY * n_stories + MAX_WORDS_EXTRA
+    if n_words < min_words:
+        problems.append(f"Too short: {n_words} words, expected at least {min_words}")
+    elif n_words > max_words:
+        problems.append(f"Too long: {n_words} words, expected at most {max_words}")
+
+    if text and text.rstrip()[-1] not in SENTENCE_END_CHARS:
+        problems.append(f"Truncated: ends with \"{text.rstrip()[-30:]}\"")
+
+    unspeakable = [ch for ch in text if not _is_speakable(ch)]
+    if unspeakable:
+        share = len(unspeakable) / max(1, len(text) - sum(ch.isspace() for ch in text))
+        message = f"Unsupported characters: {' '.join(sorted(set(unspeakable))[:10])}"
+        if share > MAX_UNSUPPORTED_SHARE:
+            problems.append(f"{message} ({share:.0%} of the text)")
+        else:
+            print(f"Warning: {message}")
+
+    return problems
+
+def _is_speakable(ch):
+    """Whether a character is whitespace, a digit, a Latin letter or a supported symbol."""
+    if ch.isspace() or ch.isdigit() or ch in SPEAKABLE_SYMBOLS:
+        return True
+    return ch.isalpha() and unicodedata.name(ch, "").startswith("LATIN")
@@ -0,0 +1,123 @@
+import json, os, threading, time
+from contextlib import contextmanager
+
+"""
+Lightweight tracing for the episode pipeline.
+Spans are only recorded between start_trace() and stop_trace(), so traced
+calls cost almost nothing outside of a traced run. Recorded spans can be
+written as a Chrome trace (open in chrome://tracing or https://ui.perfetto.dev)
+and summarized as a list of the slowest spans.
+"""
+_events = None
+_origin_ns = 0
+_lock = threading.Lock()
+
+def start_trace():
+    """Start recording spans, discarding any spans from an earlier trace."""
+    global _events, _origin_ns
+    with _lock:
+        _events = []
+        _origin_ns = time.perf_counter_ns()
+
+def stop_trace() -> list:
+    """
+    Stop recording spans.
+
+    Returns:
+        list[dict]: Recorded spans as Chrome trace complete events, in end order.
+    """
+    global _events
+    with _lock:
+        events, _events = _events or [], None
+    return events
+
+@contextmanager
+def span(
+    name: str,
+    category: str = "pipeline",
+    **args
+):
+    """
+    Record the duration of a block of code as a span.
+    Spans are nested by time, per thread, when viewed as a Chrome trace.
+
+    Args:
+        name (str): Span name, e.g. "tts chunk"
+        category (str): Span category, e.g. "stage", "llm", "ffmpeg"
+        **args: JSON serializable details shown with the span, e.g. a file name.
+            Keys can be added inside the block through the yielded dict.
+    """
+    if _events is None:
+        yield args
+        return
+
+    start_ns = time.perf_counter_ns()
+    try:
+        yield args
+    finally:
+        end_ns = time.perf_counter_ns()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - _origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args
+        }
+        with _lock:
+            if _events is not None:
+                _events.append(event)
+
+def write_chrome_trace(
+    output_path: str,
+    events: list
+):
+    """
+    Write spans to a Chrome trace JSON file.
+
+    Args:
+        output_path (str): Path to the trace file.
+        events (list[dict]): Spans returned by stop_trace().
+    """
+    # Name each thread after the first span recorded on it
+    thread_names = {}
+    for event in sorted(events, key=lambda e: e["ts"]):
+        thread_names.setdefault((event["pid"], event["tid"]), event["name"])
+    metadata = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        for (pid, tid), name in thread_names.items()
+    ]
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+    print(f"Trace written: {output_path}")
+
+def print_slowest(
+    events: list,
+    top_n: int = 10
+):
+    """
+    Print the slowest spans, and the total time spent in each span name.
+
+    Args:
+        events (list[dict]): Spans returned by stop_trace().
+        top_n (int): Number of spans and span names to print.
+    """
+    if not events:
+        return
+
+    print(f"\nSlowest {min(top_n, len(events))} spans:")
+    for event in sorted(events, key=lambda e: e["dur"], reverse=True)[:top_n]:
+        details = ", ".join(f"{k}={v}" for k, v in event["args"].items())
+        print(f"{event['dur'] / 1e6:10.2f}s  {event['cat']}: {event['name']}" + (f" ({details})" if details else ""))
+
+    totals = {}
+    for event in events:
+        count, total = totals.get((event["cat"], event["name"]), (0, 0.0))
+        totals[(event["cat"], event["name"])] = (count + 1, total + event["dur"])
+
+    print("\nTotal time by span name:")
+    for (category, name), (count, total) in sorted(totals.items(), key=lambda t: t[1][1], reverse=True)[:top_n]:
+        print(f"{total / 1e6:10.2f}s  {category}: {name} x{count}")
@@ -1,7 +1,11 @@
-import glob, os, shutil, time, wave
-from gradio_client import Client, handle_file
+import itertools, os, queue, threading, time, wave
+import numpy as np
 
 import config as c
+from utils.audio import read_wav, to_pcm_bytes, trim_silence, normalize_level, remember_duration
+from utils.duration import record_chunk_durations, predict_spoken_seconds
+from utils.voice_prep import voice_prep_enabled, prepare_voice_ref, record_chunk_latency
+from utils.tracing import span
 
 """
 Multiple retries are made if TTS API calls fail. This accounts
@@ -13,87 +17,220 @@ RETRY_INTERVAL = 2
 
 OUTPUT_WAV_FILENAME = "tts_output.wav"
 
+# Maximum length of a text chunk sent to TTS, in characters
+CHUNK_MAX_CHARS = 250
+
+"""
+Post-processing applied to each TTS chunk before it is appended to the output.
+Silence below SILENCE_THRESHOLD_DB is trimmed from both ends of a chunk, keeping
+SILENCE_PAD_MS of padding. Chunks are joined with CHUNK_GAP_MS of silence.
+Levels are given in dBFS.
+"""
+SILENCE_THRESHOLD_DB = -45.0
+SILENCE_PAD_MS = 60
+CHUNK_GAP_MS = 200
+TARGET_RMS_DB = -20.0
+PEAK_CEILING_DB = -1.0
+
+def connect_tts(base_url):
+    """Connect to the MaskGCT Gradio app. gradio_client is imported on first use."""
+    from gradio_client import Client
+    return Client(base_url)
+
 def maskgct_generate_audio(
     voices_dir: str,
     voice_ref: str,
     timesteps: str,
-    input_text: str
+    input_text: str,
+    max_chunks: int = None,
+    output_wav: str = OUTPUT_WAV_FILENAME,
+    prepare_voice: bool = None
 ) -> str:
     """
     Generate audio using MaskGCT Text-to-Speech.
     Multiple retries are made if API calls fail.
 
+    Synthesized chunks are handed to a worker thread through a queue. The worker
+    trims silence, normalizes levels, and appends each chunk to the output WAV
+    while later chunks are still being generated. Chunk text and durations are
+    recorded to calibrate spoken duration predictions for the voice, and
+    inference times to compare raw and prepared voice references.
+
     Args:
         voices_dir (str): User-defined system prompt.
         voice_ref (str): User-defined summarization prompt.
         timesteps (str): Iterations used during TTS inference
         input_text (str): Text to convert to audio with TTS.
+    Optional:
+        max_chunks (int): Only synthesize the first N text chunks, e.g. for previews.
+        output_wav (str): Path to the merged output WAV file.
+        prepare_voice (bool): Send the prepared voice reference (see utils/voice_prep.py)
+            instead of the raw file. Default VOICE_PREP.
 
     Returns:
         str: Reference to output WAV file path (absolute path).
     """
 
-    chunks = get_chunks(input_text, 250)
+    # Whitespace-only chunks have nothing to speak
+    chunks = list(itertools.islice((chunk for chunk in get_chunks(input_text, CHUNK_MAX_CHARS) if chunk.strip()), max_chunks))
+    if not chunks:
+        raise ValueError("No text to synthesize: input text is empty or max_chunks is 0")
+
+    from gradio_client import handle_file
 
     # Check that path to TTS voice sample exists
     voice_path = os.path.join(voices_dir, voice_ref)
     if not os.path.exists(voice_path):
         raise FileNotFoundError(f"TTS voice reference file not found: {voice_path}")
 
-    # Create or verify ./tmp directory exists for partial output WAVs & clear it
-    os.makedirs("./tmp", exist_ok=True)
-    [os.remove(f) for f in glob.glob('tmp/*') if os.path.isfile(f)]
-    
-    infiles = []
-    for chunk in chunks:
-        print(chunk)
-        retries = 0
-        # Try the API call multiple times after failure
-        while retries < MAX_RETRIES:
-            try:
-                client = Client(c.MASKGCT_BASE_URL)
-                result = client.predict(
-                        prompt_wav=handle_file(voice_path),
-                        target_text=chunk,
-                        target_len=-1,
-                        n_timesteps=int(timesteps),
-                        api_name="/inference"
-                )
-                break # Exit retry loop on success
-            except Exception as e:
-                print(f"Attempt {retries + 1} failed: {e}")
-                retries += 1
-                if retries < MAX_RETRIES:
-                    time.sleep(RETRY_INTERVAL)
-                else:
-                    raise Exception("Failed after maximum number of retries.")
-                
-        # Default location for result (MaskGCT API output) is /temp/gradio/...
-        # Move it to ./tmp
-        shutil.move(result, "./tmp")
-        infiles.append("./tmp/" + result.split('/')[-1])
-    
-    # Create output WAV base filename
-    output_wav = OUTPUT_WAV_FILENAME
-    
-    # Merge all WAVs from /tmp
-    data= []
-    for infile in infiles:
-        w = wave.open(infile, 'rb')
-        data.append( [w.getparams(), w.readframes(w.getnframes())] )
-        w.close()
-    output = wave.open(output_wav, 'wb')
-    output.setparams(data[0][0])
-    for i in range(len(data)):
-        output.writeframes(data[i][1])
-    output.close()
-    
-    # Remove all files in temporary file directory (indivi)
-    [os.remove(f) for f in glob.glob('tmp/*') if os.path.isfile(f)]
+    # Prepared references are cached, this is a file hash after the first run
+    if prepare_voice is None:
+        prepare_voice = voice_prep_enabled()
+    if prepare_voice:
+        voice_path = prepare_voice_ref(voice_path)["path"]
+    latencies = []
+
+    # Start the assembly worker, which consumes chunk WAVs as they arrive
+    chunk_queue = queue.Queue()
+    assembly = {"error": None, "frames": 0, "framerate": 0, "chunks": []}
+    worker = threading.Thread(
+        target=_assemble_chunks,
+        args=(chunk_queue, output_wav, assembly),
+        daemon=True
+    )
+    worker.start()
+
+    client = None
+    try:
+        for chunk in chunks:
+            # Stop producing audio if the worker can no longer consume it
+            if assembly["error"]:
+                break
+
+            print(chunk)
+            retries = 0
+            # Try the API call multiple times after failure
+            while retries < MAX_RETRIES:
+                try:
+                    if client is None:
+                        client = connect_tts(c.MASKGCT_BASE_URL)
+                    start = time.perf_counter()
+                    with span("tts chunk", "tts", chars=len(chunk), attempt=retries + 1):
+                        result = client.predict(
+                                prompt_wav=handle_file(voice_path),
+                                target_text=chunk,
+                                target_len=-1,
+                                n_timesteps=int(timesteps),
+                                api_name="/inference"
+                        )
+                    latencies.append((len(chunk), time.perf_counter() - start))
+                    break # Exit retry loop on success
+                except Exception as e:
+                    print(f"Attempt {retries + 1} failed: {e}")
+                    client = None
+                    retries += 1
+                    if retries < MAX_RETRIES:
+                        time.sleep(RETRY_INTERVAL)
+                    else:
+                        raise Exception("Failed after maximum number of retries.")
+
+            # Default location for result (MaskGCT API output) is /temp/gradio/...
+            # The worker reads it from there and removes it once appended
+            chunk_queue.put((result, chunk))
+    finally:
+        chunk_queue.put(None)
+        worker.join()
+
+    if assembly["error"]:
+        raise RuntimeError(f"Failed to assemble TTS output: {assembly['error']}")
+
+    # Duration is known from the assembled frames, later stages need not probe it
+    remember_duration(output_wav, assembly["frames"] / assembly["framerate"])
+    record_chunk_durations(voice_ref, assembly["chunks"])
+    record_chunk_latency(voice_ref, timesteps, prepare_voice, latencies)
 
     # Return absolute path to the output WAV file
     print(f"Merged WAV: {os.path.abspath(output_wav)}")
-    return os.path.abspath(os.path.abspath(output_wav))
+    return os.path.abspath(output_wav)
+
+def _assemble_chunks(
+    chunk_queue: queue.Queue,
+    output_wav: str,
+    assembly: dict
+):
+    """
+    Worker loop that appends TTS chunk WAVs to the output WAV as they arrive.
+    Leading and trailing silence is trimmed from each chunk, levels are
+    normalized, and a short gap is inserted between chunks.
+    A None item on the queue ends the loop. After a failure, the remaining
+    chunk WAVs are removed up to the None item.
+
+    Args:
+        chunk_queue (queue.Queue): Chunk WAV file paths and chunk text, in playback order.
+        output_wav (str): Path to the merged output WAV file.
+        assembly (dict): Shared state. Receives "frames", "framerate", "error"
+            and "chunks" (text and trimmed duration (s) of each chunk).
+    """
+    output = None
+    chunk_wav = None
+    try:
+        while True:
+            item = chunk_queue.get()
+            if item is None:
+                break
+            chunk_wav, chunk_text = item
+
+            with span("tts assemble", "tts"):
+                samples, framerate = read_wav(chunk_wav)
+                samples = trim_silence(samples, framerate, SILENCE_THRESHOLD_DB, SILENCE_PAD_MS)
+                samples = normalize_level(samples, TARGET_RMS_DB, PEAK_CEILING_DB)
+                assembly["chunks"].append((chunk_text, len(samples) / framerate))
+
+                if output is None:
+                    output = wave.open(output_wav, "wb")
+                    output.setnchannels(samples.shape[1])
+                    output.setsampwidth(2)
+                    output.setframerate(framerate)
+                    assembly["framerate"] = framerate
+                elif framerate != assembly["framerate"] or samples.shape[1] != output.getnchannels():
+                    raise ValueError(f"TTS chunk format does not match previous chunks: {chunk_wav}")
+                else:
+                    gap = np.zeros((framerate * CHUNK_GAP_MS // 1000, samples.shape[1]), dtype=np.float32)
+                    samples = np.concatenate((gap, samples))
+
+                output.writeframes(to_pcm_bytes(samples))
+                assembly["frames"] += len(samples)
+                os.remove(chunk_wav)
+
+    except Exception as e:
+        assembly["error"] = e
+        # Remove the failed chunk and drain the rest up to the end marker, so no temporary WAVs are left
+        pending = [chunk_wav]
+        while (item := chunk_queue.get()) is not None:
+            pending.append(item[0])
+        for path in pending:
+            if path and os.path.exists(path):
+                os.remove(path)
+    finally:
+        if output is not None:
+            output.close()
+
+def estimate_spoken_seconds(
+    input_text: str,
+    voice_ref: str
+) -> float:
+    """
+    Predict the duration of the speech generated from a text, before running TTS.
+    See utils/duration.py.
+
+    Args:
+        input_text (str): Text to convert to audio with TTS.
+        voice_ref (str): Voice reference filename.
+
+    Returns:
+        float: Predicted duration (s) of the merged output WAV.
+    """
+    return predict_spoken_seconds(get_chunks(input_text, CHUNK_MAX_CHARS), voice_ref, CHUNK_GAP_MS)
 
 def get_chunks(
     input_text: str,
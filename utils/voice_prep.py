@@ -0,0 +1,208 @@
+import hashlib, json, os, subprocess, threading, wave
+import numpy as np
+
+import config as c
+from utils.audio import to_pcm_bytes, trim_silence, normalize_level
+from utils.tracing import span
+
+"""
+Voice reference preparation for MaskGCT. The reference WAV is sent with every
+TTS chunk, and inference time grows with its length. References are converted
+to mono at the model's sample rate (VOICE_SAMPLE_RATE), trimmed of leading and
+trailing silence, levelled and cropped to at most VOICE_REF_MAX_SECONDS
+(optional setting), ending in a quiet moment near the limit so no word is
+cut. Prepared references are cached in VOICE_CACHE_DIR by a hash of the source
+file and these settings. Set VOICE_PREP=false to send the raw references.
+"""
+VOICE_CACHE_DIR = "./cache/voices"
+VOICE_SAMPLE_RATE = 24000
+VOICE_REF_MAX_SECONDS = 10.0
+
+# Crops end in a quiet 10 ms window in the last VOICE_CROP_SEARCH_S before the limit
+VOICE_CROP_SEARCH_S = 2.0
+
+# Silence trimming and levels (dBFS), matching TTS chunk post-processing
+VOICE_SILENCE_DB = -45.0
+VOICE_SILENCE_PAD_MS = 100
+VOICE_TARGET_RMS_DB = -20.0
+VOICE_PEAK_CEILING_DB = -1.0
+
+"""
+TTS latency is recorded per voice and inference timesteps, separately for chunks
+synthesized with raw and prepared references, as seconds per input character.
+latency_report() compares them. VOICE_PROBE_TEXT is synthesized once with a raw
+reference when there is no raw latency to compare with.
+"""
+LATENCY_PATH = "./cache/voice_latency.json"
+VOICE_PROBE_TEXT = (
+    "Good morning and welcome to the news. Here is a short sentence to measure "
+    "how long the voice takes to speak, with a pause or two, and a question: ready?"
+)
+
+_latency = None
+_latency_lock = threading.Lock()
+
+def voice_prep_enabled() -> bool:
+    """Whether voice references are prepared before TTS (VOICE_PREP, default on)."""
+    return str(getattr(c, "VOICE_PREP", "true")).strip().lower() not in ("0", "false", "no")
+
+def prepare_voice_ref(
+    voice_path: str,
+    max_seconds: float = None
+) -> dict:
+    """
+    Prepare a voice reference for TTS, or reuse a cached preparation.
+
+    Args:
+        voice_path (str): Path to the source voice reference, any format ffmpeg reads.
+    Optional:
+        max_seconds (float): Maximum reference length (s), default VOICE_REF_MAX_SECONDS.
+
+    Returns:
+        dict: "path" (prepared WAV), "source_s" and "prepared_s" (durations) and
+            "cached" (True if the preparation was reused).
+    """
+    if not os.path.exists(voice_path):
+        raise FileNotFoundError(f"TTS voice reference file not found: {voice_path}")
+    max_seconds = float(max_seconds or getattr(c, "VOICE_REF_MAX_SECONDS", VOICE_REF_MAX_SECONDS))
+
+    # Source content and every setting that changes the output go into the cache key
+    digest = hashlib.sha256()
+    with open(voice_path, "rb") as f:
+        for block in iter(lambda: f.read(2**20), b""):
+            digest.update(block)
+    digest.update(json.dumps([VOICE_SAMPLE_RATE, max_seconds, VOICE_CROP_SEARCH_S, VOICE_SILENCE_DB,
+                              VOICE_SILENCE_PAD_MS, VOICE_TARGET_RMS_DB, VOICE_PEAK_CEILING_DB]).encode("utf-8"))
+    stem = os.path.splitext(os.path.basename(voice_path))[0]
+    prepared_path = os.path.join(VOICE_CACHE_DIR, f"{stem}-{digest.hexdigest()[:16]}.wav")
+    meta_path = prepared_path[:-4] + ".json"
+
+    if os.path.exists(prepared_path) and os.path.exists(meta_path):
+        # Mark the cache entry as used, for artifact retention (see utils/artifacts.py)
+        os.utime(prepared_path)
+        os.utime(meta_path)
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return dict(json.load(f), path=os.path.abspath(prepared_path), cached=True)
+
+    with span("voice prep", "tts", voice=stem):
+        samples = _decode_mono(voice_path, VOICE_SAMPLE_RATE)
+        source_s = len(samples) / VOICE_SAMPLE_RATE
+        samples = trim_silence(samples, VOICE_SAMPLE_RATE, VOICE_SILENCE_DB, VOICE_SILENCE_PAD_MS)
+        if len(samples) == 0:
+            raise ValueError(f"TTS voice reference is silent: {voice_path}")
+        samples = _crop(samples, VOICE_SAMPLE_RATE, max_seconds)
+        samples = normalize_level(samples, VOICE_TARGET_RMS_DB, VOICE_PEAK_CEILING_DB)
+
+        os.makedirs(VOICE_CACHE_DIR, exist_ok=True)
+        with wave.open(prepared_path + ".tmp", "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(VOICE_SAMPLE_RATE)
+            w.writeframes(to_pcm_bytes(samples))
+        os.replace(prepared_path + ".tmp", prepared_path)
+
+    info = {"source_s": round(source_s, 2), "prepared_s": round(len(samples) / VOICE_SAMPLE_RATE, 2)}
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(info, f)
+    print(f"Prepared voice reference {os.path.basename(voice_path)}: {info['source_s']:.1f}s to {info['prepared_s']:.1f}s at {VOICE_SAMPLE_RATE} Hz")
+    return dict(info, path=os.path.abspath(prepared_path), cached=False)
+
+def _decode_mono(input_audio, framerate):
+    """Decode an audio file to mono float32 samples at a sample rate with ffmpeg."""
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-loglevel", "error",
+        "-i", input_audio,
+        "-ac", "1",
+        "-ar", str(framerate),
+        "-f", "f32le",
+        "pipe:1"
+    ]
+    try:
+        result = subprocess.run(ffmpeg_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg command failed: {e.stderr.decode(errors='replace')}")
+    return np.frombuffer(result.stdout, dtype="<f4").reshape(-1, 1)
+
+def _crop(samples, framerate, max_seconds):
+    """Crop samples to at most max_seconds, ending in a quiet 10 ms window near the limit."""
+    max_frames = int(framerate * max_seconds)
+    if len(samples) <= max_frames:
+        return samples
+
+    window = framerate // 100
+    search_start = max(0, max_frames - int(framerate * VOICE_CROP_SEARCH_S))
+    n_windows = (max_frames - search_start) // window
+    windows = samples[search_start:search_start + n_windows * window].reshape(n_windows, -1)
+    rms = np.sqrt(np.mean(np.square(windows), axis=1))
+
+    # The latest window that is silent, or close to the quietest, keeps the most speech
+    quiet = np.flatnonzero(rms <= max(2 * rms.min(), 10 ** (VOICE_SILENCE_DB / 20)))
+    return samples[:search_start + (quiet[-1] + 1) * window]
+
+def _load_latency():
+    """Recorded TTS latency by voice, read from LATENCY_PATH on first use. Caller must hold _latency_lock."""
+    global _latency
+    if _latency is None:
+        _latency = {}
+        if os.path.exists(LATENCY_PATH):
+            with open(LATENCY_PATH, "r", encoding="utf-8") as f:
+                _latency = json.load(f)
+    return _latency
+
+def record_chunk_latency(
+    voice_ref: str,
+    timesteps: int,
+    prepared: bool,
+    chunks: list[tuple[int, float]]
+):
+    """
+    Add TTS chunk latencies to the totals of a voice.
+
+    Args:
+        voice_ref (str): Voice reference filename.
+        timesteps (int): TTS inference timesteps.
+        prepared (bool): Whether the chunks were synthesized with the prepared reference.
+        chunks (list[tuple[int, float]]): Characters and inference time (s) of each chunk.
+    """
+    if not chunks:
+        return
+    with _latency_lock:
+        latency = _load_latency()
+        by_timesteps = latency.setdefault(voice_ref, {}).setdefault(str(int(timesteps)), {})
+        totals = by_timesteps.setdefault("prepared" if prepared else "raw", [0.0, 0, 0])
+        totals[0] += sum(seconds for _, seconds in chunks)
+        totals[1] += sum(chars for chars, _ in chunks)
+        totals[2] += len(chunks)
+
+        os.makedirs(os.path.dirname(LATENCY_PATH), exist_ok=True)
+        tmp_path = LATENCY_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(latency, f)
+        os.replace(tmp_path, LATENCY_PATH)
+
+def latency_report(
+    voice_ref: str,
+    timesteps: int
+) -> dict:
+    """
+    Compare TTS latency of a voice with raw and prepared references.
+
+    Args:
+        voice_ref (str): Voice reference filename.
+        timesteps (int): TTS inference timesteps.
+
+    Returns:
+        dict: "raw_s_per_100_chars" and "prepared_s_per_100_chars" (None when no
+            chunks were recorded) and "change_pct" (None unless both are known).
+    """
+    with _latency_lock:
+        totals = dict(_load_latency().get(voice_ref, {}).get(str(int(timesteps)), {}))
+
+    def per_100_chars(variant):
+        seconds, chars, _ = totals.get(variant, (0.0, 0, 0))
+        return round(100 * seconds / chars, 3) if chars else None
+
+    raw, prepared = per_100_chars("raw"), per_100_chars("prepared")
+    change = round(100 * (prepared - raw) / raw, 1) if raw and prepared is not None else None
+    return {"raw_s_per_100_chars": raw, "prepared_s_per_100_chars": prepared, "change_pct": change}